@@ -1,48 +1,104 @@
 ﻿from __future__ import annotations
 import numpy as np
 from .gridworld import GridWorld4x4
+from .sweeps import resolve_schedule, reverse_bfs_order, run_sweeps
+
+# "loop": in-place sweeps over env.P (dict of TR lists).
+# "vectorized": synchronous sweeps over env.compile() arrays; same fixed point.
+BACKENDS = ("loop", "vectorized")
+
+def check_backend(backend: str) -> None:
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}.")
 
 def policy_evaluation(env: GridWorld4x4,
                       pi_actions: np.ndarray,
                       gamma: float = 0.9,
                       theta: float = 1e-8,
-                      max_iter: int = 10000) -> np.ndarray:
+                      max_iter: int = 10000,
+                      backend: str = "loop",
+                      schedule: str | None = None,
+                      omega: float = 1.0,
+                      return_info: bool = False):
+    """schedule: see sweeps.SCHEDULES (default gauss-seidel for "loop", jacobi for
+    "vectorized"); return_info=True also returns the convergence trace."""
+    check_backend(backend)
+    schedule = resolve_schedule(backend, schedule)
     S = env.num_states
     V = np.zeros(S, dtype=float)
-    for _ in range(max_iter):
-        delta = 0.0
-        for s in range(S):
+    if backend == "vectorized":
+        model, rows = env.compile(), np.arange(S)
+        pi_actions = np.asarray(pi_actions, dtype=int)
+        V, info = run_sweeps(V, schedule, theta, max_iter, S, omega=omega,
+                             backup_all=lambda V: model.q_from_v(V, gamma)[rows, pi_actions])
+    else:
+        def backup_state(s, V):
             a = int(pi_actions[s])
-            v_new = sum(tr.p * (tr.r + gamma * V[tr.sp]) for tr in env.P[s][a])
-            delta = max(delta, abs(v_new - V[s]))
-            V[s] = v_new
-        if delta < theta:
-            break
-    return V
+            return sum(tr.p * (tr.r + gamma * V[tr.sp]) for tr in env.P[s][a])
+        order = reverse_bfs_order(env) if schedule == "reverse-bfs" else range(S)
+        V, info = run_sweeps(V, schedule, theta, max_iter, S, omega=omega,
+                             backup_state=backup_state, order=order)
+    return (V, info) if return_info else V
 
 def policy_evaluation_stochastic(env: GridWorld4x4,
                                  pi_probs: np.ndarray,
                                  gamma: float = 0.9,
                                  theta: float = 1e-8,
-                                 max_iter: int = 10000) -> np.ndarray:
+                                 max_iter: int = 10000,
+                                 backend: str = "loop",
+                                 schedule: str | None = None,
+                                 omega: float = 1.0,
+                                 return_info: bool = False):
+    check_backend(backend)
+    schedule = resolve_schedule(backend, schedule)
     S, A = env.num_states, env.num_actions
     V = np.zeros(S, dtype=float)
-    for _ in range(max_iter):
-        delta = 0.0
-        for s in range(S):
+    n_backups = int(np.count_nonzero(pi_probs))
+    if backend == "vectorized":
+        model = env.compile()
+        V, info = run_sweeps(V, schedule, theta, max_iter, n_backups, omega=omega,
+                             backup_all=lambda V: (pi_probs * model.q_from_v(V, gamma)).sum(axis=1))
+    else:
+        def backup_state(s, V):
             v_new = 0.0
             for a in range(A):
                 pa = pi_probs[s, a]
                 if pa == 0.0:
                     continue
                 v_new += pa * sum(tr.p * (tr.r + gamma * V[tr.sp]) for tr in env.P[s][a])
-            delta = max(delta, abs(v_new - V[s]))
-            V[s] = v_new
+            return v_new
+        order = reverse_bfs_order(env) if schedule == "reverse-bfs" else range(S)
+        V, info = run_sweeps(V, schedule, theta, max_iter, n_backups, omega=omega,
+                             backup_state=backup_state, order=order)
+    return (V, info) if return_info else V
+
+def policy_evaluation_batch(env: GridWorld4x4,
+                            pi_probs: np.ndarray,
+                            gamma=0.9,
+                            theta: float = 1e-8,
+                            max_iter: int = 10000) -> np.ndarray:
+    """Evaluate a (K,S,A) stack of policies, with a scalar or (K,) gamma, in one
+    array computation over env.compile(). Returns a (K,S) value matrix."""
+    pi_probs = np.asarray(pi_probs, dtype=float)
+    gamma = np.asarray(gamma, dtype=float)
+    K = max(pi_probs.shape[0] if pi_probs.ndim == 3 else 1, gamma.size)
+    pi_probs = np.broadcast_to(pi_probs, (K, env.num_states, env.num_actions))
+    gamma = np.broadcast_to(gamma.reshape(-1), (K,))
+    model = env.compile()
+    V = np.zeros((K, env.num_states), dtype=float)
+    for _ in range(max_iter):
+        v_new = (pi_probs * model.q_from_v(V, gamma)).sum(axis=2)
+        delta = np.max(np.abs(v_new - V))
+        V = v_new
         if delta < theta:
             break
     return V
 
-def q_from_v(env: GridWorld4x4, V: np.ndarray, gamma: float = 0.9) -> np.ndarray:
+def q_from_v(env: GridWorld4x4, V: np.ndarray, gamma: float = 0.9,
+             backend: str = "loop") -> np.ndarray:
+    check_backend(backend)
+    if backend == "vectorized":
+        return env.compile().q_from_v(np.asarray(V, dtype=float), gamma)
     S, A = env.num_states, env.num_actions
     Q = np.zeros((S, A), dtype=float)
     for s in range(S):
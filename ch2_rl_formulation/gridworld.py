@@ -5,6 +5,25 @@ from collections import namedtuple
 ACTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
 TR = namedtuple("TR", ["p", "sp", "r", "done"])  # transition record
 
+class CompiledModel(namedtuple("CompiledModel",
+                               ["offsets", "probs", "next_states", "rewards", "dones",
+                                "num_states", "num_actions"])):
+    """Flat-array form of P: the transitions of (s, a) are entries
+    offsets[s*A + a] : offsets[s*A + a + 1] of probs/next_states/rewards/dones."""
+    __slots__ = ()
+
+    def q_from_v(self, V: np.ndarray, gamma) -> np.ndarray:
+        """Q(s,a) = Σ p (r + γ V(s')) for all pairs at once, as an (S,A) array.
+        A (K,S) stack of V with a scalar or (K,) gamma gives a (K,S,A) stack."""
+        if V.ndim == 2:
+            gamma = np.asarray(gamma, dtype=float).reshape(-1, 1)
+            per_tr = self.probs * (self.rewards + gamma * V[:, self.next_states])
+            q = np.add.reduceat(per_tr, self.offsets[:-1], axis=1)
+            return q.reshape(V.shape[0], self.num_states, self.num_actions)
+        per_tr = self.probs * (self.rewards + gamma * V[self.next_states])
+        q = np.add.reduceat(per_tr, self.offsets[:-1])
+        return q.reshape(self.num_states, self.num_actions)
+
 class GridWorld4x4:
     """4x4 GridWorld with step cost on every move, including terminal entry.
 
@@ -32,6 +51,7 @@ class GridWorld4x4:
         # Transition kernel with integer state indices
         self.P = {s_idx: {a: [] for a in self.A} for s_idx in range(self.num_states)}
         self._build_P()
+        self._compiled = None
 
     # --- properties expected by tests ---
     @property
@@ -79,6 +99,28 @@ class GridWorld4x4:
                 r = self.step_reward
                 self.P[s_idx][a] = [TR(1.0, sp_idx, r, done)]
 
+    def compile(self, rebuild: bool = False) -> CompiledModel:
+        """Pack P into flat NumPy arrays once (cached); P itself is left untouched.
+
+        The cached arrays are a snapshot: the model counts as frozen once
+        compiled. After editing P, call compile(rebuild=True), or the
+        vectorized backends keep solving the old model."""
+        if self._compiled is None or rebuild:
+            S, A = self.num_states, self.num_actions
+            trs = [tr for s in range(S) for a in range(A) for tr in self.P[s][a]]
+            counts = [len(self.P[s][a]) for s in range(S) for a in range(A)]
+            if min(counts) == 0:
+                raise ValueError("every (s, a) needs at least one transition.")
+            self._compiled = CompiledModel(
+                offsets=np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+                probs=np.array([tr.p for tr in trs], dtype=float),
+                next_states=np.array([tr.sp for tr in trs], dtype=np.int64),
+                rewards=np.array([tr.r for tr in trs], dtype=float),
+                dones=np.array([tr.done for tr in trs], dtype=bool),
+                num_states=S, num_actions=A,
+            )
+        return self._compiled
+
     # Optional index-based step (used by some examples/tests)
     def step_idx(self, s_idx: int, a: int):
         trans = self.P[s_idx][a]
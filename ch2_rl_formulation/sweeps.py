@@ -0,0 +1,71 @@
+from __future__ import annotations
+import time
+from collections import deque
+import numpy as np
+
+# gauss-seidel: in place, index order | jacobi: read the previous sweep's V
+# sor: in place, V(s) += omega * (backup - V(s))
+# reverse-bfs: in place, states ordered by distance to the terminal state
+SCHEDULES = ("gauss-seidel", "jacobi", "sor", "reverse-bfs")
+VECTORIZED_SCHEDULES = ("jacobi", "sor")
+
+def resolve_schedule(backend: str, schedule: str | None,
+                     vectorized: tuple = VECTORIZED_SCHEDULES) -> str:
+    """Default schedule per backend; `vectorized` lists what the vectorized backend can run."""
+    if schedule is None:
+        return "jacobi" if backend == "vectorized" else "gauss-seidel"
+    if schedule not in SCHEDULES:
+        raise ValueError(f"schedule must be one of {SCHEDULES}, got {schedule!r}.")
+    if backend == "vectorized" and schedule not in vectorized:
+        names = ", ".join(repr(x) for x in vectorized)
+        raise ValueError(f"the vectorized backend only supports {names}.")
+    return schedule
+
+def reverse_bfs_order(env) -> list[int]:
+    """States by BFS distance from absorbing states, walking transitions backwards."""
+    m = env.compile()
+    S, A = m.num_states, m.num_actions
+    src = np.repeat(np.arange(S * A) // A, np.diff(m.offsets))
+    preds = [[] for _ in range(S)]
+    for sp, s in set(zip(m.next_states.tolist(), src.tolist())):
+        preds[sp].append(s)
+    leaves = np.bincount(src, weights=m.next_states != src, minlength=S)
+    order = [int(s) for s in np.flatnonzero(leaves == 0)]
+    seen = set(order)
+    queue = deque(order)
+    while queue:
+        for p in preds[queue.popleft()]:
+            if p not in seen:
+                seen.add(p); order.append(p); queue.append(p)
+    return order + [s for s in range(S) if s not in seen]
+
+def run_sweeps(V: np.ndarray, schedule: str, theta: float, max_iter: int,
+               backups_per_sweep: int, omega: float = 1.0,
+               backup_all=None, backup_state=None, order=None):
+    """Sweep until the max change is below theta; returns (V, trace) where trace
+    has "sweeps", "residuals", "sweep_times" and total "backups"."""
+    residuals, sweep_times = [], []
+    for _ in range(max_iter):
+        t0 = time.perf_counter()
+        if backup_all is not None:
+            v_new = backup_all(V)
+            if schedule == "sor":
+                v_new = V + omega * (v_new - V)
+            delta = np.max(np.abs(v_new - V))
+            V = v_new
+        else:
+            V_read = V.copy() if schedule == "jacobi" else V
+            delta = 0.0
+            for s in order:
+                v_new = backup_state(s, V_read)
+                if schedule == "sor":
+                    v_new = V[s] + omega * (v_new - V[s])
+                delta = max(delta, abs(v_new - V[s]))
+                V[s] = v_new
+        sweep_times.append(time.perf_counter() - t0)
+        residuals.append(float(delta))
+        if delta < theta:
+            break
+    return V, {"sweeps": len(residuals), "residuals": np.array(residuals),
+               "sweep_times": np.array(sweep_times),
+               "backups": len(residuals) * int(backups_per_sweep)}
@@ -0,0 +1,70 @@
+import numpy as np
+from ch2_rl_formulation.gridworld import GridWorld4x4, TR
+from ch2_rl_formulation.evaluation import (
+    policy_evaluation, policy_evaluation_stochastic, policy_evaluation_batch, q_from_v
+)
+from ch2_rl_formulation.value_iteration import value_iteration
+
+def test_compile_packs_every_transition():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0,3))
+    m = env.compile()
+    assert m is env.compile()  # cached
+    assert m.offsets.size == env.num_states * env.num_actions + 1
+    s, a = env.s2i[(0,2)], 0
+    k = m.offsets[s*env.num_actions + a]
+    tr = env.P[s][a][0]
+    assert (m.probs[k], m.next_states[k], m.rewards[k], m.dones[k]) == (tr.p, tr.sp, tr.r, tr.done)
+
+def test_compile_is_a_snapshot_until_rebuilt():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0,3))
+    m = env.compile()
+    s = env.s2i[(3,0)]
+    env.P[s][0] = [TR(1.0, s, -5.0, False)]
+    assert env.compile() is m and m.rewards[s*env.num_actions] == -1.0
+    m2 = env.compile(rebuild=True)
+    assert m2 is not m and m2.rewards[s*env.num_actions] == -5.0
+    assert env.compile() is m2
+
+def test_vectorized_backend_matches_loop():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0,3))
+    S, A = env.num_states, env.num_actions
+    V_loop, pi_loop = value_iteration(env, gamma=0.9, theta=1e-10)
+    V_vec, pi_vec = value_iteration(env, gamma=0.9, theta=1e-10, backend="vectorized")
+    assert np.allclose(V_loop, V_vec, atol=1e-8)
+    assert np.array_equal(pi_loop, pi_vec)
+    assert np.allclose(q_from_v(env, V_loop), q_from_v(env, V_loop, backend="vectorized"))
+
+    probs = np.full((S,A), 1.0/A)
+    assert np.allclose(policy_evaluation_stochastic(env, probs, theta=1e-10),
+                       policy_evaluation_stochastic(env, probs, theta=1e-10, backend="vectorized"),
+                       atol=1e-8)
+    assert np.allclose(policy_evaluation(env, pi_loop, theta=1e-10),
+                       policy_evaluation(env, pi_loop, theta=1e-10, backend="vectorized"),
+                       atol=1e-8)
+
+def test_policy_evaluation_batch_matches_single_solves():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0,3))
+    S, A = env.num_states, env.num_actions
+    pis = np.random.default_rng(1).dirichlet(np.ones(A), size=(4, S))
+    gammas = np.array([0.5, 0.7, 0.9, 0.95])
+    V = policy_evaluation_batch(env, pis, gamma=gammas, theta=1e-10)
+    assert V.shape == (4, S)
+    for k in range(4):
+        ref = policy_evaluation_stochastic(env, pis[k], gamma=gammas[k], theta=1e-10)
+        assert np.allclose(V[k], ref, atol=1e-7)
+
+def test_schedules_share_fixed_point_and_report_traces():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0,3))
+    V_ref, _ = value_iteration(env, gamma=0.9, theta=1e-10)
+    for backend, schedule in [("loop", "jacobi"), ("loop", "sor"), ("loop", "reverse-bfs"),
+                              ("vectorized", "sor")]:
+        V, _, info = value_iteration(env, gamma=0.9, theta=1e-10, backend=backend,
+                                     schedule=schedule, omega=0.9, return_info=True)
+        assert np.allclose(V, V_ref, atol=1e-7)
+        assert info["sweeps"] == len(info["residuals"]) == len(info["sweep_times"])
+    # a fixed policy moving right then up: reverse-BFS order settles it in one pass
+    pi = np.array([0 if env.i2s[s][1] < 3 else 3 for s in range(env.num_states)])
+    _, gs = policy_evaluation(env, pi, gamma=0.9, theta=1e-10, return_info=True)
+    _, rb = policy_evaluation(env, pi, gamma=0.9, theta=1e-10, schedule="reverse-bfs",
+                              return_info=True)
+    assert rb["sweeps"] == 2 < gs["sweeps"]
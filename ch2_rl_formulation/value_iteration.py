@@ -1,25 +1,39 @@
 ﻿from __future__ import annotations
 import numpy as np
 from .gridworld import GridWorld4x4
+from .evaluation import check_backend
+from .sweeps import resolve_schedule, reverse_bfs_order, run_sweeps
 
 def value_iteration(env: GridWorld4x4,
                     gamma: float = 0.9,
                     theta: float = 1e-8,
-                    max_iter: int = 10000):
+                    max_iter: int = 10000,
+                    backend: str = "loop",
+                    schedule: str | None = None,
+                    omega: float = 1.0,
+                    return_info: bool = False):
+    """schedule: see sweeps.SCHEDULES (default gauss-seidel for "loop", jacobi for
+    "vectorized"); return_info=True also returns the convergence trace."""
+    check_backend(backend)
+    schedule = resolve_schedule(backend, schedule)
     S, A = env.num_states, env.num_actions
     V = np.zeros(S, dtype=float)
-    for _ in range(max_iter):
-        delta = 0.0
-        for s in range(S):
-            q_sa = np.array([
-                sum(tr.p * (tr.r + gamma * V[tr.sp]) for tr in env.P[s][a])
-                for a in range(A)
-            ])
-            v_new = q_sa.max()
-            delta = max(delta, abs(v_new - V[s]))
-            V[s] = v_new
-        if delta < theta:
-            break
+    if backend == "vectorized":
+        model = env.compile()
+        V, info = run_sweeps(V, schedule, theta, max_iter, S * A, omega=omega,
+                             backup_all=lambda V: model.q_from_v(V, gamma).max(axis=1))
+        pi = model.q_from_v(V, gamma).argmax(axis=1)
+        return (V, pi, info) if return_info else (V, pi)
+
+    def backup_state(s, V):
+        q_sa = np.array([
+            sum(tr.p * (tr.r + gamma * V[tr.sp]) for tr in env.P[s][a])
+            for a in range(A)
+        ])
+        return q_sa.max()
+    order = reverse_bfs_order(env) if schedule == "reverse-bfs" else range(S)
+    V, info = run_sweeps(V, schedule, theta, max_iter, S * A, omega=omega,
+                         backup_state=backup_state, order=order)
     pi = np.zeros(S, dtype=int)
     for s in range(S):
         q_sa = np.array([
@@ -27,7 +41,7 @@ def value_iteration(env: GridWorld4x4,
             for a in range(A)
         ])
         pi[s] = int(q_sa.argmax())
-    return V, pi
+    return (V, pi, info) if return_info else (V, pi)
 
 if __name__ == "__main__":
     env = GridWorld4x4(step_reward=-1.0, goal=(0, 3))
@@ -1 +1 @@
-﻿__all__ = ["bandits", "epsilon_greedy", "ucb", "thompson", "experiments"]
+﻿__all__ = ["bandits", "epsilon_greedy", "ucb", "thompson", "linucb", "nonstationary", "agents", "batched", "streaming", "tournament", "posteriors", "experiments"]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from typing import Optional
+import numpy as np
+from .bandits import ensure_rng
+
+# Agents hold only per-arm arrays and decide without owning an environment.
+#   select()          -> one arm (int)
+#   select(n)         -> (n,) arms for n decisions made from the current state
+#   update(a, r)      -> feedback for one pull
+#   update(arms, rs)  -> feedback for many pulls, in any order
+# Updates only add counts/sums per arm, so feedback may arrive late, in
+# batches, or out of order; decisions still waiting for feedback simply do
+# not count yet.
+
+def _counts(arms, rewards, K: int):
+    arms = np.asarray(arms, dtype=np.int64)
+    r = np.asarray(rewards, dtype=float)
+    return np.bincount(arms, minlength=K), np.bincount(arms, weights=r, minlength=K)
+
+def _batch_average_update(Q: np.ndarray, N: np.ndarray, arms, rewards) -> None:
+    """Sample-average update for many pulls; for one pull it is the usual Q += (r - Q) / N."""
+    cnt, total = _counts(arms, rewards, Q.size)
+    hit = cnt > 0
+    N[hit] += cnt[hit]
+    Q[hit] += (total[hit] - cnt[hit] * Q[hit]) / N[hit]
+
+# scalar fast paths: run() calls select()/update() once per step, so these
+# avoid any per-call array work beyond what the algorithm itself needs
+_SCALAR = (int, np.integer)
+
+class EpsilonGreedyAgent:
+    __slots__ = ("K", "epsilon", "rng", "Q", "N")
+
+    def __init__(self, K: int, epsilon: float, seed: Optional[int] = None):
+        if not (0 <= float(epsilon) <= 1):
+            raise ValueError("epsilon must be in [0,1].")
+        self.K, self.epsilon, self.rng = K, epsilon, ensure_rng(seed)
+        self.Q, self.N = np.zeros(K), np.zeros(K, dtype=int)
+
+    def select(self, n: Optional[int] = None):
+        if n is None:
+            if self.rng.random() < self.epsilon:
+                return int(self.rng.integers(0, self.K))
+            return int(np.argmax(self.Q))
+        arms = np.full(n, np.argmax(self.Q), dtype=np.int64)
+        explore = self.rng.random(n) < self.epsilon
+        arms[explore] = self.rng.integers(0, self.K, int(explore.sum()))
+        return arms
+
+    def update(self, arms, rewards) -> None:
+        if isinstance(arms, _SCALAR):
+            N, Q = self.N, self.Q
+            N[arms] += 1
+            Q[arms] += (rewards - Q[arms]) / N[arms]
+        else:
+            _batch_average_update(self.Q, self.N, arms, rewards)
+
+class UCB1Agent:
+    """
+    Untried arms first (in index order), then argmax Q + c*sqrt(log(t+1)/N),
+    t = pulls observed. A running t and a pointer to the first untried arm
+    keep select() at one vectorized index computation.
+
+    select(n) spreads a batch with fantasized pulls: after each choice the
+    chosen arm's count (and t) is bumped with its reward assumed equal to
+    its current Q, so its bonus shrinks and the next choice can move on.
+    Untried arms are still taken first. Nothing is committed until update().
+    """
+    __slots__ = ("K", "c", "Q", "N", "t", "_untried")
+
+    def __init__(self, K: int, c: float):
+        if c <= 0: raise ValueError("c must be > 0.")
+        self.K, self.c = K, c
+        self.Q, self.N = np.zeros(K), np.zeros(K, dtype=int)
+        self.t, self._untried = 0, 0
+
+    def select(self, n: Optional[int] = None):
+        if n is None:
+            if self._untried < self.K:
+                return self._untried
+            return int(np.argmax(self.Q + self.c * np.sqrt(np.log(self.t + 1) / self.N)))
+        untried = np.flatnonzero(self.N == 0)
+        k = min(n, untried.size)
+        arms = np.empty(n, dtype=np.int64)
+        arms[:k] = untried[:k]
+        if k < n:
+            N = self.N.astype(float)
+            N[untried] = 1.0  # fantasized first pulls of the untried arms (at Q = 0)
+            t = self.t + untried.size
+            for i in range(k, n):
+                a = int(np.argmax(self.Q + self.c * np.sqrt(np.log(t + 1) / N)))
+                arms[i] = a
+                N[a] += 1.0; t += 1
+        return arms
+
+    def update(self, arms, rewards) -> None:
+        if isinstance(arms, _SCALAR):
+            N, Q = self.N, self.Q
+            N[arms] += 1
+            Q[arms] += (rewards - Q[arms]) / N[arms]
+            self.t += 1
+        else:
+            _batch_average_update(self.Q, self.N, arms, rewards)
+            self.t += int(np.size(arms))
+        while self._untried < self.K and self.N[self._untried] > 0:
+            self._untried += 1
+
+class ThompsonAgent:
+    """Beta-Bernoulli Thompson sampling; select(n) draws n independent posterior samples."""
+    __slots__ = ("K", "rng", "alpha", "beta")
+
+    def __init__(self, K: int, seed: Optional[int] = None, alpha0: float = 1.0, beta0: float = 1.0):
+        self.K, self.rng = K, ensure_rng(seed)
+        self.alpha, self.beta = np.full(K, float(alpha0)), np.full(K, float(beta0))
+
+    def select(self, n: Optional[int] = None):
+        if n is None:
+            return int(np.argmax(self.rng.beta(self.alpha, self.beta)))
+        return self.rng.beta(self.alpha, self.beta, size=(n, self.K)).argmax(axis=1)
+
+    def update(self, arms, rewards) -> None:
+        if isinstance(arms, _SCALAR):
+            self.alpha[arms] += rewards; self.beta[arms] += 1 - rewards
+            return
+        cnt, total = _counts(arms, rewards, self.K)
+        self.alpha += total; self.beta += cnt - total
@@ -3,31 +3,271 @@ from dataclasses import dataclass
 from typing import Iterable, Optional
 import numpy as np
 
+class _UniformBuffer:
+    """Uniforms from `rng`, drawn `size` at a time (the same stream as one rng.random() per call)."""
+    __slots__ = ("rng", "size", "block", "pos")
+
+    def __init__(self, rng: np.random.Generator, size: int):
+        self.rng, self.size = rng, size
+        self.block, self.pos = rng.random(size), 0
+
+    def next(self) -> float:
+        if self.pos == self.size:
+            self.block, self.pos = self.rng.random(self.size), 0
+        u = self.block[self.pos]; self.pos += 1
+        return u
+
+    def take(self, n: int) -> np.ndarray:
+        out, filled = np.empty(n), 0
+        while filled < n:
+            if self.pos == self.size:
+                self.block, self.pos = self.rng.random(self.size), 0
+            k = min(n - filled, self.size - self.pos)
+            out[filled:filled + k] = self.block[self.pos:self.pos + k]
+            filled += k; self.pos += k
+        return out
+
 @dataclass
 class BernoulliBandit:
+    """
+    Bernoulli arms with success probabilities p.
+
+    Uniforms are pre-drawn in blocks of `buffer` and consumed in order, so
+    step() returns the same rewards as one rng.random() per pull, faster.
+    With crn=True (common random numbers) each arm has its own uniform
+    stream spawned from `seed`, and the n-th pull of arm a always uses the
+    n-th uniform of stream a: any algorithm run with the same seed sees the
+    same outcome for the same (arm, pull count).
+    """
     p: Iterable[float]
     seed: Optional[int] = None
+    crn: bool = False
+    buffer: int = 4096
 
     def __post_init__(self):
         self.p = np.asarray(list(self.p), dtype=float)
         if np.any(self.p < 0) or np.any(self.p > 1):
             raise ValueError("All probabilities must be in [0,1].")
         self.K = int(self.p.size)
-        self._rng = np.random.default_rng(self.seed)
+        self.reset(self.seed)
 
     def step(self, arm: int) -> int:
         if not (0 <= arm < self.K):
             raise IndexError("Arm index out of range.")
-        return int(self._rng.random() < self.p[arm])
+        u = self._arm_buffer(arm).next() if self.crn else self._buf.next()
+        return int(u < self.p[arm])
+
+    def step_batch(self, arms) -> np.ndarray:
+        """Rewards for pulling `arms` in order; same outcomes as step() on each."""
+        arms = np.asarray(arms, dtype=np.int64)
+        if arms.size and (arms.min() < 0 or arms.max() >= self.K):
+            raise IndexError("Arm index out of range.")
+        if not self.crn:
+            u = self._buf.take(arms.size)
+        else:
+            u = np.empty(arms.size)
+            for a in np.unique(arms):
+                idx = np.flatnonzero(arms == a)
+                u[idx] = self._arm_buffer(int(a)).take(idx.size)
+        return (u < self.p[arms]).astype(int)
+
+    @property
+    def means(self) -> np.ndarray:
+        return self.p
 
     def reset(self, seed: Optional[int] = None):
         self._rng = np.random.default_rng(seed)
+        if self.crn:
+            self._arm_seeds = np.random.SeedSequence(seed).spawn(self.K)
+            self._arm_bufs = [None] * self.K
+        else:
+            self._buf = _UniformBuffer(self._rng, self.buffer)
+
+    def _arm_buffer(self, arm: int) -> _UniformBuffer:
+        buf = self._arm_bufs[arm]
+        if buf is None:
+            buf = self._arm_bufs[arm] = _UniformBuffer(
+                np.random.default_rng(self._arm_seeds[arm]), min(self.buffer, 256))
+        return buf
+
+@dataclass
+class DriftingBernoulliBandit:
+    """
+    Bernoulli arms whose success probabilities change over time.
+
+    drift="walk": after every pull each p[a] takes a N(0, sigma²) step,
+    reflected into [0, 1]. drift="switch": every `period` pulls all p are
+    redrawn uniformly from [0.1, 0.9]. `means` is the current p.
+    """
+    p: Iterable[float]
+    drift: str = "walk"
+    sigma: float = 0.01
+    period: int = 1000
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self.p = np.asarray(list(self.p), dtype=float)
+        if np.any(self.p < 0) or np.any(self.p > 1):
+            raise ValueError("All probabilities must be in [0,1].")
+        if self.drift not in ("walk", "switch"):
+            raise ValueError("drift must be 'walk' or 'switch'.")
+        self.K, self.t = int(self.p.size), 0
+        self._rng = np.random.default_rng(self.seed)
+
+    @property
+    def means(self) -> np.ndarray:
+        return self.p
+
+    def step(self, arm: int) -> int:
+        if not (0 <= arm < self.K):
+            raise IndexError("Arm index out of range.")
+        r = int(self._rng.random() < self.p[arm])
+        self.t += 1
+        if self.drift == "walk":
+            p = np.abs(self.p + self.sigma * self._rng.standard_normal(self.K))
+            self.p = 1.0 - np.abs(1.0 - p)
+        elif self.t % self.period == 0:
+            self.p = self._rng.uniform(0.1, 0.9, self.K)
+        return r
+
+@dataclass
+class GaussianBandit:
+    """Arms with N(mu[a], sigma²) rewards."""
+    mu: Iterable[float]
+    sigma: float = 1.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self.mu = np.asarray(list(self.mu), dtype=float)
+        if self.sigma <= 0:
+            raise ValueError("sigma must be > 0.")
+        self.K = int(self.mu.size)
+        self._rng = np.random.default_rng(self.seed)
+
+    @property
+    def means(self) -> np.ndarray:
+        return self.mu
+
+    def step(self, arm: int) -> float:
+        if not (0 <= arm < self.K):
+            raise IndexError("Arm index out of range.")
+        return float(self._rng.normal(self.mu[arm], self.sigma))
+
+    def step_batch(self, arms) -> np.ndarray:
+        return self._rng.normal(self.mu[np.asarray(arms, dtype=np.int64)], self.sigma)
+
+@dataclass
+class PoissonBandit:
+    """Arms with Poisson(rate[a]) rewards (counts: clicks, purchases, ...)."""
+    rate: Iterable[float]
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self.rate = np.asarray(list(self.rate), dtype=float)
+        if np.any(self.rate < 0):
+            raise ValueError("All rates must be >= 0.")
+        self.K = int(self.rate.size)
+        self._rng = np.random.default_rng(self.seed)
+
+    @property
+    def means(self) -> np.ndarray:
+        return self.rate
+
+    def step(self, arm: int) -> int:
+        if not (0 <= arm < self.K):
+            raise IndexError("Arm index out of range.")
+        return int(self._rng.poisson(self.rate[arm]))
+
+    def step_batch(self, arms) -> np.ndarray:
+        return self._rng.poisson(self.rate[np.asarray(arms, dtype=np.int64)])
+
+@dataclass
+class LinearBandit:
+    """
+    Linear rewards r = x·θ + N(0, noise²), with contexts drawn N(0, I/d) each round.
+
+    theta (K, d): disjoint model, arm a has its own θ_a and observe() gives
+    one context x (d,) seen by all arms.
+    theta (d,) with K: shared model, observe() gives one feature vector per
+    arm, X (K, d), and all arms share θ.
+    """
+    theta: Iterable
+    K: Optional[int] = None
+    noise: float = 0.1
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self.theta = np.asarray(self.theta, dtype=float)
+        self.shared = self.theta.ndim == 1
+        if self.shared and self.K is None:
+            raise ValueError("K is required when theta is shared (shape (d,)).")
+        if not self.shared:
+            self.K = self.theta.shape[0]
+        self.d = self.theta.shape[-1]
+        self._rng = np.random.default_rng(self.seed)
+        self.context, self._means = None, None
+
+    def observe(self) -> np.ndarray:
+        """Draw the next round's context ((K, d) if shared else (d,))."""
+        shape = (self.K, self.d) if self.shared else (self.d,)
+        self.context = self._rng.standard_normal(shape) / np.sqrt(self.d)
+        self._means = self.context @ self.theta if self.shared else self.theta @ self.context
+        return self.context
+
+    @property
+    def means(self) -> np.ndarray:
+        """Expected reward of each arm in the current round."""
+        return self._means
+
+    def step(self, arm: int) -> float:
+        if not (0 <= arm < self.K):
+            raise IndexError("Arm index out of range.")
+        return float(self._means[arm] + self.noise * self._rng.standard_normal())
 
 def regret_from_choices(true_means: np.ndarray, choices: np.ndarray, rewards: np.ndarray) -> np.ndarray:
     mu_star = float(np.max(true_means))
     t = np.arange(1, rewards.size + 1, dtype=float)
     return mu_star * t - np.cumsum(rewards)
 
+def check_checkpoints(checkpoints, steps: int) -> np.ndarray:
+    cp = np.asarray(checkpoints, dtype=np.int64)
+    if cp.size and (cp[0] < 1 or cp[-1] > steps or np.any(np.diff(cp) <= 0)):
+        raise ValueError("checkpoints must be increasing step counts in [1, steps].")
+    return cp
+
+class RegretTrace:
+    """
+    What a run records. By default the per-step choices and rewards (and
+    cum_regret from them). With `checkpoints` (increasing 1-based step
+    counts) only the running reward total is kept and cum_regret is stored
+    at those steps, so memory does not grow with the horizon.
+    """
+    def __init__(self, true_means, steps: int, checkpoints=None):
+        self.true_means = np.asarray(true_means, float)
+        self.checkpoints = None if checkpoints is None else np.asarray(checkpoints, dtype=np.int64)
+        if self.checkpoints is None:
+            self.choices, self.rewards = np.zeros(steps, int), np.zeros(steps, float)
+            return
+        cp = check_checkpoints(self.checkpoints, steps)
+        self.mu_star = float(np.max(self.true_means))
+        self.values, self.total = np.zeros(cp.size), 0.0
+        self._targets, self._i = cp.tolist() + [0], 0
+
+    def add(self, t: int, a: int, r: float):
+        if self.checkpoints is None:
+            self.choices[t], self.rewards[t] = a, r
+            return
+        self.total += r
+        if t + 1 == self._targets[self._i]:
+            self.values[self._i] = self.mu_star * (t + 1) - self.total
+            self._i += 1
+
+    def output(self) -> dict:
+        if self.checkpoints is None:
+            return {"rewards": self.rewards, "choices": self.choices,
+                    "cum_regret": regret_from_choices(self.true_means, self.choices, self.rewards)}
+        return {"checkpoints": self.checkpoints, "cum_regret": self.values}
+
 def ensure_rng(seed: Optional[int]) -> np.random.Generator:
     return np.random.default_rng(seed)
 
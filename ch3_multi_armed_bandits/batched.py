@@ -0,0 +1,86 @@
+from __future__ import annotations
+from typing import Optional, Dict, Any
+import numpy as np
+from .bandits import check_checkpoints
+
+# Batched engine: `trials` independent runs of one algorithm advance together,
+# one array operation per timestep. State (Q, N, alpha, beta) is (trials, K);
+# cum_regret comes back as (trials, T). Each batch uses two streams spawned
+# from `seed` (policy, environment), so results are reproducible but are not
+# the same draws as the per-trial run() functions. With `checkpoints`
+# (increasing 1-based step counts) cum_regret is kept only at those steps,
+# as a (trials, len(checkpoints)) array.
+
+def _streams(seed: Optional[int]):
+    policy, env = np.random.SeedSequence(seed).spawn(2)
+    return np.random.default_rng(policy), np.random.default_rng(env)
+
+class _Regret:
+    # rows are recorded timesteps, so each write is one contiguous row; returned transposed
+    def __init__(self, true_means: np.ndarray, steps: int, trials: int, checkpoints=None):
+        self.mu_star, self.total = float(true_means.max()), np.zeros(trials)
+        cp = np.arange(1, steps + 1) if checkpoints is None else check_checkpoints(checkpoints, steps)
+        self.rows = np.empty((cp.size, trials))
+        self._targets, self._i = cp.tolist() + [0], 0
+
+    def add(self, t: int, r: np.ndarray):
+        self.total += r
+        if t + 1 == self._targets[self._i]:
+            self.rows[self._i] = self.mu_star * (t + 1) - self.total
+            self._i += 1
+
+def _pull(p: np.ndarray, arms: np.ndarray, env_rng: np.random.Generator) -> np.ndarray:
+    return (env_rng.random(arms.size) < p[arms]).astype(float)
+
+def run_eps(true_means, epsilon: float, steps: int, trials: int,
+            seed: Optional[int] = None, checkpoints=None) -> Dict[str, Any]:
+    if not (0 <= float(epsilon) <= 1):
+        raise ValueError("epsilon must be in [0,1].")
+    p = np.asarray(true_means, float); K = p.size
+    rng, env_rng = _streams(seed)
+    rows = np.arange(trials)
+    Q, N = np.zeros((trials, K)), np.zeros((trials, K), int)
+    reg = _Regret(p, steps, trials, checkpoints)
+    for t in range(steps):
+        explore = rng.random(trials) < epsilon
+        a = np.where(explore, rng.integers(0, K, trials), Q.argmax(axis=1))
+        r = _pull(p, a, env_rng)
+        N[rows, a] += 1
+        Q[rows, a] += (r - Q[rows, a]) / N[rows, a]
+        reg.add(t, r)
+    return {"Q": Q, "N": N, "cum_regret": reg.rows.T}
+
+def run_ucb(true_means, c: float, steps: int, trials: int,
+            seed: Optional[int] = None, checkpoints=None) -> Dict[str, Any]:
+    if c <= 0: raise ValueError("c must be > 0.")
+    p = np.asarray(true_means, float); K = p.size
+    if steps < K: raise ValueError("steps must be >= K.")
+    _, env_rng = _streams(seed)
+    rows = np.arange(trials)
+    Q, N = np.zeros((trials, K)), np.zeros((trials, K), int)
+    reg = _Regret(p, steps, trials, checkpoints)
+    for t in range(K):
+        r = _pull(p, np.full(trials, t), env_rng)
+        Q[:, t], N[:, t] = r, 1
+        reg.add(t, r)
+    for t in range(K, steps):
+        a = (Q + c * np.sqrt(np.log(t + 1) / N)).argmax(axis=1)
+        r = _pull(p, a, env_rng)
+        N[rows, a] += 1
+        Q[rows, a] += (r - Q[rows, a]) / N[rows, a]
+        reg.add(t, r)
+    return {"Q": Q, "N": N, "cum_regret": reg.rows.T}
+
+def run_ts(true_means, steps: int, trials: int, seed: Optional[int] = None,
+           alpha0: float = 1.0, beta0: float = 1.0, checkpoints=None) -> Dict[str, Any]:
+    p = np.asarray(true_means, float); K = p.size
+    rng, env_rng = _streams(seed)
+    rows = np.arange(trials)
+    alpha, beta = np.full((trials, K), float(alpha0)), np.full((trials, K), float(beta0))
+    reg = _Regret(p, steps, trials, checkpoints)
+    for t in range(steps):
+        a = rng.beta(alpha, beta).argmax(axis=1)
+        r = _pull(p, a, env_rng)
+        alpha[rows, a] += r; beta[rows, a] += 1 - r
+        reg.add(t, r)
+    return {"alpha": alpha, "beta": beta, "cum_regret": reg.rows.T}
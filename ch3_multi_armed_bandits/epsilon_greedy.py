@@ -1,27 +1,17 @@
 ﻿from __future__ import annotations
 from typing import Optional, Dict, Any
-import numpy as np
-from .bandits import BernoulliBandit, regret_from_choices, ensure_rng
+from .bandits import BernoulliBandit, RegretTrace
+from .agents import EpsilonGreedyAgent
 
-def run(true_means, epsilon: float, steps: int, seed: Optional[int] = None) -> Dict[str, Any]:
-    if not (0 <= float(epsilon) <= 1):
-        raise ValueError("epsilon must be in [0,1].")
-    K = len(true_means)
-    env = BernoulliBandit(true_means, seed=seed)
-    rng = ensure_rng(seed)
-    Q, N = np.zeros(K), np.zeros(K, dtype=int)
-    choices, rewards = np.zeros(steps, int), np.zeros(steps, float)
+def run(true_means, epsilon: float, steps: int, seed: Optional[int] = None,
+        checkpoints=None, crn: bool = False) -> Dict[str, Any]:
+    env = BernoulliBandit(true_means, seed=seed, crn=crn)
+    agent = EpsilonGreedyAgent(len(true_means), epsilon, seed)
+    trace = RegretTrace(true_means, steps, checkpoints)
+    select, update, step, add = agent.select, agent.update, env.step, trace.add
     for t in range(steps):
-        if rng.random() < epsilon:
-            a = rng.integers(0, K)
-        else:
-            a = int(np.argmax(Q))
-        r = env.step(a)
-        N[a] += 1
-        Q[a] += (r - Q[a]) / N[a]
-        choices[t], rewards[t] = a, r
-    return {
-        "rewards": rewards, "choices": choices, "Q": Q, "N": N,
-        "cum_regret": regret_from_choices(np.asarray(true_means, float), choices, rewards),
-    }
+        a = select(); r = step(a)
+        update(a, r)
+        add(t, a, r)
+    return {"Q": agent.Q, "N": agent.N, **trace.output()}
 
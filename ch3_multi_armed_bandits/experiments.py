@@ -1,7 +1,11 @@
 ﻿import argparse, os, numpy as np, matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from .epsilon_greedy import run as run_eps
 from .ucb import run as run_ucb
 from .thompson import run as run_ts
+from . import batched as batch
+from .streaming import RunningStats, log_checkpoints
 
 def parse_args():
     p = argparse.ArgumentParser()
@@ -11,22 +15,100 @@ def parse_args():
     p.add_argument("--eps", type=float, default=0.1)
     p.add_argument("--c", type=float, default=1.0)
     p.add_argument("--seed", type=int, default=123)
+    p.add_argument("--batched", action="store_true", help="advance all trials together (batched.py)")
+    p.add_argument("--workers", type=int, default=1, help="processes for the trial loop")
+    p.add_argument("--crn", action="store_true", help="common random numbers: same outcome per (arm, pull count) for every method")
+    p.add_argument("--stream", action="store_true", help="constant-memory mean/CI at log-spaced checkpoints")
+    p.add_argument("--checkpoints", type=int, default=100, help="number of checkpoints for --stream")
     p.add_argument("--outdir", type=str, default="ch3_multi_armed_bandits/plots")
     return p.parse_args()
 
 def make_true_means(K, rng): return rng.uniform(0.1, 0.9, size=K)
 
-def run_all(true_means, T, trials, eps, c, seed):
-    rng = np.random.default_rng(seed)
+def trial_seeds(seed, trials):
+    """One independent seed per trial, from SeedSequence(seed).spawn."""
+    return [int(ss.generate_state(1)[0]) for ss in np.random.SeedSequence(seed).spawn(trials)]
+
+def _run_chunk(true_means, T, eps, c, crn, seeds):
+    total = {"eps": np.zeros(T), "ucb": np.zeros(T), "ts": np.zeros(T)}
+    for s in seeds:
+        total["eps"] += run_eps(true_means, eps, T, s, crn=crn)["cum_regret"]
+        total["ucb"] += run_ucb(true_means, c, T, s, crn=crn)["cum_regret"]
+        total["ts"]  += run_ts(true_means, T, s, crn=crn)["cum_regret"]
+    return total
+
+def run_all(true_means, T, trials, eps, c, seed, batched=False, workers=1, chunk=5, crn=False):
+    """
+    Average cumulative regret of the three methods over `trials` runs.
+    Trials are split into fixed chunks of `chunk` trials; with workers > 1
+    the chunks run on a process pool. Chunk sums are merged in chunk order,
+    so the result is bit-identical for any number of workers. crn=True
+    gives the three methods of a trial common random numbers (see
+    BernoulliBandit); it applies to the per-trial loop, not the batched engine.
+    """
+    if batched:
+        return {"eps": batch.run_eps(true_means, eps, T, trials, seed)["cum_regret"].mean(axis=0),
+                "ucb": batch.run_ucb(true_means, c, T, trials, seed)["cum_regret"].mean(axis=0),
+                "ts":  batch.run_ts(true_means, T, trials, seed)["cum_regret"].mean(axis=0)}
+    seeds = trial_seeds(seed, trials)
+    chunks = [seeds[i:i + chunk] for i in range(0, trials, chunk)]
+    args = (true_means, T, eps, c, crn)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            parts = list(ex.map(partial(_run_chunk, *args), chunks))
+    else:
+        parts = [_run_chunk(*args, ch) for ch in chunks]
     avg_regret = {"eps": np.zeros(T), "ucb": np.zeros(T), "ts": np.zeros(T)}
-    for _ in range(trials):
-        s = int(rng.integers(0, 2**31-1))
-        avg_regret["eps"] += run_eps(true_means, eps, T, s)["cum_regret"]
-        avg_regret["ucb"] += run_ucb(true_means, c, T, s)["cum_regret"]
-        avg_regret["ts"]  += run_ts(true_means, T, s)["cum_regret"]
+    for part in parts:
+        for k in avg_regret: avg_regret[k] += part[k]
     for k in avg_regret: avg_regret[k] /= trials
     return avg_regret
 
+def _stream_chunk(true_means, T, eps, c, crn, cp, seeds):
+    stats = {k: RunningStats(cp.size) for k in ("eps", "ucb", "ts")}
+    for s in seeds:
+        stats["eps"].update(run_eps(true_means, eps, T, s, checkpoints=cp, crn=crn)["cum_regret"])
+        stats["ucb"].update(run_ucb(true_means, c, T, s, checkpoints=cp, crn=crn)["cum_regret"])
+        stats["ts"].update(run_ts(true_means, T, s, checkpoints=cp, crn=crn)["cum_regret"])
+    return stats
+
+def run_all_streaming(true_means, T, trials, eps, c, seed, num_checkpoints=100,
+                      batched=False, workers=1, chunk=5, crn=False):
+    """
+    Like run_all, but no per-step arrays are kept: each run records
+    cum_regret only at log-spaced checkpoints and runs are folded into
+    RunningStats (Welford), so memory is O(trials_in_flight · checkpoints)
+    whatever T is. Returns {"t": checkpoints, "eps"/"ucb"/"ts": RunningStats}
+    (use .mean, .std, .band()).
+    """
+    cp = log_checkpoints(T, num_checkpoints)
+    if batched:
+        return {"t": cp,
+                "eps": RunningStats(cp.size).update(batch.run_eps(true_means, eps, T, trials, seed, checkpoints=cp)["cum_regret"]),
+                "ucb": RunningStats(cp.size).update(batch.run_ucb(true_means, c, T, trials, seed, checkpoints=cp)["cum_regret"]),
+                "ts":  RunningStats(cp.size).update(batch.run_ts(true_means, T, trials, seed, checkpoints=cp)["cum_regret"])}
+    seeds = trial_seeds(seed, trials)
+    chunks = [seeds[i:i + chunk] for i in range(0, trials, chunk)]
+    args = (true_means, T, eps, c, crn, cp)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            parts = list(ex.map(partial(_stream_chunk, *args), chunks))
+    else:
+        parts = [_stream_chunk(*args, ch) for ch in chunks]
+    out = {"t": cp, "eps": RunningStats(cp.size), "ucb": RunningStats(cp.size), "ts": RunningStats(cp.size)}
+    for part in parts:
+        for k in part: out[k].merge(part[k])
+    return out
+
+def plot_bands(xs, series, ylabel, title, outpath):
+    plt.figure()
+    for label, st in series:
+        lo, hi = st.band()
+        plt.plot(xs, st.mean, label=label); plt.fill_between(xs, lo, hi, alpha=0.25)
+    plt.xscale("log"); plt.xlabel("Time"); plt.ylabel(ylabel); plt.title(title); plt.legend()
+    os.makedirs(os.path.dirname(outpath), exist_ok=True)
+    plt.savefig(outpath, dpi=300); plt.close()
+
 def plot(xs, series, ylabel, title, outpath):
     plt.figure()
     for label,y in series: plt.plot(xs,y,label=label)
@@ -37,8 +119,13 @@ def plot(xs, series, ylabel, title, outpath):
 def main():
     a = parse_args()
     true_means = make_true_means(a.K, np.random.default_rng(a.seed))
+    if a.stream:
+        st = run_all_streaming(true_means,a.T,a.trials,a.eps,a.c,a.seed,a.checkpoints,a.batched,a.workers,crn=a.crn)
+        plot_bands(st["t"],[("Îµ-Greedy",st["eps"]),("UCB1",st["ucb"]),("Thompson",st["ts"])],
+                   "Cumulative Regret","Regret vs Time (95% CI)",os.path.join(a.outdir,"regret_stream.png"))
+        return
     xs = np.arange(1, a.T+1)
-    reg = run_all(true_means,a.T,a.trials,a.eps,a.c,a.seed)
+    reg = run_all(true_means,a.T,a.trials,a.eps,a.c,a.seed,a.batched,a.workers,crn=a.crn)
     plot(xs,[("Îµ-Greedy",reg["eps"]),("UCB1",reg["ucb"]),("Thompson",reg["ts"])],
          "Cumulative Regret","Regret vs Time",os.path.join(a.outdir,"regret.png"))
 if __name__=="__main__": main()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from typing import Optional, Dict, Any
+import numpy as np
+from .bandits import LinearBandit, ensure_rng
+
+class LinUCB:
+    """
+    Ridge-regression arms for linear contextual bandits (LinUCB / linear Thompson).
+
+    Keeps A⁻¹ = (λI + Σ x xᵀ)⁻¹, b = Σ r x and θ̂ = A⁻¹ b, one set per arm
+    (disjoint) or one shared set (shared=True, contexts are per-arm features).
+    Each update is a Sherman–Morrison rank-one step, O(d²):
+
+        A⁻¹ ← A⁻¹ - (A⁻¹x)(A⁻¹x)ᵀ / (1 + xᵀA⁻¹x)
+
+    and all K arms are scored with one batched product, O(K d²):
+    UCB score = x·θ̂ + alpha·sqrt(xᵀA⁻¹x). With thompson=True the score is
+    x·θ̃ for a posterior draw θ̃ ~ N(θ̂, alpha²·A⁻¹). Disjoint arms have
+    independent posteriors, so each arm's score is drawn from its marginal
+    N(x·θ̂, alpha²·xᵀA⁻¹x) directly. The shared model draws one θ̃ = θ̂ +
+    alpha·F z per round and scores every arm with it, so the arms' scores are
+    correlated as the posterior says. F is a square root of A⁻¹ (A⁻¹ = F Fᵀ)
+    kept in step with the Sherman–Morrison update, also in O(d²):
+
+        u = Fᵀx,  F ← F - β (F u) uᵀ,  β = 1 / (1 + uᵀu + sqrt(1 + uᵀu))
+    """
+    __slots__ = ("K", "d", "alpha", "shared", "thompson", "rng", "A_inv", "A_sqrt", "b", "theta")
+
+    def __init__(self, K: int, d: int, alpha: float = 1.0, lam: float = 1.0,
+                 shared: bool = False, thompson: bool = False, seed: Optional[int] = None):
+        if lam <= 0: raise ValueError("lam must be > 0.")
+        m = 1 if shared else K
+        self.K, self.d, self.alpha, self.shared, self.thompson = K, d, alpha, shared, thompson
+        self.rng = ensure_rng(seed)
+        self.A_inv = np.repeat(np.eye(d)[None] / lam, m, axis=0)
+        self.A_sqrt = np.eye(d) / np.sqrt(lam) if shared and thompson else None
+        self.b, self.theta = np.zeros((m, d)), np.zeros((m, d))
+
+    def scores(self, context: np.ndarray) -> np.ndarray:
+        if self.A_sqrt is not None:
+            z = self.rng.standard_normal(self.d)
+            return context @ (self.theta[0] + self.alpha * (self.A_sqrt @ z))
+        if self.shared:
+            X = context                                      # (K, d)
+            mean = X @ self.theta[0]
+            var = np.einsum("kd,kd->k", X @ self.A_inv[0], X)
+        else:
+            x = context                                      # (d,)
+            mean = self.theta @ x
+            var = (self.A_inv @ x) @ x
+        width = np.sqrt(np.maximum(var, 0.0))
+        if self.thompson:
+            return mean + self.alpha * width * self.rng.standard_normal(self.K)
+        return mean + self.alpha * width
+
+    def select(self, context: np.ndarray) -> int:
+        return int(np.argmax(self.scores(context)))
+
+    def update(self, arm: int, x: np.ndarray, reward: float) -> None:
+        """Feedback for pulling `arm` with feature vector x (the context, or its row of X)."""
+        m = 0 if self.shared else arm
+        A_inv = self.A_inv[m]
+        Ax = A_inv @ x
+        A_inv -= np.outer(Ax, Ax) / (1.0 + x @ Ax)
+        if self.A_sqrt is not None:
+            F = self.A_sqrt
+            u = x @ F
+            s = u @ u
+            F -= np.outer(F @ u, u) / (1.0 + s + np.sqrt(1.0 + s))
+        self.b[m] += reward * x
+        self.theta[m] = A_inv @ self.b[m]
+
+def run(env: LinearBandit, steps: int, alpha: float = 1.0, lam: float = 1.0,
+        thompson: bool = False, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    LinUCB (or linear Thompson sampling) on a LinearBandit. cum_regret is
+    the cumulative expected regret Σ_t (max_a μ_t(a) - μ_t(a_t)), since the
+    best arm changes with the context.
+    """
+    agent = LinUCB(env.K, env.d, alpha, lam, shared=env.shared, thompson=thompson, seed=seed)
+    choices, rewards, regret = np.zeros(steps, int), np.zeros(steps), np.zeros(steps)
+    for t in range(steps):
+        ctx = env.observe()
+        a = agent.select(ctx); r = env.step(a)
+        agent.update(a, ctx[a] if env.shared else ctx, r)
+        choices[t], rewards[t] = a, r
+        regret[t] = env.means.max() - env.means[a]
+    return {"rewards": rewards, "choices": choices, "theta": agent.theta,
+            "cum_regret": np.cumsum(regret)}
@@ -0,0 +1,120 @@
+from __future__ import annotations
+from typing import Optional, Dict, Any
+import numpy as np
+from .bandits import ensure_rng
+
+# Agents for drifting rewards, with the select() / update(a, r) interface of
+# agents.py. Sample averages stop adapting once N is large; these estimators
+# forget old data instead, at O(1) cost per update and fixed memory.
+
+class SlidingWindowUCB:
+    """
+    SW-UCB: statistics over the last `window` pulls only.
+
+    The pulls live in a fixed ring buffer (arm, reward) of length `window`;
+    per-arm windowed counts and sums are updated on insert and evict, so an
+    update is O(1) and memory is O(window + K) whatever the horizon.
+    Index: Q_W(a) + c*sqrt(log(min(t, window)) / N_W(a)); arms absent from
+    the window are tried first.
+    """
+    __slots__ = ("K", "c", "window", "arms", "rewards", "pos", "t", "N", "S")
+
+    def __init__(self, K: int, window: int, c: float = 0.5):
+        if window < 1: raise ValueError("window must be >= 1.")
+        if c <= 0: raise ValueError("c must be > 0.")
+        self.K, self.c, self.window = K, c, window
+        self.arms, self.rewards = np.full(window, -1, dtype=np.int64), np.zeros(window)
+        self.pos, self.t = 0, 0
+        self.N, self.S = np.zeros(K, dtype=np.int64), np.zeros(K)
+
+    def select(self) -> int:
+        missing = np.flatnonzero(self.N == 0)
+        if missing.size:
+            return int(missing[0])
+        n = min(self.t, self.window)
+        return int(np.argmax(self.S / self.N + self.c * np.sqrt(np.log(n) / self.N)))
+
+    def update(self, a: int, r: float) -> None:
+        old = self.arms[self.pos]
+        if old >= 0:
+            self.N[old] -= 1; self.S[old] -= self.rewards[self.pos]
+        self.arms[self.pos], self.rewards[self.pos] = a, r
+        self.N[a] += 1; self.S[a] += r
+        self.pos = (self.pos + 1) % self.window
+        self.t += 1
+
+class _Discounted:
+    """
+    Discounted counts N(a) = Σ_s γ^(t-s) 1[a_s = a] and sums S(a) in O(1)
+    per update: values are stored multiplied by γ^(-t) (one shared scale)
+    and rescaled in one O(K) pass when the scale grows past 1e100.
+    """
+    __slots__ = ("K", "gamma", "_n", "_s", "_scale")
+
+    def __init__(self, K: int, gamma: float):
+        if not (0 < gamma <= 1): raise ValueError("gamma must be in (0,1].")
+        self.K, self.gamma = K, gamma
+        self._n, self._s, self._scale = np.zeros(K), np.zeros(K), 1.0
+
+    def _add(self, a: int, r: float) -> None:
+        self._scale /= self.gamma
+        self._n[a] += self._scale; self._s[a] += r * self._scale
+        if self._scale > 1e100:
+            self._n /= self._scale; self._s /= self._scale; self._scale = 1.0
+
+    @property
+    def N(self) -> np.ndarray:
+        return self._n / self._scale
+
+    @property
+    def S(self) -> np.ndarray:
+        return self._s / self._scale
+
+class DiscountedUCB(_Discounted):
+    """D-UCB: index S/N + c*sqrt(log(Σ N) / N) on discounted statistics; untried arms first."""
+    __slots__ = ("c",)
+
+    def __init__(self, K: int, gamma: float = 0.998, c: float = 0.5):
+        if c <= 0: raise ValueError("c must be > 0.")
+        super().__init__(K, gamma)
+        self.c = c
+
+    def select(self) -> int:
+        N = self.N
+        missing = np.flatnonzero(self._n == 0)
+        if missing.size:
+            return int(missing[0])
+        return int(np.argmax(self.S / N + self.c * np.sqrt(np.log(max(N.sum(), 1.0)) / N)))
+
+    def update(self, a: int, r: float) -> None:
+        self._add(a, r)
+
+class DiscountedThompson(_Discounted):
+    """Beta Thompson sampling on discounted counts: Beta(alpha0 + S, beta0 + N - S)."""
+    __slots__ = ("rng", "alpha0", "beta0")
+
+    def __init__(self, K: int, gamma: float = 0.995, seed: Optional[int] = None,
+                 alpha0: float = 1.0, beta0: float = 1.0):
+        super().__init__(K, gamma)
+        self.rng, self.alpha0, self.beta0 = ensure_rng(seed), alpha0, beta0
+
+    def select(self) -> int:
+        N, S = self.N, self.S
+        return int(np.argmax(self.rng.beta(self.alpha0 + S, self.beta0 + N - S)))
+
+    def update(self, a: int, r: float) -> None:
+        self._add(a, r)
+
+def run(agent, env, steps: int) -> Dict[str, Any]:
+    """
+    Drive `agent` on `env` (e.g. DriftingBernoulliBandit). cum_regret is the
+    dynamic regret Σ_t (max_a p_t(a) - p_t(a_t)) against the best arm of each step.
+    """
+    choices, rewards, regret = np.zeros(steps, int), np.zeros(steps), np.zeros(steps)
+    for t in range(steps):
+        a = agent.select()
+        regret[t] = env.means.max() - env.means[a]
+        r = env.step(a)
+        agent.update(a, r)
+        choices[t], rewards[t] = a, r
+    return {"rewards": rewards, "choices": choices, "cum_regret": np.cumsum(regret)}
@@ -0,0 +1,78 @@
+from __future__ import annotations
+import numpy as np
+
+# Conjugate posteriors for Thompson sampling, one entry per arm in flat
+# arrays. All share one interface:
+#   sample(rng, idx=None) -> one posterior draw per arm in idx (all arms if None)
+#   update(arms, rewards)  -> scalar or array feedback (repeated arms are fine)
+#   mean(), std()          -> (K,) posterior mean / standard deviation
+# Beta and Gamma-Poisson draws go through rng.standard_gamma, one call per block.
+
+class BetaPosterior:
+    """Beta(alpha, beta) per arm, for 0/1 rewards."""
+    def __init__(self, K: int, alpha0: float = 1.0, beta0: float = 1.0):
+        self.alpha, self.beta = np.full(K, float(alpha0)), np.full(K, float(beta0))
+
+    def sample(self, rng: np.random.Generator, idx=None) -> np.ndarray:
+        a = self.alpha if idx is None else self.alpha[idx]
+        b = self.beta if idx is None else self.beta[idx]
+        x = rng.standard_gamma(a)
+        return x / (x + rng.standard_gamma(b))
+
+    def update(self, arms, rewards) -> None:
+        r = np.asarray(rewards, dtype=float)
+        np.add.at(self.alpha, arms, r)
+        np.add.at(self.beta, arms, 1.0 - r)
+
+    def mean(self) -> np.ndarray:
+        return self.alpha / (self.alpha + self.beta)
+
+    def std(self) -> np.ndarray:
+        n = self.alpha + self.beta
+        return np.sqrt(self.alpha * self.beta / (n * n * (n + 1.0)))
+
+class GaussianPosterior:
+    """Normal prior N(mu0, sd0²) on each arm's mean, known reward noise sigma."""
+    def __init__(self, K: int, mu0: float = 0.0, sd0: float = 1.0, sigma: float = 1.0):
+        self.mu0, self.prec0, self.noise_prec = mu0, 1.0 / sd0 ** 2, 1.0 / sigma ** 2
+        self.n, self.total = np.zeros(K), np.zeros(K)
+
+    def _params(self, idx=None):
+        n = self.n if idx is None else self.n[idx]
+        total = self.total if idx is None else self.total[idx]
+        prec = self.prec0 + self.noise_prec * n
+        return (self.prec0 * self.mu0 + self.noise_prec * total) / prec, 1.0 / np.sqrt(prec)
+
+    def sample(self, rng: np.random.Generator, idx=None) -> np.ndarray:
+        m, s = self._params(idx)
+        return m + s * rng.standard_normal(np.shape(m))
+
+    def update(self, arms, rewards) -> None:
+        np.add.at(self.n, arms, 1.0)
+        np.add.at(self.total, arms, np.asarray(rewards, dtype=float))
+
+    def mean(self) -> np.ndarray:
+        return self._params()[0]
+
+    def std(self) -> np.ndarray:
+        return self._params()[1]
+
+class GammaPoissonPosterior:
+    """Gamma(shape, rate) per arm on a Poisson rate."""
+    def __init__(self, K: int, shape0: float = 1.0, rate0: float = 1.0):
+        self.shape, self.rate = np.full(K, float(shape0)), np.full(K, float(rate0))
+
+    def sample(self, rng: np.random.Generator, idx=None) -> np.ndarray:
+        a = self.shape if idx is None else self.shape[idx]
+        b = self.rate if idx is None else self.rate[idx]
+        return rng.standard_gamma(a) / b
+
+    def update(self, arms, rewards) -> None:
+        np.add.at(self.shape, arms, np.asarray(rewards, dtype=float))
+        np.add.at(self.rate, arms, 1.0)
+
+    def mean(self) -> np.ndarray:
+        return self.shape / self.rate
+
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.shape) / self.rate
@@ -0,0 +1,53 @@
+from __future__ import annotations
+import numpy as np
+
+def log_checkpoints(T: int, num: int = 100) -> np.ndarray:
+    """About `num` log-spaced step counts in [1, T], always including 1 and T."""
+    return np.unique(np.geomspace(1, T, num).round().astype(np.int64))
+
+class RunningStats:
+    """
+    Mean and variance of a vector statistic (e.g. cum_regret at each
+    checkpoint) over runs, in O(size) memory: Welford updates for single
+    runs, the pairwise (Chan et al.) formula for batches and merges.
+    """
+    def __init__(self, size: int):
+        self.n = 0
+        self.mean = np.zeros(size)
+        self.M2 = np.zeros(size)
+
+    def update(self, x) -> "RunningStats":
+        """Add one run (size,) or a batch of runs (n, size)."""
+        x = np.asarray(x, float)
+        if x.ndim == 1:
+            self.n += 1
+            d = x - self.mean
+            self.mean += d / self.n
+            self.M2 += d * (x - self.mean)
+            return self
+        other = RunningStats(x.shape[1])
+        other.n, other.mean = x.shape[0], x.mean(axis=0)
+        other.M2 = ((x - other.mean) ** 2).sum(axis=0)
+        return self.merge(other)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        n = self.n + other.n
+        if other.n:
+            d = other.mean - self.mean
+            self.mean = self.mean + d * (other.n / n)
+            self.M2 = self.M2 + other.M2 + d ** 2 * (self.n * other.n / n)
+            self.n = n
+        return self
+
+    @property
+    def var(self) -> np.ndarray:
+        return self.M2 / (self.n - 1) if self.n > 1 else np.zeros_like(self.mean)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.var)
+
+    def band(self, z: float = 1.96):
+        """(lo, hi) normal-approximation confidence band for the mean."""
+        half = z * self.std / np.sqrt(max(self.n, 1))
+        return self.mean - half, self.mean + half
@@ -0,0 +1,23 @@
+import numpy as np
+from ch3_multi_armed_bandits.agents import EpsilonGreedyAgent, UCB1Agent, ThompsonAgent
+
+def test_batch_select_shapes():
+    for ag in (EpsilonGreedyAgent(4,0.3,0),UCB1Agent(4,1.0),ThompsonAgent(4,0)):
+        arms=ag.select(100); assert arms.shape==(100,) and arms.min()>=0 and arms.max()<4
+    assert list(UCB1Agent(4,1.0).select(6)[:4])==[0,1,2,3]
+
+def test_ucb_batch_is_spread_and_counters_track_updates():
+    ag=UCB1Agent(5,1.0);ag.update(np.arange(5),[1,0,1,0,1]);ag.update(2,1.0)
+    assert ag.t==6 and ag.select()==ag.select(1)[0]
+    assert np.unique(ag.select(20)).size>1
+    late=UCB1Agent(3,1.0);late.update(np.array([2,0]),[1.0,0.0]);assert late.select()==1
+
+def test_out_of_order_feedback_matches_in_order():
+    rng=np.random.default_rng(0);arms=rng.integers(0,5,200);rs=(rng.random(200)<0.4).astype(float)
+    for make in (lambda:EpsilonGreedyAgent(5,0.1,0),lambda:UCB1Agent(5,1.0),lambda:ThompsonAgent(5,0)):
+        a,b=make(),make()
+        for x,r in zip(arms,rs): a.update(int(x),r)
+        perm=rng.permutation(200)
+        b.update(arms[perm[:150]],rs[perm[:150]]); b.update(arms[perm[150:]],rs[perm[150:]])
+        for name in type(a).__slots__:
+            if isinstance(getattr(a,name),np.ndarray): assert np.allclose(getattr(a,name),getattr(b,name))
@@ -0,0 +1,21 @@
+import numpy as np
+from ch3_multi_armed_bandits.bandits import BernoulliBandit
+from ch3_multi_armed_bandits.epsilon_greedy import run as run_eps
+from ch3_multi_armed_bandits.thompson import run as run_ts
+
+def test_buffer_keeps_rng_stream():
+    p=[0.3,0.6,0.5];arms=np.random.default_rng(1).integers(0,3,50)
+    env=BernoulliBandit(p,seed=2,buffer=7);rng=np.random.default_rng(2)
+    assert [env.step(int(a)) for a in arms]==[int(rng.random()<p[a]) for a in arms]
+    a=BernoulliBandit(p,seed=2,buffer=7);b=BernoulliBandit(p,seed=2,buffer=7)
+    assert np.array_equal(a.step_batch(arms),[b.step(int(x)) for x in arms])
+
+def test_crn_same_outcome_per_arm_and_pull():
+    means=[0.6,0.5,0.4];T=300
+    x=run_eps(means,0.2,T,9,crn=True);y=run_ts(means,T,9,crn=True)
+    for a in range(3):
+        rx=x["rewards"][x["choices"]==a];ry=y["rewards"][y["choices"]==a];n=min(rx.size,ry.size)
+        assert np.array_equal(rx[:n],ry[:n])
+    env=BernoulliBandit(means,seed=9,crn=True,buffer=4)
+    arms=np.array([0,1,0,0,2,1,0,0,0]);ref=BernoulliBandit(means,seed=9,crn=True)
+    assert np.array_equal(env.step_batch(arms),[ref.step(int(a)) for a in arms])
@@ -0,0 +1,25 @@
+import numpy as np
+from ch3_multi_armed_bandits import batched
+from ch3_multi_armed_bandits.epsilon_greedy import run as run_eps
+from ch3_multi_armed_bandits.ucb import run as run_ucb
+from ch3_multi_armed_bandits.thompson import run as run_ts
+
+def test_batched_shapes_and_determinism():
+    means=[0.7,0.5,0.3];T=40;n=5
+    out=batched.run_eps(means,0.1,T,n,0)
+    assert out["cum_regret"].shape==(n,T) and out["Q"].shape==(n,3)
+    assert (out["N"].sum(axis=1)==T).all()
+    assert np.array_equal(out["cum_regret"],batched.run_eps(means,0.1,T,n,0)["cum_regret"])
+    out=batched.run_ucb(means,1.0,T,n,0)
+    assert (out["N"]>=1).all() and out["cum_regret"].shape==(n,T)
+    out=batched.run_ts(means,T,n,0)
+    assert np.allclose(out["alpha"].sum(axis=1)+out["beta"].sum(axis=1),T+6)
+
+def test_batched_matches_serial_in_distribution():
+    means=[0.8,0.5,0.2];T=300;n=200
+    for b,s in [(batched.run_eps(means,0.1,T,n,1),lambda i:run_eps(means,0.1,T,i)),
+                (batched.run_ucb(means,1.0,T,n,1),lambda i:run_ucb(means,1.0,T,i)),
+                (batched.run_ts(means,T,n,1),lambda i:run_ts(means,T,i))]:
+        serial=np.mean([s(i)["cum_regret"][-1] for i in range(n)])
+        batch=b["cum_regret"][:,-1]
+        assert abs(batch.mean()-serial)<4*batch.std()/np.sqrt(n)+1.0
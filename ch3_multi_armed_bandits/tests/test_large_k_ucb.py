@@ -0,0 +1,18 @@
+import numpy as np
+from ch3_multi_armed_bandits.tournament import TournamentTree
+from ch3_multi_armed_bandits.ucb import run as run_ucb, run_large_k
+
+def test_tournament_tree_argmax():
+    rng=np.random.default_rng(0)
+    for K in (1,2,5,33):
+        v=rng.integers(0,4,K).astype(float);tree=TournamentTree(v)
+        for _ in range(50):
+            i=int(rng.integers(K));v[i]=float(rng.integers(0,4));tree.update(i,v[i])
+            assert tree.argmax()==int(np.argmax(v))
+
+def test_large_k_exact_and_epoch_modes():
+    means=np.random.default_rng(1).uniform(0.1,0.9,20);T=800
+    exact=run_ucb(means,1.0,T,4)
+    assert np.array_equal(run_large_k(means,1.0,T,4,epoch_growth=1.0)["choices"],exact["choices"])
+    out=run_large_k(means,1.0,T,4)
+    assert out["rebuilds"]<40 and out["N"].sum()==T and (out["N"]>=1).all()
@@ -0,0 +1,25 @@
+import numpy as np
+from ch3_multi_armed_bandits.bandits import LinearBandit
+from ch3_multi_armed_bandits.linucb import LinUCB, run
+
+def test_sherman_morrison_matches_inverse():
+    rng=np.random.default_rng(0);ag=LinUCB(2,4,lam=0.5);X=rng.normal(size=(30,4));arms=rng.integers(0,2,30)
+    for a,x in zip(arms,X): ag.update(int(a),x,float(x.sum()))
+    for k in range(2):
+        Xk=X[arms==k];A=0.5*np.eye(4)+Xk.T@Xk
+        assert np.allclose(ag.A_inv[k],np.linalg.inv(A)) and np.allclose(ag.theta[k],np.linalg.solve(A,Xk.T@Xk.sum(1)))
+
+def test_linucb_learns_disjoint_and_shared():
+    rng=np.random.default_rng(1);T=1500
+    for env in (LinearBandit(rng.normal(size=(5,6)),seed=2),LinearBandit(rng.normal(size=6),K=20,seed=2)):
+        for ts in (False,True):
+            reg=run(env,T,alpha=0.5,thompson=ts,seed=3)["cum_regret"]
+            assert reg[-1]-reg[T//2]<0.5*reg[T//2]
+
+def test_shared_thompson_scores_all_arms_with_one_draw():
+    rng=np.random.default_rng(4);ag=LinUCB(8,3,alpha=0.7,shared=True,thompson=True,seed=5)
+    for _ in range(20):
+        x=rng.normal(size=3);ag.update(0,x,float(x[0]))
+    assert np.allclose(ag.A_sqrt@ag.A_sqrt.T,ag.A_inv[0])
+    X=rng.normal(size=(8,3));z=np.random.default_rng(5).standard_normal(3)
+    assert np.allclose(ag.scores(X),X@(ag.theta[0]+0.7*ag.A_sqrt@z))
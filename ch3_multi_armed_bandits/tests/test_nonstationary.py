@@ -0,0 +1,19 @@
+import numpy as np
+from ch3_multi_armed_bandits.bandits import DriftingBernoulliBandit
+from ch3_multi_armed_bandits.agents import UCB1Agent, ThompsonAgent
+from ch3_multi_armed_bandits.nonstationary import SlidingWindowUCB, DiscountedUCB, DiscountedThompson, run
+
+def test_window_and_discounted_statistics():
+    rng=np.random.default_rng(0);arms=rng.integers(0,3,100);rs=rng.random(100)
+    sw=SlidingWindowUCB(3,window=17);du=DiscountedUCB(3,gamma=0.9)
+    for a,r in zip(arms,rs): sw.update(int(a),r);du.update(int(a),r)
+    w=np.arange(100)>=83;g=0.9**np.arange(99,-1,-1)
+    for k in range(3):
+        assert sw.N[k]==np.sum(w&(arms==k)) and np.isclose(sw.S[k],rs[w&(arms==k)].sum())
+        assert np.isclose(du.N[k],g[arms==k].sum()) and np.isclose(du.S[k],(g*rs)[arms==k].sum())
+
+def test_forgetting_beats_sample_average_under_switches():
+    T=10000;make=lambda:DriftingBernoulliBandit([0.2,0.5,0.8,0.4,0.6],drift="switch",period=1000,seed=3)
+    ucb=run(UCB1Agent(5,1.0),make(),T)["cum_regret"][-1];ts=run(ThompsonAgent(5,1),make(),T)["cum_regret"][-1]
+    for ag,base in ((SlidingWindowUCB(5,window=500),ucb),(DiscountedUCB(5),ucb),(DiscountedThompson(5,seed=1),ts)):
+        assert run(ag,make(),T)["cum_regret"][-1]<base
@@ -0,0 +1,11 @@
+import numpy as np
+from ch3_multi_armed_bandits.experiments import run_all, trial_seeds
+
+def test_trial_seeds_distinct():
+    s=trial_seeds(7,20); assert len(set(s))==20 and s==trial_seeds(7,20)
+
+def test_run_all_independent_of_workers():
+    means=[0.7,0.5,0.3];T=60
+    a=run_all(means,T,7,0.1,1.0,3,workers=1,chunk=2)
+    b=run_all(means,T,7,0.1,1.0,3,workers=3,chunk=2)
+    for k in a: assert np.array_equal(a[k],b[k])
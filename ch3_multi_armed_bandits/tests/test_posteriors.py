@@ -0,0 +1,26 @@
+import numpy as np
+from ch3_multi_armed_bandits.bandits import BernoulliBandit, GaussianBandit, PoissonBandit
+from ch3_multi_armed_bandits.posteriors import BetaPosterior, GaussianPosterior, GammaPoissonPosterior
+from ch3_multi_armed_bandits.thompson import run_large_k
+
+def test_posterior_samples_match_moments():
+    rng=np.random.default_rng(0)
+    for post in (BetaPosterior(3),GaussianPosterior(3),GammaPoissonPosterior(3)):
+        post.update([0,0,1,2],[1,0,1,1])
+        x=np.array([post.sample(rng) for _ in range(20000)])
+        assert np.allclose(x.mean(0),post.mean(),atol=0.02) and np.allclose(x.std(0),post.std(),atol=0.02)
+        assert post.sample(rng,np.array([2])).shape==(1,)
+
+def test_large_k_thompson_families():
+    T=1500
+    for env,post in [(BernoulliBandit([0.2,0.8,0.4],seed=1),BetaPosterior(3)),
+                     (GaussianBandit([0.0,1.0,0.5],seed=1),GaussianPosterior(3)),
+                     (PoissonBandit([1.0,3.0,2.0],seed=1),GammaPoissonPosterior(3))]:
+        out=run_large_k(env,post,T,1,refresh=50)
+        assert np.argmax(np.bincount(out["choices"],minlength=3))==1 and out["rewards"].shape==(T,)
+
+def test_large_k_thompson_settles_arms():
+    K=200;m=np.linspace(0.05,0.6,K);post=BetaPosterior(K)
+    w=np.random.default_rng(2).binomial(400,m);post.alpha+=w;post.beta+=400-w
+    out=run_large_k(BernoulliBandit(m,seed=3),post,300,3,refresh=100)
+    assert out["active"].max()<K//4
@@ -0,0 +1,27 @@
+import numpy as np
+from ch3_multi_armed_bandits.streaming import RunningStats, log_checkpoints
+from ch3_multi_armed_bandits.ucb import run as run_ucb
+from ch3_multi_armed_bandits import batched
+from ch3_multi_armed_bandits.experiments import run_all_streaming
+
+def test_log_checkpoints():
+    cp=log_checkpoints(10**6,50); assert cp[0]==1 and cp[-1]==10**6 and (np.diff(cp)>0).all()
+
+def test_running_stats_matches_numpy():
+    x=np.random.default_rng(0).normal(size=(30,4))
+    a=RunningStats(4)
+    for row in x[:10]: a.update(row)
+    a.update(x[10:20]); a.merge(RunningStats(4).update(x[20:]))
+    assert a.n==30 and np.allclose(a.mean,x.mean(0)) and np.allclose(a.var,x.var(0,ddof=1))
+
+def test_checkpointed_run_matches_full_run():
+    means=[0.7,0.5,0.3];T=200;cp=log_checkpoints(T,20)
+    full=run_ucb(means,1.0,T,5); part=run_ucb(means,1.0,T,5,checkpoints=cp)
+    assert "rewards" not in part and np.allclose(part["cum_regret"],full["cum_regret"][cp-1])
+    b=batched.run_ts(means,T,4,1); bp=batched.run_ts(means,T,4,1,checkpoints=cp)
+    assert np.allclose(bp["cum_regret"],b["cum_regret"][:,cp-1])
+
+def test_run_all_streaming_bands():
+    st=run_all_streaming([0.7,0.5,0.3],100,6,0.1,1.0,0,num_checkpoints=10,chunk=4)
+    lo,hi=st["ts"].band()
+    assert st["ts"].n==6 and (lo<=st["ts"].mean).all() and (st["ts"].mean<=hi).all()
@@ -1,23 +1,66 @@
 ﻿from __future__ import annotations
 from typing import Optional, Dict, Any
 import numpy as np
-from .bandits import BernoulliBandit, regret_from_choices, ensure_rng
+from .bandits import BernoulliBandit, RegretTrace, ensure_rng
+from .agents import ThompsonAgent
 
 def run(true_means, steps: int, seed: Optional[int] = None,
-        alpha0: float = 1.0, beta0: float = 1.0) -> Dict[str, Any]:
-    K = len(true_means)
-    env = BernoulliBandit(true_means, seed=seed)
-    rng = ensure_rng(seed)
-    alpha, beta = np.full(K, alpha0), np.full(K, beta0)
-    choices, rewards = np.zeros(steps, int), np.zeros(steps, float)
+        alpha0: float = 1.0, beta0: float = 1.0, checkpoints=None, crn: bool = False) -> Dict[str, Any]:
+    env = BernoulliBandit(true_means, seed=seed, crn=crn)
+    agent = ThompsonAgent(len(true_means), seed, alpha0, beta0)
+    trace = RegretTrace(true_means, steps, checkpoints)
+    select, update, step, add = agent.select, agent.update, env.step, trace.add
     for t in range(steps):
-        theta = rng.beta(alpha, beta)
-        a = int(np.argmax(theta)); r = env.step(a)
-        alpha[a] += r; beta[a] += 1 - r
-        choices[t], rewards[t] = a, r
-    return {
-        "rewards": rewards, "choices": choices,
-        "alpha": alpha, "beta": beta,
-        "cum_regret": regret_from_choices(np.asarray(true_means, float), choices, rewards),
-    }
+        a = select(); r = step(a)
+        update(a, r)
+        add(t, a, r)
+    return {"alpha": agent.alpha, "beta": agent.beta, **trace.output()}
+
+
+def run_large_k(env, posterior, steps: int, seed: Optional[int] = None,
+                z: float = 3.0, refresh: int = 100, checkpoints=None) -> Dict[str, Any]:
+    """
+    Thompson sampling for large K with any posterior from posteriors.py.
+
+    Every `refresh` steps all K arms get a fresh draw (one vectorized call)
+    and the competitive set is recomputed: arms whose mean + z·std reaches
+    the best mean - z·std. In between, only competitive arms are resampled
+    each step; the other ("settled") arms keep their draw from the last
+    refresh, and only the largest of those is compared against. A settled
+    arm that still wins is pulled and joins the competitive set. Per-step
+    cost is O(#competitive) plus O(K / refresh) amortized.
 
+    This is an approximation of exact Thompson sampling: settled arms are
+    sampled once per `refresh` steps instead of every step. With refresh=1
+    every arm is resampled every step and it is the exact algorithm.
+
+    Args:
+        env: BernoulliBandit, GaussianBandit, PoissonBandit, ... (step, K, means)
+        posterior: e.g. BetaPosterior(env.K), GaussianPosterior, GammaPoissonPosterior
+    """
+    if refresh < 1: raise ValueError("refresh must be >= 1.")
+    rng = ensure_rng(seed)
+    K = env.K
+    trace = RegretTrace(env.means, steps, checkpoints)
+    active_sizes = []
+    for t in range(steps):
+        if t % refresh == 0:
+            theta = posterior.sample(rng)
+            m, s = posterior.mean(), posterior.std()
+            competitive = m + z * s >= np.max(m - z * s)
+            active = np.flatnonzero(competitive)
+            settled = np.flatnonzero(~competitive)
+            best_settled = int(settled[np.argmax(theta[settled])]) if settled.size else -1
+            active_sizes.append(active.size)
+        else:
+            theta[active] = posterior.sample(rng, active)
+        a = int(active[np.argmax(theta[active])])
+        if best_settled >= 0 and theta[best_settled] > theta[a]:
+            a = best_settled
+            active = np.append(active, a)
+            settled = settled[settled != a]
+            best_settled = int(settled[np.argmax(theta[settled])]) if settled.size else -1
+        r = env.step(a)
+        posterior.update(a, r)
+        trace.add(t, a, r)
+    return {"posterior": posterior, "active": np.array(active_sizes), **trace.output()}
@@ -0,0 +1,43 @@
+from __future__ import annotations
+import numpy as np
+
+class TournamentTree:
+    """
+    Argmax over K values with O(log K) point updates.
+
+    A complete binary tree over the leaves: every internal node holds the
+    index of the larger of its children's winners (the left one on ties,
+    like np.argmax), so the root is the argmax of all values.
+    """
+    __slots__ = ("K", "size", "values", "winner")
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        self.K = values.size
+        self.size = 1 << max(self.K - 1, 0).bit_length()
+        self.values = np.full(self.size, -np.inf)
+        self.winner = np.zeros(2 * self.size, dtype=np.int64)
+        self.rebuild(values)
+
+    def rebuild(self, values) -> None:
+        """Replace all values, O(K) in vectorized passes (one per level)."""
+        self.values[:self.K] = values
+        w = self.winner
+        w[self.size:] = np.arange(self.size)
+        lo = self.size
+        while lo > 1:
+            left, right = w[lo:2 * lo:2], w[lo + 1:2 * lo:2]
+            w[lo // 2:lo] = np.where(self.values[left] >= self.values[right], left, right)
+            lo //= 2
+
+    def update(self, i: int, value: float) -> None:
+        vals, w = self.values, self.winner
+        vals[i] = value
+        node = (i + self.size) >> 1
+        while node:
+            a, b = w[2 * node], w[2 * node + 1]
+            w[node] = a if vals[a] >= vals[b] else b
+            node >>= 1
+
+    def argmax(self) -> int:
+        return int(self.winner[1])
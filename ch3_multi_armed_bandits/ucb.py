@@ -1,24 +1,64 @@
 ﻿from __future__ import annotations
 from typing import Optional, Dict, Any
 import numpy as np
-from .bandits import BernoulliBandit, regret_from_choices, ensure_rng
+from .bandits import BernoulliBandit, RegretTrace
+from .tournament import TournamentTree
+from .agents import UCB1Agent
 
-def run(true_means, c: float, steps: int, seed: Optional[int] = None) -> Dict[str, Any]:
+def run(true_means, c: float, steps: int, seed: Optional[int] = None,
+        checkpoints=None, crn: bool = False) -> Dict[str, Any]:
+    K = len(true_means)
+    if steps < K: raise ValueError("steps must be >= K.")
+    env = BernoulliBandit(true_means, seed=seed, crn=crn)
+    agent = UCB1Agent(K, c)
+    trace = RegretTrace(true_means, steps, checkpoints)
+    arms = agent.select(K)  # each arm once
+    rewards = env.step_batch(arms); agent.update(arms, rewards)
+    for t in range(K): trace.add(t, arms[t], rewards[t])
+    select, update, step, add = agent.select, agent.update, env.step, trace.add
+    for t in range(K, steps):
+        a = select(); r = step(a)
+        update(a, r)
+        add(t, a, r)
+    return {"Q": agent.Q, "N": agent.N, **trace.output()}
+
+
+def run_large_k(true_means, c: float, steps: int, seed: Optional[int] = None,
+                epoch_growth: float = 1.1, checkpoints=None, crn: bool = False) -> Dict[str, Any]:
+    """
+    UCB1 for large K with O(log K) selection per step.
+
+    The indices Q + c*sqrt(L/N) live in a TournamentTree; a pull only
+    changes the pulled arm's leaf. The log term L is frozen per epoch:
+    epochs [t0, t1) grow geometrically (t1 = ceil(epoch_growth * t0)) and
+    use L = log(t1), the largest log(t+1) of the epoch, so every bonus is at
+    least UCB1's. At each epoch boundary all K indices are rebuilt in one
+    vectorized pass; there are O(log T / log epoch_growth) boundaries.
+
+    Regret: UCB1's bound with log T replaced by log(epoch_growth · T), i.e.
+    an extra O(sum_a c² log(epoch_growth) / Δ_a) pulls of suboptimal arms.
+    epoch_growth=1 refreshes every step and makes exactly run()'s choices.
+    """
     if c <= 0: raise ValueError("c must be > 0.")
+    if epoch_growth < 1: raise ValueError("epoch_growth must be >= 1.")
     K = len(true_means)
     if steps < K: raise ValueError("steps must be >= K.")
-    env = BernoulliBandit(true_means, seed=seed)
-    Q, N = np.zeros(K), np.zeros(K, int)
-    choices, rewards = np.zeros(steps, int), np.zeros(steps, float)
-    for a in range(K):
-        r = env.step(a); Q[a], N[a] = r, 1; choices[a], rewards[a] = a, r
+    env = BernoulliBandit(true_means, seed=seed, crn=crn)
+    trace = RegretTrace(true_means, steps, checkpoints)
+    Q = env.step_batch(np.arange(K)).astype(float)
+    N = np.ones(K, int)
+    for a in range(K): trace.add(a, a, Q[a])
+    tree, t1, L, rebuilds = None, K, 0.0, 0
     for t in range(K, steps):
-        ucb = Q + c * np.sqrt(np.log(t + 1) / N)
-        a = int(np.argmax(ucb)); r = env.step(a)
+        if t >= t1:
+            t1 = min(max(int(np.ceil(epoch_growth * t)), t + 1), steps)
+            L = np.log(t1)
+            index = Q + c * np.sqrt(L / N)
+            if tree is None: tree = TournamentTree(index)
+            else: tree.rebuild(index)
+            rebuilds += 1
+        a = tree.argmax(); r = env.step(a)
         N[a] += 1; Q[a] += (r - Q[a]) / N[a]
-        choices[t], rewards[t] = a, r
-    return {
-        "rewards": rewards, "choices": choices, "Q": Q, "N": N,
-        "cum_regret": regret_from_choices(np.asarray(true_means, float), choices, rewards),
-    }
-
+        tree.update(a, Q[a] + c * np.sqrt(L / N[a]))
+        trace.add(t, a, r)
+    return {"Q": Q, "N": N, "rebuilds": rebuilds, **trace.output()}
@@ -0,0 +1,55 @@
+# ch4_dynamic_programming/action_elimination.py
+import numpy as np
+from .sparse import as_kernel, gather_segments, _csr_matvec
+
+class ActiveActions:
+    """
+    The (s,a) rows of a kernel that are still candidates for optimality.
+
+    Surviving rows are kept as a compacted CSR sub-kernel, so a sweep only
+    touches their transitions. Bounds: if δ = ||T V - V||∞ for the V the
+    Q-values were computed from, then ||V* - V||∞ ≤ δ / (1-γ) and therefore
+    |Q*(s,a) - Q(s,a)| ≤ ε = γ δ / (1-γ). An action whose upper bound
+    Q(s,a) + ε is below the best lower bound max_b Q(s,b) - ε can never be
+    optimal and is dropped for good; the optimal actions always survive, so
+    V* is unchanged.
+    """
+    def __init__(self, P, R, gamma: float):
+        if not gamma < 1.0:
+            raise ValueError("action elimination needs gamma < 1 (the bounds scale with 1/(1-γ)).")
+        self.kernel = as_kernel(P, R)
+        self.gamma = gamma
+        S, A = self.kernel.num_states, self.kernel.num_actions
+        self.active = np.ones((S, A), dtype=bool)
+        self._r_sa = self.kernel.expected_reward().ravel()
+        self._compact()
+
+    @property
+    def count(self) -> int:
+        return int(self.active.sum())
+
+    def _compact(self):
+        K = self.kernel
+        self._rows = np.flatnonzero(self.active.ravel())
+        lens = np.diff(K.indptr)[self._rows]
+        self._indptr = np.concatenate(([0], np.cumsum(lens)))
+        self._indices = gather_segments(K.indptr, K.indices, self._rows)
+        self._probs = gather_segments(K.indptr, K.probs, self._rows)
+
+    def q(self, V: np.ndarray) -> np.ndarray:
+        """Q(s,a) = r(s,a) + γ Σ P V for surviving rows; -inf for dropped actions."""
+        Q = np.full(self.active.shape, -np.inf)
+        Q.ravel()[self._rows] = (self._r_sa[self._rows]
+                                 + self.gamma * _csr_matvec(self._indptr, self._indices,
+                                                            self._probs, V))
+        return Q
+
+    def eliminate(self, Q: np.ndarray, delta: float) -> int:
+        """Drop actions dominated under the bounds implied by residual delta; returns the number dropped."""
+        eps = self.gamma * delta / (1.0 - self.gamma)
+        dropped = self.active & (Q + eps < Q.max(axis=1, keepdims=True) - eps)
+        n = int(dropped.sum())
+        if n:
+            self.active &= ~dropped
+            self._compact()
+        return n
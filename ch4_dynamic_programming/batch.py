@@ -0,0 +1,93 @@
+# ch4_dynamic_programming/batch.py
+import numpy as np
+from .sparse import SparseKernel
+
+def _batch_setup(env, gammas, rewards, terminals, K=None):
+    """
+    Broadcast the per-configuration inputs to a common batch size K.
+    Returns (K, gammas (K,), r_sa (K,S,A), terminals (K,S) bool or None).
+    """
+    S, A = len(env.S), len(env.A)
+    if rewards is not None:
+        rewards = np.asarray(rewards, dtype=float)
+        if isinstance(env.P, SparseKernel):
+            r_sa = env.P.expected_reward(rewards.reshape(rewards.shape[0], -1))
+        else:
+            r_sa = (env.P[None] * rewards).sum(axis=3)
+    elif isinstance(env.P, SparseKernel):
+        r_sa = env.P.expected_reward()[None]
+    else:
+        r_sa = (env.P * env.R).sum(axis=2)[None]
+    gammas = np.atleast_1d(np.asarray(env.gamma if gammas is None else gammas, dtype=float))
+    if terminals is not None:
+        terminals = np.atleast_2d(np.asarray(terminals, dtype=bool))
+
+    sizes = {K, gammas.size, r_sa.shape[0], None if terminals is None else terminals.shape[0]}
+    sizes -= {None, 1}
+    if len(sizes) > 1:
+        raise ValueError(f"inconsistent batch sizes {sorted(sizes)}.")
+    K = sizes.pop() if sizes else 1
+    gammas = np.broadcast_to(gammas, (K,))
+    r_sa = np.broadcast_to(r_sa, (K, S, A))
+    if terminals is not None:
+        terminals = np.broadcast_to(terminals, (K, S))
+    return K, gammas, r_sa, terminals
+
+def _batch_q(env, V: np.ndarray, gammas: np.ndarray, r_sa: np.ndarray) -> np.ndarray:
+    """Q[k] = r_sa[k] + γ_k P V[k] for all k at once; V is (K,S), result (K,S,A)."""
+    PV = env.P @ V.T                      # (S,A,K): one shared pass over P
+    return r_sa + gammas[:, None, None] * np.moveaxis(PV, -1, 0)
+
+def policy_evaluation_batch(env, pis: np.ndarray, gammas=None, rewards=None, terminals=None,
+                            theta: float = 1e-8, max_iter: int = 10000) -> np.ndarray:
+    """
+    Evaluate many configurations on the same transition model at once.
+
+    Args:
+        env: provides P (dense or SparseKernel), R, gamma, S, A
+        pis: (K,S,A) stack of policies, or a single (S,A) policy
+        gammas: optional (K,) discounts (default env.gamma)
+        rewards: optional stack of reward tables in env's format:
+                 (K,S,A,S) for a dense P, (K,nnz) for a SparseKernel
+        terminals: optional (K,S) masks of extra absorbing zero-value states,
+                   e.g. to sweep goal locations without rebuilding P (states
+                   already absorbing in env.P stay absorbing)
+    Returns:
+        V: (K,S) value matrix, one row per configuration
+    """
+    pis = np.asarray(pis, dtype=float)
+    pis = pis[None] if pis.ndim == 2 else pis
+    K, gammas, r_sa, terminals = _batch_setup(env, gammas, rewards, terminals,
+                                              K=pis.shape[0] if pis.shape[0] > 1 else None)
+    pis = np.broadcast_to(pis, (K,) + pis.shape[1:])
+    V = np.zeros((K, len(env.S)), dtype=float)
+    for _ in range(max_iter):
+        v_new = (pis * _batch_q(env, V, gammas, r_sa)).sum(axis=2)
+        if terminals is not None:
+            v_new[terminals] = 0.0
+        delta = np.max(np.abs(v_new - V))
+        V = v_new
+        if delta < theta:
+            break
+    return V
+
+def value_iteration_batch(env, gammas=None, rewards=None, terminals=None,
+                          theta: float = 1e-8, max_iter: int = 10000):
+    """
+    Value iteration for K configurations (discounts, reward tables, terminal
+    sets; see policy_evaluation_batch) sharing one transition model.
+    Returns:
+        V: (K,S), pi: (K,S,A) deterministic greedy policies (one-hot)
+    """
+    K, gammas, r_sa, terminals = _batch_setup(env, gammas, rewards, terminals)
+    V = np.zeros((K, len(env.S)), dtype=float)
+    for _ in range(max_iter):
+        v_new = _batch_q(env, V, gammas, r_sa).max(axis=2)
+        if terminals is not None:
+            v_new[terminals] = 0.0
+        delta = np.max(np.abs(v_new - V))
+        V = v_new
+        if delta < theta:
+            break
+    pi = np.eye(len(env.A))[_batch_q(env, V, gammas, r_sa).argmax(axis=2)]
+    return V, pi
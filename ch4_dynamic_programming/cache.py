@@ -0,0 +1,115 @@
+# ch4_dynamic_programming/cache.py
+import hashlib
+import inspect
+from collections import OrderedDict
+import numpy as np
+from .sparse import SparseKernel
+from .utils import q_from_v
+from .value_iteration import value_iteration
+from .policy_iteration import policy_iteration
+
+SOLVERS = {"value_iteration": value_iteration, "policy_iteration": policy_iteration}
+
+def solver_options(solver: str, theta: float = 1e-8, **kwargs) -> tuple:
+    """
+    The solver's keyword arguments with defaults filled in, as a sorted
+    tuple, so solve(env) and solve(env, max_iter=10000) share a key. V0 is
+    left out: a warm start changes the path, not the answer within theta.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"solver must be one of {tuple(SOLVERS)}, got {solver!r}.")
+    bound = inspect.signature(SOLVERS[solver]).bind(None, theta=theta, **kwargs)
+    bound.apply_defaults()
+    params = dict(bound.arguments)
+    del params["env"], params["V0"]
+    return (solver,) + tuple(sorted(params.items()))
+
+def fingerprint(env, theta: float, solver: str = "value_iteration", **kwargs) -> str:
+    """
+    Hash of (P, R, gamma) and the solve options (solver, theta and its
+    canonical kwargs); equal fingerprints mean an identical solve.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(env.P, SparseKernel):
+        K = env.P
+        arrays = (K.indptr, K.indices, K.probs, K.rewards)
+    else:
+        arrays = (env.P, env.R)
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        h.update(str((arr.dtype.str, arr.shape)).encode())
+        h.update(arr.data)
+    h.update(np.array([env.gamma], dtype=float).tobytes())
+    h.update(repr(solver_options(solver, theta, **kwargs)).encode())
+    return h.hexdigest()
+
+class SolveCache:
+    """
+    Bounded LRU cache of DP solutions with warm starts.
+
+    - Exact hit (same fingerprint): the memoized (V, π) is returned.
+    - Near miss: the solver is seeded with the cached V that has the smallest
+      Bellman residual ||T V - V||∞ under the new model (and its gamma). Only
+      the `candidates` most recently used entries with the same (S, A) shape
+      are scored (one backup each), so a miss costs O(candidates) backups
+      however large the cache. For parameter sweeps (step_reward, slip,
+      gamma) the previous, nearby configuration is among them. A V0 passed
+      by the caller is kept and no seed is looked up.
+    - At most `maxsize` entries are kept; the least recently used is evicted.
+    """
+    def __init__(self, maxsize: int = 32, candidates: int = 4):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1.")
+        if candidates < 0:
+            raise ValueError("candidates must be >= 0.")
+        self.maxsize, self.candidates = int(maxsize), int(candidates)
+        self._entries = OrderedDict()  # key -> (shape, V, pi)
+        self.hits = self.warm_starts = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _nearest(self, env, shape):
+        best, best_res, scored = None, np.inf, 0
+        for key, (sh, V, _) in reversed(self._entries.items()):
+            if scored == self.candidates:
+                break
+            if sh != shape:
+                continue
+            scored += 1
+            res = np.max(np.abs(q_from_v(env.P, env.R, env.gamma, V).max(axis=1) - V))
+            if res < best_res:
+                best, best_res = key, res
+        return best
+
+    def solve(self, env, solver: str = "value_iteration", theta: float = 1e-8, **kwargs):
+        """
+        Solve env with the named ch4 solver, reusing cached work when possible.
+        Extra kwargs (backend, max_iter, ...) are passed to the solver and
+        are part of the cache key; return_info is not supported.
+        Returns:
+            V: (S,), pi: (S,A) (copies; the cache keeps its own)
+        """
+        if kwargs.get("return_info"):
+            raise ValueError("SolveCache.solve does not support return_info.")
+        key = fingerprint(env, theta, solver, **kwargs)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            _, V, pi = self._entries[key]
+            return V.copy(), pi.copy()
+
+        shape = (len(env.S), len(env.A))
+        seed = None if kwargs.get("V0") is not None else self._nearest(env, shape)
+        if seed is not None:
+            self._entries.move_to_end(seed)
+            kwargs["V0"] = self._entries[seed][1]
+            self.warm_starts += 1
+        else:
+            self.misses += 1
+        V, pi = SOLVERS[solver](env, theta=theta, **kwargs)
+
+        self._entries[key] = (shape, V.copy(), pi.copy())
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return V, pi
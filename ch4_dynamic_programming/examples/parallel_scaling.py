@@ -0,0 +1,18 @@
+# ch4_dynamic_programming/examples/parallel_scaling.py
+import argparse
+from ch4_dynamic_programming.gridworld import GridWorld
+from ch4_dynamic_programming.parallel import scaling_benchmark
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Shared-memory value iteration scaling.")
+    ap.add_argument("--size", type=int, default=300, help="grid side length")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    ap.add_argument("--gamma", type=float, default=0.99)
+    ap.add_argument("--slip", type=float, default=0.1)
+    args = ap.parse_args()
+
+    env = GridWorld((args.size, args.size), gamma=args.gamma, slip=args.slip)
+    print(f"{env.num_states} states")
+    print(f"{'workers':>8} {'seconds':>9} {'sweeps':>7} {'speedup':>8}")
+    for row in scaling_benchmark(env, workers=args.workers):
+        print(f"{row['workers']:>8} {row['seconds']:>9.3f} {row['sweeps']:>7} {row['speedup']:>8.2f}")
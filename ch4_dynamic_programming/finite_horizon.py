@@ -0,0 +1,57 @@
+# ch4_dynamic_programming/finite_horizon.py
+import numpy as np
+from .utils import expected_reward
+
+def backward_induction(env, horizon: int, gamma=None, terminal_values=None,
+                       policy_file=None, callback=None):
+    """
+    Finite-horizon DP: V_H = terminal values, and for t = H-1, ..., 0
+
+        Q_t(s,a) = r(s,a) + γ Σ_s' P(s,a,s') V_{t+1}(s'),   V_t = max_a Q_t,   π_t = argmax_a Q_t
+
+    Only two value layers are kept. The time-dependent greedy policy goes to:
+      - policy_file: an (H,S) .npy file of action indices, memory-mapped and
+                     written one row per step (row t is π_t);
+      - callback(t, actions, V_t): called for t = H-1 down to 0 with the
+                     (S,) greedy actions; nothing is stored (V_t is a work
+                     buffer, copy it to keep it);
+      - otherwise an in-memory (H,S) array (fine for small problems).
+
+    Args:
+        env: provides P (dense or SparseKernel), R, gamma, S, A
+        gamma: discount (default env.gamma; 1.0 is fine for a finite horizon)
+        terminal_values: (S,) V_H (default zeros)
+    Returns:
+        V0: (S,) optimal H-step values,
+        policy: (H,S) array, the memmap, or None when streamed to a callback
+    """
+    if horizon < 0:
+        raise ValueError("horizon must be >= 0.")
+    S, A = len(env.S), len(env.A)
+    gamma = env.gamma if gamma is None else gamma
+    r_sa = expected_reward(env.P, env.R)
+    dtype = np.min_scalar_type(max(A - 1, 0))
+
+    if callback is not None:
+        policy = None
+    elif policy_file is not None:
+        policy = np.lib.format.open_memmap(policy_file, mode="w+", dtype=dtype,
+                                           shape=(horizon, S))
+    else:
+        policy = np.empty((horizon, S), dtype=dtype)
+
+    V_next = np.zeros(S) if terminal_values is None else np.array(terminal_values, dtype=float)
+    V = np.empty(S)
+    for t in range(horizon - 1, -1, -1):
+        Q = r_sa + gamma * (env.P @ V_next)
+        actions = Q.argmax(axis=1)
+        V[:] = Q[np.arange(S), actions]
+        if callback is not None:
+            callback(t, actions, V)
+        else:
+            policy[t] = actions
+        V, V_next = V_next, V  # V_next now holds V_t
+
+    if isinstance(policy, np.memmap):
+        policy.flush()
+    return V_next.copy(), policy
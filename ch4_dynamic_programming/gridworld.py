@@ -1,5 +1,6 @@
 ﻿# ch4_dynamic_programming/gridworld.py
 import numpy as np
+from .sparse import SparseKernel
 
 ACTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # R, L, D, U (deterministic)
 
@@ -8,8 +9,11 @@ class GridWorld4x4:
     4x4 deterministic GridWorld with a single terminal 'goal' state.
     Rewards are -1 per step and 0 upon entering/being in the goal.
     Transition model is encoded as tabular P[s,a,s'] and R[s,a,s'].
+    With sparse=True, P is a SparseKernel (successor lists per (s,a), rewards
+    included) and R is None; the ch4 solvers accept either form.
     """
-    def __init__(self, step_reward: float = -1.0, goal=(0, 3), gamma: float = 1.0):
+    def __init__(self, step_reward: float = -1.0, goal=(0, 3), gamma: float = 1.0,
+                 sparse: bool = False):
         self.n = 4
         self.goal = tuple(goal)
         self.step_reward = float(step_reward)
@@ -22,7 +26,10 @@ class GridWorld4x4:
         self.A = list(range(len(ACTIONS)))  # 4 actions
 
         # Build P and R
-        self.P, self.R = self._build_PR()
+        if sparse:
+            self.P, self.R = self._build_kernel(), None
+        else:
+            self.P, self.R = self._build_PR()
 
     # -------- helpers --------
     def _in_bounds(self, i, j):
@@ -55,6 +62,25 @@ class GridWorld4x4:
                 # R already has step_reward by default.
         return P, R
 
+    def _build_kernel(self):
+        """Same model as _build_PR, stored as one successor per (s,a)."""
+        S, A = len(self.S), len(self.A)
+        g_idx = self.s2i[self.goal]
+        indices = np.zeros(S * A, dtype=np.int64)
+        rewards = np.full(S * A, self.step_reward, dtype=float)
+        for s_idx, (i, j) in enumerate(self.S):
+            for a_idx, (di, dj) in enumerate(ACTIONS):
+                k = s_idx * A + a_idx
+                if s_idx == g_idx:
+                    indices[k], rewards[k] = s_idx, 0.0
+                    continue
+                ni, nj = i + di, j + dj
+                if not self._in_bounds(ni, nj):
+                    ni, nj = i, j
+                indices[k] = self.s2i[(ni, nj)]
+        indptr = np.arange(S * A + 1, dtype=np.int64)
+        return SparseKernel(indptr, indices, np.ones(S * A), rewards, S, A)
+
     # --- public API used by ch5 (MC) ---
 
     def is_terminal(self, s):
@@ -67,7 +93,207 @@ class GridWorld4x4:
     def step(self, s, a):
         """Take action a in state s (tuple or index). Returns (next_state_tuple, reward)."""
         s_idx = self.s2i[s] if isinstance(s, tuple) else int(s)
+        if isinstance(self.P, SparseKernel):
+            idx, probs, rewards = self.P.row(s_idx, a)
+            k = int(np.argmax(probs))  # deterministic env
+            return self.i2s[int(idx[k])], float(rewards[k])
         probs = self.P[s_idx, a]
         sp_idx = int(np.argmax(probs))  # deterministic env
         r = float(self.R[s_idx, a, sp_idx])
         return self.i2s[sp_idx], r
+
+
+# Directions that a slip can deflect each action into (the two perpendicular moves)
+_SLIP_DIRS = [(2, 3), (2, 3), (0, 1), (0, 1)]
+
+class _Cells:
+    """Row-major, read-only view of the cells (i, j) of an N×M grid (not materialized)."""
+    def __init__(self, n_rows: int, n_cols: int):
+        self.n_rows, self.n_cols = n_rows, n_cols
+
+    def __len__(self):
+        return self.n_rows * self.n_cols
+
+    def __getitem__(self, k):
+        k = int(k)
+        if not (-len(self) <= k < len(self)):
+            raise IndexError("state index out of range")
+        return divmod(k % len(self), self.n_cols)
+
+    def __iter__(self):
+        return (divmod(k, self.n_cols) for k in range(len(self)))
+
+class _CellIndex:
+    """Maps a cell (i, j) to its row-major state index i*M + j."""
+    def __init__(self, n_rows: int, n_cols: int):
+        self.n_rows, self.n_cols = n_rows, n_cols
+
+    def __getitem__(self, cell):
+        i, j = cell
+        if not (0 <= i < self.n_rows and 0 <= j < self.n_cols):
+            raise KeyError(cell)
+        return i * self.n_cols + j
+
+    def __contains__(self, cell):
+        i, j = cell
+        return 0 <= i < self.n_rows and 0 <= j < self.n_cols
+
+class GridWorld:
+    """
+    Parametric N×M GridWorld generator for scale tests.
+
+    - States are all cells in row-major order (s = i*M + j); wall cells are kept
+      as unreachable absorbing states so indices stay aligned with the grid.
+    - Actions are ACTIONS (R, L, D, U). With probability `slip` the move is
+      deflected to one of the two perpendicular directions (slip/2 each).
+      Moves off the grid or into a wall leave the agent in place.
+    - Every move costs `step_reward`; entering terminal cell c additionally
+      pays terminals[c]. Terminals are absorbing with reward 0.
+    - The model is a SparseKernel with the same number of successors per (s,a),
+      built with vectorized index arithmetic. sparse=False also builds dense
+      P, R (only sensible for small grids).
+    """
+    def __init__(self, shape=(4, 4), terminals=None, walls=(), step_reward: float = -1.0,
+                 slip: float = 0.0, gamma: float = 1.0, sparse: bool = True):
+        self.n_rows, self.n_cols = (int(x) for x in shape)
+        if not (0.0 <= slip <= 1.0):
+            raise ValueError("slip must be in [0,1].")
+        if terminals is None:
+            terminals = {(0, self.n_cols - 1): 0.0}
+        elif not isinstance(terminals, dict):
+            terminals = {tuple(c): 0.0 for c in terminals}
+        self.terminals = {tuple(c): float(r) for c, r in terminals.items()}
+        if not self.terminals:
+            raise ValueError("at least one terminal cell is required.")
+        self.goal = next(iter(self.terminals))
+        self.step_reward = float(step_reward)
+        self.slip = float(slip)
+        self.gamma = float(gamma)
+
+        self.walls = np.zeros((self.n_rows, self.n_cols), dtype=bool)
+        walls = np.asarray(walls)
+        if walls.dtype == bool and walls.shape == self.walls.shape:
+            self.walls[:] = walls
+        elif walls.size:
+            self.walls[tuple(walls.reshape(-1, 2).T)] = True
+        if any(self.walls[c] for c in self.terminals):
+            raise ValueError("a cell cannot be both a wall and a terminal.")
+
+        self.S = _Cells(self.n_rows, self.n_cols)
+        self.i2s = self.S
+        self.s2i = _CellIndex(self.n_rows, self.n_cols)
+        self.A = list(range(len(ACTIONS)))
+
+        self.kernel = self._build_kernel()
+        if sparse:
+            self.P, self.R = self.kernel, None
+        else:
+            self.P, self.R = self.kernel.to_dense()
+
+    @property
+    def num_states(self) -> int:
+        return self.n_rows * self.n_cols
+
+    def _rows(self, s: np.ndarray):
+        """Successors (n,A,k), probabilities (k,) and rewards (n,A,k) of the states s."""
+        N, M, A = self.n_rows, self.n_cols, len(ACTIONS)
+        i, j = np.divmod(s, M)
+        d = np.asarray(ACTIONS)
+
+        # target[s, dir]: where moving in direction dir from s ends up
+        ni, nj = i[:, None] + d[None, :, 0], j[:, None] + d[None, :, 1]
+        inside = (ni >= 0) & (ni < N) & (nj >= 0) & (nj < M)
+        target = np.where(inside, ni * M + nj, s[:, None])
+        flat_walls = self.walls.reshape(-1)
+        target = np.where(flat_walls[target], s[:, None], target)
+
+        if self.slip > 0.0:
+            dirs = np.array([(a,) + _SLIP_DIRS[a] for a in range(A)])  # (A, 3)
+            probs = np.array([1.0 - self.slip, self.slip / 2, self.slip / 2])
+        else:
+            dirs = np.arange(A)[:, None]                                 # (A, 1)
+            probs = np.array([1.0])
+        succ = target[:, dirs]                                           # (n, A, k)
+
+        term_idx = np.array([self.s2i[c] for c in self.terminals], dtype=np.int64)
+        bonus = np.array([self.terminals[c] for c in self.terminals], dtype=float)
+        order = np.argsort(term_idx)
+        term_idx, bonus = term_idx[order], bonus[order]
+        at = np.minimum(np.searchsorted(term_idx, succ), term_idx.size - 1)
+        rewards = self.step_reward + np.where(term_idx[at] == succ, bonus[at], 0.0)
+
+        # terminals and walls: absorbing self-loops with zero reward
+        absorbing = flat_walls[s] | np.isin(s, term_idx)
+        succ[absorbing] = s[absorbing, None, None]
+        rewards[absorbing] = 0.0
+        return succ, probs, rewards
+
+    def _build_kernel(self) -> SparseKernel:
+        S, A = self.num_states, len(ACTIONS)
+        succ, probs, rewards = self._rows(np.arange(S, dtype=np.int64))
+        k = probs.size
+        indptr = np.arange(0, S * A * k + 1, k, dtype=np.int64)
+        return SparseKernel(indptr, succ.reshape(-1), np.tile(probs, S * A),
+                            rewards.reshape(-1), S, A)
+
+    # -------- local edits --------
+    def neighbors(self, s: int) -> np.ndarray:
+        """s and its in-grid 4-neighbours: a superset of the states that can move into s."""
+        i, j = divmod(int(s), self.n_cols)
+        cells = [(i, j)] + [(i + di, j + dj) for di, dj in ACTIONS]
+        return np.array([self.s2i[c] for c in cells if c in self.s2i], dtype=np.int64)
+
+    def _rebuild(self, cell) -> np.ndarray:
+        """Recompute the kernel rows around cell after an edit; returns the changed states."""
+        states = self.neighbors(self.s2i[tuple(cell)])
+        succ, probs, rewards = self._rows(states)
+        self.kernel.set_rows(states, succ, np.broadcast_to(probs, succ.shape), rewards)
+        if self.P is not self.kernel:  # dense copy (sparse=False)
+            self.P[states] = 0.0
+            self.R[states] = 0.0
+            n, A, k = succ.shape
+            si = np.broadcast_to(np.arange(n)[:, None, None], succ.shape)
+            ai = np.broadcast_to(np.arange(A)[None, :, None], succ.shape)
+            P, R = self.P[states], self.R[states]
+            np.add.at(P, (si, ai, succ), np.broadcast_to(probs, succ.shape))
+            R[si, ai, succ] = rewards
+            self.P[states], self.R[states] = P, R
+        return states
+
+    def set_wall(self, cell, wall: bool = True) -> np.ndarray:
+        """Add (or remove) a wall at cell in place. Returns the states whose rows changed."""
+        cell = tuple(cell)
+        if wall and cell in self.terminals:
+            raise ValueError("a cell cannot be both a wall and a terminal.")
+        self.walls[cell] = bool(wall)
+        return self._rebuild(cell)
+
+    def set_terminal(self, cell, reward=0.0) -> np.ndarray:
+        """
+        Make cell terminal with the given entry reward, or a normal cell with
+        reward=None. Returns the states whose rows changed.
+        """
+        cell = tuple(cell)
+        if reward is None:
+            if self.terminals.keys() == {cell}:
+                raise ValueError("at least one terminal cell is required.")
+            self.terminals.pop(cell, None)
+        else:
+            if self.walls[cell]:
+                raise ValueError("a cell cannot be both a wall and a terminal.")
+            self.terminals[cell] = float(reward)
+        self.goal = next(iter(self.terminals))
+        return self._rebuild(cell)
+
+    def is_terminal(self, s):
+        """Return True iff s (tuple or index) is a terminal cell."""
+        cell = s if isinstance(s, tuple) else self.i2s[int(s)]
+        return tuple(cell) in self.terminals
+
+    def step(self, s, a, rng=None):
+        """Sample a move from s (tuple or index). Returns (next_state_tuple, reward)."""
+        s_idx = self.s2i[s] if isinstance(s, tuple) else int(s)
+        idx, probs, rewards = self.kernel.row(s_idx, a)
+        rng = np.random.default_rng() if rng is None else rng
+        k = int(rng.choice(idx.size, p=probs))
+        return self.i2s[int(idx[k])], float(rewards[k])
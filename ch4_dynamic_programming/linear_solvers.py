@@ -0,0 +1,84 @@
+# ch4_dynamic_programming/linear_solvers.py
+import time
+import numpy as np
+from .sparse import CSRMatrix
+
+SOLVERS = ("dense", "bicgstab")
+
+def bicgstab(matvec, b: np.ndarray, tol: float = 1e-10, max_iter: int = 10000, x0=None):
+    """
+    BiCGSTAB for a nonsymmetric system A x = b given only x -> A x.
+    Stops when the max-norm residual drops below tol.
+    Returns:
+        x: solution, iters: number of iterations used
+    """
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    r = b - matvec(x)
+    if np.max(np.abs(r)) < tol:
+        return x, 0
+    r_hat = r.copy()
+    rho = alpha = omega = 1.0
+    v = np.zeros_like(b)
+    p = np.zeros_like(b)
+    for k in range(1, max_iter + 1):
+        rho_new = r_hat @ r
+        if rho_new == 0.0:
+            raise np.linalg.LinAlgError("BiCGSTAB breakdown (rho = 0).")
+        beta = (rho_new / rho) * (alpha / omega)
+        p = r + beta * (p - omega * v)
+        v = matvec(p)
+        alpha = rho_new / (r_hat @ v)
+        s = r - alpha * v
+        if np.max(np.abs(s)) < tol:
+            return x + alpha * p, k
+        t = matvec(s)
+        omega = (t @ s) / (t @ t)
+        x = x + alpha * p + omega * s
+        r = s - omega * t
+        if np.max(np.abs(r)) < tol:
+            return x, k
+        rho = rho_new
+    return x, max_iter
+
+def solve_policy_system(P_pi, r_pi: np.ndarray, gamma: float, solver: str = "dense",
+                        tol: float = 1e-10, max_iter: int = 10000, x0=None):
+    """
+    Solve (I - γ P_π) V = r_π exactly.
+
+    With γ = 1, absorbing states (P_π(s,s) = 1) make the system singular;
+    their value is pinned to 0, which requires r_π(s) = 0 there.
+
+    Args:
+        P_pi: (S,S) ndarray or CSRMatrix
+        solver: "dense" (LU via np.linalg.solve) or "bicgstab" (sparse iterative)
+    Returns:
+        V: (S,), info: {"solver", "iterations", "wall_time"}
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"solver must be one of {SOLVERS}, got {solver!r}.")
+    t0 = time.perf_counter()
+    S = r_pi.size
+    if isinstance(P_pi, CSRMatrix):
+        diag = np.zeros(S, dtype=float)
+        rows = np.repeat(np.arange(S), np.diff(P_pi.indptr))
+        on_diag = rows == P_pi.indices
+        np.add.at(diag, rows[on_diag], P_pi.data[on_diag])
+    else:
+        diag = np.diagonal(P_pi)
+    pinned = np.isclose(diag, 1.0) if gamma == 1.0 else np.zeros(S, dtype=bool)
+    if np.any(np.abs(r_pi[pinned]) > 0.0):
+        raise ValueError("Absorbing state with nonzero reward has unbounded value at gamma=1.")
+    b = np.where(pinned, 0.0, r_pi)
+
+    if solver == "dense":
+        M = np.eye(S) - gamma * (P_pi.toarray() if isinstance(P_pi, CSRMatrix) else P_pi)
+        M[pinned] = 0.0
+        M[pinned, pinned] = 1.0
+        V, iters = np.linalg.solve(M, b), 1
+    else:
+        def matvec(x):
+            y = x - gamma * (P_pi @ x)
+            y[pinned] = x[pinned]
+            return y
+        V, iters = bicgstab(matvec, b, tol=tol, max_iter=max_iter, x0=x0)
+    return V, {"solver": solver, "iterations": iters, "wall_time": time.perf_counter() - t0}
@@ -0,0 +1,171 @@
+# ch4_dynamic_programming/mdp_io.py
+import json
+import os
+import numpy as np
+from .sparse import SparseKernel, as_kernel
+
+# On disk an MDP is a directory of raw .npy arrays (memory-mappable, unlike
+# members of an .npz archive) plus meta.json:
+#   indptr  (S*A+1,) int64   row k = s*A + a spans indptr[k]:indptr[k+1]
+#   indices (nnz,)   int64   successor states
+#   probs   (nnz,)   float64 P(s,a,s')
+#   rewards (nnz,)   float64 R(s,a,s')
+#   dones   (nnz,)   bool    episode ends on this transition (ch2 TR.done)
+FORMAT = "csr-mdp"
+VERSION = 1
+ARRAYS = {"indptr": np.int64, "indices": np.int64, "probs": np.float64,
+          "rewards": np.float64, "dones": np.bool_}
+
+def save_mdp(path, model, gamma=None, **metadata) -> None:
+    """
+    Write a model to directory `path` (created if needed).
+
+    Args:
+        model: a SparseKernel, a ch4 env (P dense or sparse, R, gamma), or a
+               ch2 env with compile() (its TR.done flags are kept)
+        gamma: discount stored in meta.json (default: model.gamma if present)
+        metadata: extra JSON-serializable fields for meta.json
+    """
+    if hasattr(model, "compile"):
+        m = model.compile()
+        S, A = m.num_states, m.num_actions
+        arrays = {"indptr": m.offsets, "indices": m.next_states, "probs": m.probs,
+                  "rewards": m.rewards, "dones": m.dones}
+    else:
+        K = model if isinstance(model, SparseKernel) else as_kernel(model.P, model.R)
+        S, A = K.num_states, K.num_actions
+        # without explicit flags, a transition is final when it enters an absorbing state
+        src = np.repeat(np.arange(S * A) // A, np.diff(K.indptr))
+        dones = K.absorbing_states()[K.indices] & ~K.absorbing_states()[src]
+        arrays = {"indptr": K.indptr, "indices": K.indices, "probs": K.probs,
+                  "rewards": K.rewards, "dones": dones}
+    if gamma is None:
+        gamma = getattr(model, "gamma", None)
+
+    os.makedirs(path, exist_ok=True)
+    for name, dtype in ARRAYS.items():
+        np.save(os.path.join(path, name + ".npy"), np.ascontiguousarray(arrays[name], dtype=dtype))
+    meta = {"format": FORMAT, "version": VERSION, "num_states": int(S), "num_actions": int(A),
+            "nnz": int(np.asarray(arrays["indices"]).size),
+            "gamma": None if gamma is None else float(gamma), **metadata}
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+def load_mdp(path, mmap: bool = True) -> "MDPFile":
+    """
+    Open a model written by save_mdp. With mmap=True the arrays are read-only
+    np.memmap views: opening is O(1) in the model size, pages are read on
+    first touch, and several processes opening the same files share them
+    through the OS page cache.
+    """
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    if meta.get("format") != FORMAT or meta.get("version", 0) > VERSION:
+        raise ValueError(f"{path!r} is not a {FORMAT} v{VERSION} model.")
+    arrays = {name: np.load(os.path.join(path, name + ".npy"), mmap_mode="r" if mmap else None)
+              for name in ARRAYS}
+    return MDPFile(arrays, meta)
+
+class MDPFile:
+    """
+    A loaded model. It is usable as a ch4 env directly (P is a SparseKernel
+    over the mapped arrays, R is None, gamma, S, A); `dense_view()` and
+    `ch2_env()` expose the other interfaces without copying the arrays.
+    """
+    def __init__(self, arrays: dict, meta: dict):
+        self.meta = meta
+        self.dones = arrays["dones"]
+        self.kernel = SparseKernel(arrays["indptr"], arrays["indices"], arrays["probs"],
+                                   arrays["rewards"], meta["num_states"], meta["num_actions"])
+        self.P, self.R = self.kernel, None
+        self.gamma = 1.0 if meta.get("gamma") is None else meta["gamma"]
+        self.S = range(self.num_states)
+        self.A = list(range(self.num_actions))
+
+    @property
+    def num_states(self) -> int:
+        return self.kernel.num_states
+
+    @property
+    def num_actions(self) -> int:
+        return self.kernel.num_actions
+
+    def dense_view(self):
+        """(P, R) views indexable as P[s,a,s'] or P[s,a] (an (S,) row), built per access."""
+        return DenseKernelView(self.kernel, "probs"), DenseKernelView(self.kernel, "rewards")
+
+    def ch2_env(self):
+        """Adapter with the ch2 interface: P[s][a] -> [TR(p, sp, r, done)], compile()."""
+        return TransitionListEnv(self.kernel, self.dones)
+
+class DenseKernelView:
+    """Read-only P[s,a,s'] / R[s,a,s'] indexing over a SparseKernel (no (S,A,S) array)."""
+    def __init__(self, kernel: SparseKernel, field: str):
+        self.kernel, self.field = kernel, field
+
+    @property
+    def shape(self):
+        return self.kernel.shape
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple) or len(key) not in (2, 3):
+            raise TypeError("index as [s, a] or [s, a, s'].")
+        s, a = int(key[0]), int(key[1])
+        idx, probs, rewards = self.kernel.row(s, a)
+        row = np.zeros(self.kernel.num_states, dtype=float)
+        if self.field == "probs":
+            np.add.at(row, idx, probs)
+        else:
+            row[idx] = rewards
+        return row if len(key) == 2 else row[key[2]]
+
+class TransitionListEnv:
+    """ch2-style env over a SparseKernel; TR lists are built on access."""
+    def __init__(self, kernel: SparseKernel, dones: np.ndarray):
+        self.kernel, self.dones = kernel, dones
+        self.P = _TransitionLists(self)
+        self.A = list(range(kernel.num_actions))
+        self._compiled = None
+
+    @property
+    def num_states(self) -> int:
+        return self.kernel.num_states
+
+    @property
+    def num_actions(self) -> int:
+        return self.kernel.num_actions
+
+    def compile(self):
+        """The ch2 CompiledModel, sharing the kernel's arrays."""
+        if self._compiled is None:
+            from ch2_rl_formulation.gridworld import CompiledModel
+            K = self.kernel
+            self._compiled = CompiledModel(K.indptr, K.probs, K.indices, K.rewards, self.dones,
+                                           K.num_states, K.num_actions)
+        return self._compiled
+
+class _TransitionLists:
+    def __init__(self, env: TransitionListEnv):
+        self._env = env
+
+    def __len__(self):
+        return self._env.num_states
+
+    def __getitem__(self, s):
+        return _ActionTransitions(self._env, int(s))
+
+class _ActionTransitions:
+    def __init__(self, env: TransitionListEnv, s: int):
+        self._env, self._s = env, s
+
+    def __len__(self):
+        return self._env.num_actions
+
+    def __getitem__(self, a):
+        from ch2_rl_formulation.gridworld import TR
+        K = self._env.kernel
+        k = self._s * K.num_actions + int(a)
+        lo, hi = K.indptr[k], K.indptr[k + 1]
+        return [TR(float(p), int(sp), float(r), bool(d))
+                for p, sp, r, d in zip(K.probs[lo:hi], K.indices[lo:hi],
+                                       K.rewards[lo:hi], self._env.dones[lo:hi])]
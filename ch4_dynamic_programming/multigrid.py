@@ -0,0 +1,107 @@
+# ch4_dynamic_programming/multigrid.py
+import numpy as np
+from .gridworld import GridWorld
+from .value_iteration import value_iteration
+from .sparse import as_kernel
+from .sweeps import reverse_bfs_layers
+
+def coarsen(env: GridWorld, factor: int = 2) -> GridWorld:
+    """
+    Aggregate factor×factor blocks of cells into one coarse cell.
+
+    One coarse step stands for `factor` fine steps, so the step reward is
+    multiplied by factor and the discount becomes gamma**factor. A coarse
+    cell is a wall only if every fine cell in its block is a wall (narrow
+    passages stay open); it is terminal if its block holds a terminal (the
+    largest terminal reward wins). Slip is kept as is.
+    """
+    if factor < 2:
+        raise ValueError("factor must be >= 2.")
+    N, M = env.n_rows, env.n_cols
+    n, m = -(-N // factor), -(-M // factor)
+    padded = np.ones((n * factor, m * factor), dtype=bool)
+    padded[:N, :M] = env.walls
+    walls = padded.reshape(n, factor, m, factor).all(axis=(1, 3))
+    terminals = {}
+    for (i, j), r in env.terminals.items():
+        c = (i // factor, j // factor)
+        terminals[c] = max(r, terminals.get(c, -np.inf))
+    walls[tuple(np.array(list(terminals)).T)] = False
+    return GridWorld((n, m), terminals=terminals, walls=walls,
+                     step_reward=env.step_reward * factor, slip=env.slip,
+                     gamma=env.gamma ** factor)
+
+def prolong(V_coarse: np.ndarray, coarse: GridWorld, fine: GridWorld, factor: int = 2) -> np.ndarray:
+    """
+    Piecewise-constant interpolation of coarse values onto the fine grid:
+    each fine cell takes its block's value. Fine walls and terminals start at 0.
+    """
+    Vc = np.asarray(V_coarse, dtype=float).reshape(coarse.n_rows, coarse.n_cols)
+    i = np.arange(fine.n_rows) // factor
+    j = np.arange(fine.n_cols) // factor
+    V = Vc[i[:, None], j[None, :]].copy()
+    V[fine.walls] = 0.0
+    for c in fine.terminals:
+        V[c] = 0.0
+    return V.reshape(-1)
+
+def lower_bound(env, V: np.ndarray) -> np.ndarray:
+    """
+    Shift V down to a start below V*: V - c·h, with h the BFS distance to
+    the absorbing states and c >= 0 the smallest constant for which every
+    state has an action with Q(s,a) >= V(s) on the shifted values. Then
+    T(V - c·h) >= V - c·h, so max backups only raise it towards V*.
+    Costs one backup of every (s,a) pair.
+    """
+    K = as_kernel(env.P, env.R)
+    h = np.zeros(K.num_states)
+    for d, states in enumerate(reverse_bfs_layers(env)):
+        h[states] = d
+    gain = V[:, None] - (K.expected_reward() + env.gamma * (K @ V))  # needed rise
+    drop = h[:, None] - env.gamma * (K @ h)                          # rise per unit of c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c_sa = np.where(drop > 0, np.maximum(gain, 0.0) / drop, np.inf)
+    c_s = c_sa.min(axis=1)
+    c_s[K.absorbing_states() | ~np.isfinite(c_s)] = 0.0
+    return V - c_s.max() * h
+
+def multigrid_value_iteration(env: GridWorld, factor: int = 2, min_size: int = 8,
+                              theta: float = 1e-8, return_info: bool = False, **kwargs):
+    """
+    Coarse-to-fine value iteration for GridWorld.
+
+    Builds coarser grids with `coarsen` until a side would drop below
+    min_size, then solves them coarsest first. Each level starts from a
+    one-sided bound: the prolonged coarse values (zeros on the coarsest
+    grid) shifted below V* by `lower_bound`, and sweeps with the
+    "reverse-bfs" schedule by default. From below, a wavefront sweep
+    carries exact values outward from the goal in one pass, so fine-level
+    sweeps no longer grow with the grid diameter. The last solve is the
+    ordinary fine-level solver, so the result is the same as
+    value_iteration(env, theta=theta, **kwargs) within theta.
+
+    Args:
+        kwargs: passed to value_iteration at every level (backend, schedule, max_iter, ...)
+    Returns:
+        V: (S,), pi: (S,A)[, info with "levels" (list of {"shape", "sweeps"},
+        coarsest first), "sweeps" (fine level) and "work" (total sweeps plus
+        one backup per level for the bound, weighted by level size, in
+        fine-sweep units)]
+    """
+    kwargs.setdefault("schedule", "reverse-bfs")
+    hierarchy = [env]
+    while min(hierarchy[-1].n_rows, hierarchy[-1].n_cols) >= min_size * factor:
+        hierarchy.append(coarsen(hierarchy[-1], factor))
+
+    V, levels = None, []
+    for level in reversed(range(len(hierarchy))):
+        grid = hierarchy[level]
+        V = np.zeros(grid.num_states) if V is None else prolong(V, hierarchy[level + 1], grid, factor)
+        V, pi, trace = value_iteration(grid, theta=theta, return_info=True,
+                                       V0=lower_bound(grid, V), **kwargs)
+        levels.append({"shape": (grid.n_rows, grid.n_cols), "sweeps": trace["sweeps"]})
+
+    if return_info:
+        work = sum((l["sweeps"] + 1) * l["shape"][0] * l["shape"][1] for l in levels) / env.num_states
+        return V, pi, {"levels": levels, "sweeps": levels[-1]["sweeps"], "work": work}
+    return V, pi
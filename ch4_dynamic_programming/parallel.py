@@ -0,0 +1,151 @@
+# ch4_dynamic_programming/parallel.py
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from .sparse import as_kernel, _segment_sum
+from .utils import greedy_from_q
+
+def _views(blocks, specs):
+    """ndarray views on the shared blocks, in spec order."""
+    return [np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            for shm, (_, shape, dtype) in zip(blocks, specs)]
+
+def _sweep_block(w, lo, hi, arrays, A, gamma, theta, max_iter, barrier):
+    """
+    Block-Jacobi sweeps over states [lo, hi).
+
+    Sweep k reads V[k % 2] and writes its block of V[(k+1) % 2]. The residual
+    slots are double-buffered the same way, so a worker that passes the
+    barrier early cannot overwrite a value another worker is still reading.
+    """
+    indptr, indices, probs, rewards, V, res, history, ctrl = arrays
+    rows = indptr[lo * A:hi * A + 1]
+    first, last = rows[0], rows[-1]
+    seg = rows - first
+    idx, p = indices[first:last], probs[first:last]
+    r_sa = _segment_sum(p * rewards[first:last], seg)  # fixed for the whole solve
+    cur = 0
+    for k in range(max_iter):
+        q = r_sa + gamma * _segment_sum(p * V[cur][idx], seg)
+        v_new = q.reshape(hi - lo, A).max(axis=1)
+        res[k % 2, w] = np.max(np.abs(v_new - V[cur, lo:hi]))
+        V[1 - cur, lo:hi] = v_new
+        barrier.wait()
+        cur = 1 - cur
+        delta = res[k % 2].max()
+        if w == 0:
+            history[k] = delta
+        if delta < theta:
+            break
+    if w == 0:
+        ctrl[:] = (k + 1, cur)
+
+def _worker(w, lo, hi, specs, A, gamma, theta, max_iter, barrier):
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    try:
+        _sweep_block(w, lo, hi, _views(blocks, specs), A, gamma, theta, max_iter, barrier)
+    finally:
+        for shm in blocks:
+            shm.close()
+
+def _collect(blocks, specs):
+    """Copy (V, residual history, sweeps) out of shared memory."""
+    *_, V, _, history, ctrl = _views(blocks, specs)
+    sweeps, cur = (int(x) for x in ctrl)
+    return V[cur].copy(), history[:sweeps].copy(), sweeps
+
+def partition(num_states: int, workers: int) -> np.ndarray:
+    """Contiguous, near-equal state blocks: bounds (workers+1,)."""
+    return np.linspace(0, num_states, workers + 1).round().astype(np.int64)
+
+def parallel_value_iteration(env, workers: int = 2, theta: float = 1e-8,
+                             max_iter: int = 10000, return_info: bool = False, V0=None):
+    """
+    Value iteration split across processes by contiguous blocks of states.
+
+    The kernel arrays (indptr, indices, probs, rewards) and a double-buffered
+    value vector live in multiprocessing.shared_memory; workers attach to them
+    by name, so nothing is pickled per sweep. Every sweep is block-Jacobi:
+    each worker backs up its own states from the previous sweep's V, then all
+    workers meet at a barrier and stop together once the largest per-block
+    residual is below theta. The result is the vectorized (Jacobi) solution,
+    which agrees with the serial solvers within theta.
+
+    Args:
+        env: provides P (dense or SparseKernel), R, gamma, S, A
+        workers: number of processes (capped at the number of states)
+        V0: optional (S,) starting values; zeros by default
+    Returns:
+        V: (S,), pi: (S,A) greedy policy[, info with "sweeps", "residuals",
+        "backups", "workers", "wall_time"]
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1.")
+    if max_iter < 1:
+        raise ValueError("max_iter must be >= 1.")
+    K = as_kernel(env.P, env.R)
+    S, A = K.num_states, K.num_actions
+    workers = min(int(workers), S)
+    gamma = env.gamma
+    V_init = np.zeros(S, dtype=float) if V0 is None else np.asarray(V0, dtype=float)
+
+    sources = {
+        "indptr": K.indptr, "indices": K.indices, "probs": K.probs, "rewards": K.rewards,
+        "V": np.stack([V_init, V_init]), "res": np.zeros((2, workers)),
+        "history": np.zeros(max_iter), "ctrl": np.zeros(2, dtype=np.int64),
+    }
+    blocks, specs = [], []
+    t0 = time.perf_counter()
+    try:
+        for arr in sources.values():
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks.append(shm)
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+            specs.append((shm.name, arr.shape, arr.dtype.str))
+
+        barrier = mp.Barrier(workers)
+        bounds = partition(S, workers)
+        procs = [mp.Process(target=_worker, args=(w, bounds[w], bounds[w + 1], specs, A,
+                                                  gamma, theta, max_iter, barrier))
+                 for w in range(workers)]
+        for p in procs:
+            p.start()
+        # a crashed worker would leave the others blocked at the barrier
+        while any(p.is_alive() for p in procs):
+            for p in procs:
+                p.join(timeout=0.05)
+                if p.exitcode not in (None, 0):
+                    barrier.abort()
+        if any(p.exitcode != 0 for p in procs):
+            raise RuntimeError("a parallel value-iteration worker failed.")
+
+        V, residuals, sweeps = _collect(blocks, specs)
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+    wall_time = time.perf_counter() - t0
+
+    pi = greedy_from_q(K.expected_reward() + gamma * (K @ V))
+    if return_info:
+        return V, pi, {"sweeps": sweeps, "residuals": residuals, "backups": sweeps * S * A,
+                       "workers": workers, "wall_time": wall_time}
+    return V, pi
+
+def scaling_benchmark(env, workers=(1, 2, 4, 8), theta: float = 1e-8,
+                      max_iter: int = 10000) -> list:
+    """
+    Time parallel_value_iteration for each worker count on the same env.
+    Returns a list of {"workers", "seconds", "sweeps", "speedup"} rows,
+    with speedup relative to the first entry.
+    """
+    rows = []
+    for n in workers:
+        _, _, info = parallel_value_iteration(env, workers=n, theta=theta,
+                                              max_iter=max_iter, return_info=True)
+        rows.append({"workers": info["workers"], "seconds": info["wall_time"],
+                     "sweeps": info["sweeps"]})
+    for row in rows:
+        row["speedup"] = rows[0]["seconds"] / row["seconds"]
+    return rows
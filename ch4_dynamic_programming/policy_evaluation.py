@@ -1,32 +1,81 @@
 ﻿# ch4_dynamic_programming/policy_evaluation.py
+import time
 import numpy as np
+from .utils import check_backend, expected_reward, backup_sa, policy_matrix, take_rows
+from .linear_solvers import solve_policy_system
+from .sweeps import resolve_schedule, reverse_bfs_order, reverse_bfs_layers, layered_backup, run_sweeps
 
-def policy_evaluation(env, pi: np.ndarray, theta: float = 1e-8, max_iter: int = 10000):
+METHODS = ("iterative", "exact")
+
+def policy_evaluation(env, pi: np.ndarray, theta: float = 1e-8, max_iter: int = 10000,
+                      backend: str = "loop", return_info: bool = False,
+                      method: str = "iterative", solver: str = "dense", V0=None,
+                      schedule=None, omega: float = 1.0):
     """
-    Iterative policy evaluation for a given stationary (possibly stochastic) π.
+    Policy evaluation for a given stationary (possibly stochastic) π.
 
     Args:
         env: GridWorld4x4 (must provide P, R, gamma, S, A)
         pi:  (S,A) array, rows sum to 1
+        backend: "loop" (state-by-state sweeps) or "vectorized" (synchronous
+                 sweeps V = r_π + γ P_π V with P_π, r_π contracted once)
+        return_info: if True, also return run statistics: the convergence trace
+                     (sweeps, residuals, sweep_times, backups) and wall_time;
+                     solver and iterations for method="exact"
+        method: "iterative" sweeps until delta < theta (or max_iter sweeps; a
+                small max_iter with V0 gives truncated evaluation), "exact"
+                solves (I - γP_π) V = r_π with `solver` ("dense" or "bicgstab")
+        V0: optional (S,) starting values (warm start)
+        schedule, omega: sweep schedule, see value_iteration
     Returns:
         V: (S,) state-value under π
     """
+    check_backend(backend)
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}.")
+    schedule = resolve_schedule(backend, schedule)
     S, A = len(env.S), len(env.A)
-    V = np.zeros(S, dtype=float)
+    V = np.zeros(S, dtype=float) if V0 is None else np.array(V0, dtype=float)
     gamma = env.gamma
+    t_start = time.perf_counter()
+
+    if method == "exact":
+        r_pi = (pi * expected_reward(env.P, env.R)).sum(axis=1)
+        V, info = solve_policy_system(policy_matrix(env.P, pi), r_pi, gamma, solver=solver,
+                                      tol=theta, max_iter=max_iter, x0=V0)
+        info.update(sweeps=0, residuals=np.array([]), sweep_times=np.array([]), backups=0,
+                    wall_time=time.perf_counter() - t_start)
+        return (V, info) if return_info else V
 
-    for _ in range(max_iter):
-        delta = 0.0
-        for s in range(S):
+    backups_per_sweep = int(np.count_nonzero(pi))
+    if backend == "vectorized":
+        P_pi = policy_matrix(env.P, pi)
+        r_pi = (pi * expected_reward(env.P, env.R)).sum(axis=1)
+        if schedule == "reverse-bfs":
+            layers = reverse_bfs_layers(env)
+            blocks = [(r_pi[l], take_rows(P_pi, l)) for l in layers]
+            backup_all = layered_backup(
+                layers, lambda i, V: blocks[i][0] + gamma * (blocks[i][1] @ V))
+        else:
+            backup_all = lambda V: r_pi + gamma * (P_pi @ V)
+        V, info = run_sweeps(V, schedule, theta, max_iter, backups_per_sweep, omega=omega,
+                             backup_all=backup_all)
+    else:
+        def backup_state(s, V):
             # v(s) = Σ_a π(a|s) Σ_s' P(s,a,s') [ R + γ V(s') ]
             v_new = 0.0
             for a in range(A):
                 pa = pi[s, a]
                 if pa == 0.0:
                     continue
-                v_new += pa * (env.P[s, a] * (env.R[s, a] + gamma * V)).sum()
-            delta = max(delta, abs(v_new - V[s]))
-            V[s] = v_new
-        if delta < theta:
-            break
+                v_new += pa * backup_sa(env.P, env.R, s, a, gamma, V)
+            return v_new
+
+        order = reverse_bfs_order(env) if schedule == "reverse-bfs" else range(S)
+        V, info = run_sweeps(V, schedule, theta, max_iter, backups_per_sweep, omega=omega,
+                             backup_state=backup_state, order=order)
+
+    if return_info:
+        info["wall_time"] = time.perf_counter() - t_start
+        return V, info
     return V
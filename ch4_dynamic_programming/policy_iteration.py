@@ -1,46 +1,88 @@
 ﻿# ch4_dynamic_programming/policy_iteration.py
+import time
 import numpy as np
-from .utils import greedy_from_q
+from .utils import greedy_from_q, check_backend, expected_reward, backup_sa, q_from_v
+from .policy_evaluation import policy_evaluation
 
-def policy_iteration(env, theta: float = 1e-8, max_eval_iter: int = 10000):
+EVALUATIONS = ("iterative", "exact", "modified")
+
+def policy_iteration(env, theta: float = 1e-8, max_eval_iter: int = 10000,
+                     backend: str = "loop", return_info: bool = False,
+                     evaluation: str = "iterative", solver: str = "dense",
+                     eval_sweeps: int = 5, V0=None, schedule=None, omega: float = 1.0):
     """
     Standard policy iteration: alternate policy evaluation and greedy improvement.
+
+    Args:
+        backend: "loop" or "vectorized" (see policy_evaluation)
+        return_info: if True, also return {"improvements", "sweeps", "residuals",
+                     "sweep_times", "backups", "linear_solves", "solver_iterations",
+                     "wall_time"}; residuals/sweep_times concatenate all evaluations
+        evaluation: "iterative" (sweep to theta), "exact" (one linear solve of
+                    (I - γP_π)V = r_π per round, see `solver`), or "modified"
+                    (only `eval_sweeps` sweeps per round; stops once the Bellman
+                    optimality residual falls below theta)
+        V0: optional (S,) warm start; the first policy is then greedy w.r.t. V0
+            instead of uniform random
+        schedule, omega: sweep schedule of the evaluations, see value_iteration
     Returns:
         V: (S,), pi: (S,A) deterministic greedy policy
     """
+    check_backend(backend)
+    if evaluation not in EVALUATIONS:
+        raise ValueError(f"evaluation must be one of {EVALUATIONS}, got {evaluation!r}.")
     S, A = len(env.S), len(env.A)
     gamma = env.gamma
+    r_sa = expected_reward(env.P, env.R) if backend == "vectorized" else None
+    t_start = time.perf_counter()
 
-    # start with uniform random policy
-    pi = np.full((S, A), 1.0 / A, dtype=float)
-    V = np.zeros(S, dtype=float)
+    # start with uniform random policy (or greedy w.r.t. a warm-start V0)
+    if V0 is None:
+        pi = np.full((S, A), 1.0 / A, dtype=float)
+        V = np.zeros(S, dtype=float)
+    else:
+        V = np.array(V0, dtype=float)
+        pi = greedy_from_q(q_from_v(env.P, env.R, gamma, V))
+    residuals, sweep_times = [], []
+    backups = linear_solves = solver_iters = 0
 
     stable = False
     iters = 0
     while not stable:
-        # --- policy evaluation ---
-        for _ in range(max_eval_iter):
-            delta = 0.0
-            for s in range(S):
-                v_new = 0.0
-                for a in range(A):
-                    pa = pi[s, a]
-                    if pa == 0.0:
-                        continue
-                    v_new += pa * (env.P[s, a] * (env.R[s, a] + gamma * V)).sum()
-                delta = max(delta, abs(v_new - V[s]))
-                V[s] = v_new
-            if delta < theta:
-                break
+        # --- policy evaluation (warm-started from the previous V) ---
+        V, ev = policy_evaluation(
+            env, pi, theta=theta,
+            max_iter=eval_sweeps if evaluation == "modified" else max_eval_iter,
+            backend=backend, return_info=True,
+            method="exact" if evaluation == "exact" else "iterative",
+            solver=solver, V0=V, schedule=schedule, omega=omega)
+        residuals.extend(ev["residuals"])
+        sweep_times.extend(ev["sweep_times"])
+        backups += ev["backups"] + S * A  # evaluation sweeps + improvement step
+        if evaluation == "exact":
+            linear_solves += 1
+            solver_iters += ev["iterations"]
 
         # --- policy improvement ---
-        Q = np.zeros((S, A), dtype=float)
-        for s in range(S):
-            for a in range(A):
-                Q[s, a] = (env.P[s, a] * (env.R[s, a] + gamma * V)).sum()
+        if backend == "vectorized":
+            Q = r_sa + gamma * (env.P @ V)
+        else:
+            Q = np.zeros((S, A), dtype=float)
+            for s in range(S):
+                for a in range(A):
+                    Q[s, a] = backup_sa(env.P, env.R, s, a, gamma, V)
         new_pi = greedy_from_q(Q)
-        stable = np.array_equal(new_pi, pi)
+        if evaluation == "modified":
+            stable = np.max(np.abs(Q.max(axis=1) - V)) < theta
+        else:
+            stable = np.array_equal(new_pi, pi)
         pi = new_pi
         iters += 1
 
+    if return_info:
+        return V, pi, {"improvements": iters, "sweeps": len(sweep_times),
+                       "residuals": np.array(residuals), "sweep_times": np.array(sweep_times),
+                       "backups": backups,
+                       "linear_solves": linear_solves, "solver_iterations": solver_iters,
+                       "wall_time": time.perf_counter() - t_start}
     return V, pi
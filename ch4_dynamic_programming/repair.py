@@ -0,0 +1,102 @@
+# ch4_dynamic_programming/repair.py
+import heapq
+import numpy as np
+from .sparse import as_kernel
+
+def _predecessor_fn(env, K):
+    """s -> states that may move into s (env.neighbors if the env has one, else the kernel's lists)."""
+    if hasattr(env, "neighbors"):
+        return env.neighbors
+    pred_indptr, pred = K.predecessors()
+    return lambda s: pred[pred_indptr[s]:pred_indptr[s + 1]]
+
+def repair(env, V: np.ndarray, pi: np.ndarray, changed, theta: float = 1e-8,
+           max_backups: int = 10_000_000) -> dict:
+    """
+    Repair a solved (V, π) in place after local edits to env's model.
+
+    Args:
+        env: the edited env (e.g. after GridWorld.set_wall / set_terminal)
+        V, pi: the solution before the edit; both are updated in place
+        changed: states whose transition rows changed (returned by the edit)
+    Returns:
+        info: {"touched": states whose value or policy was recomputed,
+               "invalidated": states reset before the repair, "backups"}
+
+    Two phases, both walking predecessors outward from the edited states:
+    1. Invalidate: a state whose every greedy action (under the old V)
+       moves deterministically into an invalidated state may have lost its
+       value. Such states are reset to a lower bound, so value drops cannot
+       creep down one small step at a time (the γ = 1 "count to infinity"
+       problem).
+    2. Prioritized sweeping seeded with the changed and invalidated states:
+       pop the largest Bellman error, back it up, re-queue its predecessors.
+    Work is proportional to the region the edit affects, not to S.
+    """
+    K = as_kernel(env.P, env.R)
+    gamma, A = env.gamma, K.num_actions
+    preds = _predecessor_fn(env, K)
+    changed = np.unique(np.asarray(changed, dtype=np.int64))
+
+    def q(s):
+        return K.state_q(s, gamma, V)
+
+    # phase 1: invalidation (along deterministic greedy moves only; with
+    # stochastic moves values drain geometrically and sweeping alone is enough)
+    bad = set(changed.tolist())
+    stack = list(bad)
+    while stack:
+        s = stack.pop()
+        for p in preds(s):
+            p = int(p)
+            if p in bad:
+                continue
+            qp = q(p)
+            succ = [K.row(p, a)[0] for a in np.flatnonzero(qp >= qp.max() - theta)]
+            if all(nxt.size == 1 and int(nxt[0]) in bad for nxt in succ):
+                bad.add(p)
+                stack.append(p)
+    invalid = np.array(sorted(bad), dtype=np.int64)
+    r_min = min(float(K.rewards.min()), 0.0)
+    low = r_min / (1.0 - gamma) if gamma < 1.0 else r_min * K.num_states
+    for s in invalid:
+        lo, hi = K.indptr[s * A], K.indptr[(s + 1) * A]
+        if np.all(K.indices[lo:hi] == s) and np.all(K.rewards[lo:hi] == 0.0):
+            V[s] = 0.0  # goal or wall
+        elif hi - lo == A:
+            V[s] = low  # deterministic state: reset (stochastic ones keep V and are re-queued)
+
+    # phase 2: prioritized sweeping from the affected states
+    touched = set(bad)
+    prio = {}
+    heap = []
+    for s in invalid:
+        e = abs(q(s).max() - V[s])
+        if e >= theta:
+            prio[int(s)] = e
+            heap.append((-e, int(s)))
+    heapq.heapify(heap)
+    backups = 0
+    while heap and backups < max_backups:
+        neg_e, s = heapq.heappop(heap)
+        if prio.get(s) != -neg_e:
+            continue  # stale entry
+        del prio[s]
+        V[s] = q(s).max()
+        backups += 1
+        touched.add(s)
+        for p in preds(s):
+            p = int(p)
+            e = abs(q(p).max() - V[p])
+            if e >= theta and e > prio.get(p, 0.0):
+                prio[p] = e
+                heapq.heappush(heap, (-e, p))
+
+    # policies can change wherever a successor's value changed
+    stale = set(touched)
+    for s in touched:
+        stale.update(int(p) for p in preds(s))
+    for s in stale:
+        pi[s] = 0.0
+        pi[s, int(np.argmax(q(s)))] = 1.0
+    return {"touched": len(stale), "invalidated": int(invalid.size), "backups": backups}
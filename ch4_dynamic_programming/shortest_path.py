@@ -0,0 +1,115 @@
+# ch4_dynamic_programming/shortest_path.py
+import heapq
+import numpy as np
+from .sparse import as_kernel, gather_segments
+from .utils import greedy_from_q
+
+def is_deterministic(K) -> bool:
+    """True if every (s,a) row of the kernel has exactly one successor with probability 1."""
+    return bool(np.all(np.diff(K.indptr) == 1) and np.allclose(K.probs, 1.0))
+
+def _edge_rewards(K):
+    """
+    Goal states (absorbing with zero reward) and the rewards of moves out of
+    the other states, split by whether they end in a goal. An absorbing
+    state whose self-loop pays is not a goal but a trap that never reaches one.
+    """
+    S, A = K.num_states, K.num_actions
+    src = np.arange(S * A) // A  # one successor per row
+    paid = np.bincount(src, weights=np.abs(K.rewards), minlength=S) > 0.0
+    absorbing = K.absorbing_states() & ~paid
+    live = ~absorbing[src]
+    into = absorbing[K.indices]
+    return absorbing, K.rewards[live & into], K.rewards[live & ~into]
+
+def _bfs_layers(K, absorbing) -> np.ndarray:
+    """Hop distance to the nearest absorbing state (-1 if none is reachable)."""
+    pred_indptr, pred = K.predecessors()
+    hops = np.full(K.num_states, -1, dtype=np.int64)
+    frontier = np.flatnonzero(absorbing)
+    hops[frontier] = 0
+    depth = 0
+    while frontier.size:
+        depth += 1
+        nb = gather_segments(pred_indptr, pred, frontier)
+        frontier = np.unique(nb[hops[nb] < 0])
+        hops[frontier] = depth
+    return hops
+
+def _dijkstra(K, absorbing) -> np.ndarray:
+    """V* at gamma = 1 for rewards <= 0 between non-absorbing states (any sign into absorbing ones)."""
+    pred_indptr, pred = K.predecessors()
+    V = np.where(absorbing, 0.0, -np.inf)   # settled values
+    label = V.copy()                        # best value found so far
+    heap = []
+    for s in np.unique(gather_segments(pred_indptr, pred, np.flatnonzero(absorbing))):
+        if not absorbing[s]:
+            label[s] = K.state_q(s, 1.0, V).max()
+            heap.append((-label[s], int(s)))
+    heapq.heapify(heap)
+    while heap:
+        neg, s = heapq.heappop(heap)
+        if V[s] > -np.inf or -neg != label[s]:
+            continue  # already settled, or a stale entry
+        V[s] = label[s]
+        for p in pred[pred_indptr[s]:pred_indptr[s + 1]]:
+            if V[p] == -np.inf:
+                q = K.state_q(p, 1.0, V).max()
+                if q > label[p]:
+                    label[p] = q
+                    heapq.heappush(heap, (-q, int(p)))
+    return V
+
+def shortest_path_values(env, return_info: bool = False):
+    """
+    Exact V* and greedy π for deterministic MDPs, without sweeps.
+
+    Needs a deterministic kernel. Absorbing states that pay 0 (goals, walls)
+    end an episode; an absorbing state whose self-loop pays (a cell walled in
+    on every side) is treated like any state that cannot reach them.
+    - Uniform costs (every move pays r0 < 0, every move into an absorbing
+      state pays r_T): a vectorized reverse BFS over predecessor lists gives
+      the hop distance L and V*(s) = r0 (1-γ^(L-1)) / (1-γ) + γ^(L-1) r_T
+      (r0 (L-1) + r_T at γ = 1), in O(S·A). With γ < 1 this requires
+      r0 < (1-γ) r_T, so shorter paths are always better.
+    - Otherwise, at γ = 1 with non-positive rewards between non-absorbing
+      states, Dijkstra from the absorbing states (O(S·A log S)).
+    States that cannot reach an absorbing state get r0 / (1-γ) for γ < 1;
+    at γ = 1 their value is unbounded and a ValueError is raised.
+
+    Returns:
+        V: (S,), pi: (S,A) greedy policy[, info {"method": "bfs" | "dijkstra"}]
+    """
+    K = as_kernel(env.P, env.R)
+    gamma = env.gamma
+    if not is_deterministic(K):
+        raise ValueError("shortest_path_values needs a deterministic kernel (one successor per (s,a)).")
+    absorbing, r_into, r_other = _edge_rewards(K)
+    uniform = np.unique(r_into).size <= 1 and np.unique(r_other).size <= 1
+    r0 = float(r_other[0]) if r_other.size else -1.0
+    r_T = float(r_into[0]) if r_into.size else 0.0
+    if uniform and r0 < 0.0 and (gamma == 1.0 or r0 < (1.0 - gamma) * r_T):
+        method = "bfs"
+        hops = _bfs_layers(K, absorbing)
+        reach = hops > 0
+        if gamma == 1.0:
+            V = np.where(reach, r0 * (hops - 1) + r_T, 0.0)
+        else:
+            g = gamma ** np.maximum(hops - 1, 0)
+            V = np.where(reach, r0 * (1.0 - g) / (1.0 - gamma) + g * r_T, 0.0)
+        unreachable = hops < 0
+    elif gamma == 1.0 and np.all(r_other <= 0.0):
+        method = "dijkstra"
+        V = _dijkstra(K, absorbing)
+        unreachable = V == -np.inf
+    else:
+        raise ValueError("rewards must be uniform (r0 < 0), or non-positive with gamma = 1.")
+
+    if np.any(unreachable):
+        if gamma == 1.0:
+            raise ValueError("some states cannot reach an absorbing state; their value is unbounded at gamma=1.")
+        V = np.where(unreachable, r0 / (1.0 - gamma), V)
+    pi = greedy_from_q(K.expected_reward() + gamma * (K @ V))
+    if return_info:
+        return V, pi, {"method": method}
+    return V, pi
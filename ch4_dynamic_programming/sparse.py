@@ -0,0 +1,212 @@
+# ch4_dynamic_programming/sparse.py
+import numpy as np
+
+def _segment_sum(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+    """Sum values[indptr[i]:indptr[i+1]] along axis 0 for every segment i."""
+    n_rows = indptr.size - 1
+    if values.shape[0] == 0:
+        return np.zeros((n_rows,) + values.shape[1:], dtype=float)
+    starts = np.minimum(indptr[:-1], values.shape[0] - 1)
+    out = np.add.reduceat(values, starts, axis=0)
+    out[indptr[:-1] == indptr[1:]] = 0.0  # reduceat leaves garbage in empty rows
+    return out
+
+def _csr_matvec(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray,
+                x: np.ndarray) -> np.ndarray:
+    """y[i] = Σ_k data[k] x[indices[k]] over row i; x may be (n,) or (n,K)."""
+    w = data if x.ndim == 1 else data.reshape((-1,) + (1,) * (x.ndim - 1))
+    return _segment_sum(w * x[indices], indptr)
+
+class CSRMatrix:
+    """
+    Minimal compressed-sparse-row matrix (no SciPy dependency).
+    Used for policy-induced chains P_π of shape (S,S).
+    """
+    def __init__(self, indptr, indices, data, shape):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.shape = tuple(shape)
+
+    @property
+    def nnz(self) -> int:
+        return int(self.indices.size)
+
+    def __matmul__(self, x):
+        return _csr_matvec(self.indptr, self.indices, self.data, np.asarray(x, dtype=float))
+
+    def take_rows(self, rows) -> "CSRMatrix":
+        """Rows `rows` only, as an (n, shape[1]) matrix: M.take_rows(r) @ x == (M @ x)[r]."""
+        rows = np.asarray(rows, dtype=np.int64)
+        lens = self.indptr[rows + 1] - self.indptr[rows]
+        return CSRMatrix(np.concatenate(([0], np.cumsum(lens))),
+                         gather_segments(self.indptr, self.indices, rows),
+                         gather_segments(self.indptr, self.data, rows), (rows.size, self.shape[1]))
+
+    def toarray(self) -> np.ndarray:
+        M = np.zeros(self.shape, dtype=float)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        np.add.at(M, (rows, self.indices), self.data)
+        return M
+
+class SparseKernel:
+    """
+    CSR-style tabular MDP model. Row k = s*A + a lists the successors of (s,a):
+
+        indices[indptr[k]:indptr[k+1]]  successor states s'
+        probs[...]                      P(s,a,s')
+        rewards[...]                    R(s,a,s')
+
+    Memory and backup cost scale with the number of nonzero transitions,
+    not with S². `kernel @ V` returns Σ_s' P(s,a,s') V(s') as an (S,A) array,
+    so solvers can use it wherever they would use a dense P.
+    """
+    def __init__(self, indptr, indices, probs, rewards, num_states: int, num_actions: int):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.probs = np.asarray(probs, dtype=float)
+        self.rewards = np.asarray(rewards, dtype=float)
+        self.num_states = int(num_states)
+        self.num_actions = int(num_actions)
+        if self.indptr.size != self.num_states * self.num_actions + 1:
+            raise ValueError("indptr must have S*A + 1 entries.")
+        if not (self.indices.size == self.probs.size == self.rewards.size == self.indptr[-1]):
+            raise ValueError("indices, probs and rewards must all have indptr[-1] entries.")
+        self._pred = None
+
+    # -------- conversion --------
+    @classmethod
+    def from_dense(cls, P: np.ndarray, R: np.ndarray, tol: float = 0.0):
+        """Build from dense (S,A,S) arrays, keeping entries with P > tol."""
+        S, A, _ = P.shape
+        flat_P = P.reshape(S * A, S)
+        rows, cols = np.nonzero(flat_P > tol)
+        counts = np.bincount(rows, minlength=S * A)
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        return cls(indptr, cols, flat_P[rows, cols], R.reshape(S * A, S)[rows, cols], S, A)
+
+    def to_dense(self):
+        """Return dense (P, R) arrays of shape (S,A,S)."""
+        S, A = self.num_states, self.num_actions
+        rows = np.repeat(np.arange(S * A), np.diff(self.indptr))
+        P = np.zeros((S * A, S), dtype=float)
+        R = np.zeros((S * A, S), dtype=float)
+        np.add.at(P, (rows, self.indices), self.probs)
+        R[rows, self.indices] = self.rewards
+        return P.reshape(S, A, S), R.reshape(S, A, S)
+
+    # -------- access --------
+    @property
+    def shape(self):
+        return (self.num_states, self.num_actions, self.num_states)
+
+    @property
+    def nnz(self) -> int:
+        return int(self.indices.size)
+
+    def row(self, s: int, a: int):
+        """Return (successors, probs, rewards) of the pair (s,a)."""
+        k = s * self.num_actions + a
+        lo, hi = self.indptr[k], self.indptr[k + 1]
+        return self.indices[lo:hi], self.probs[lo:hi], self.rewards[lo:hi]
+
+    def take_rows(self, states) -> "SparseKernel":
+        """
+        The rows (s,0..A-1) of `states` only. Successors keep their original
+        indices, so K.take_rows(states) @ V == (K @ V)[states] for a full V.
+        """
+        states = np.asarray(states, dtype=np.int64)
+        A = self.num_actions
+        rows = (states[:, None] * A + np.arange(A)).reshape(-1)
+        lens = self.indptr[rows + 1] - self.indptr[rows]
+        return SparseKernel(np.concatenate(([0], np.cumsum(lens))),
+                            gather_segments(self.indptr, self.indices, rows),
+                            gather_segments(self.indptr, self.probs, rows),
+                            gather_segments(self.indptr, self.rewards, rows), states.size, A)
+
+    def predecessors(self):
+        """
+        Transposed structure (cached): states s with some P(s,a,s') > 0 are
+        pred_indices[pred_indptr[s']:pred_indptr[s'+1]], each listed once.
+        """
+        if self._pred is None:
+            S, A = self.num_states, self.num_actions
+            src = np.repeat(np.arange(S * A, dtype=np.int64) // A, np.diff(self.indptr))
+            live = self.probs > 0.0
+            keys = np.sort(self.indices[live] * S + src[live])
+            keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]  # faster than np.unique
+            dst, pred = np.divmod(keys, S)
+            indptr = np.concatenate(([0], np.cumsum(np.bincount(dst, minlength=S))))
+            self._pred = (indptr, pred)
+        return self._pred
+
+    def absorbing_states(self) -> np.ndarray:
+        """(S,) mask of states whose every action leads back to themselves."""
+        S, A = self.num_states, self.num_actions
+        src = np.repeat(np.arange(S * A, dtype=np.int64) // A, np.diff(self.indptr))
+        leaves = (self.indices != src) & (self.probs > 0.0)
+        return np.bincount(src, weights=leaves, minlength=S) == 0
+
+    def state_q(self, s: int, gamma: float, V: np.ndarray) -> np.ndarray:
+        """Q(s,·) for one state, touching only that state's transitions."""
+        A = self.num_actions
+        bounds = self.indptr[s * A:(s + 1) * A + 1]
+        lo, hi = bounds[0], bounds[-1]
+        per_tr = self.probs[lo:hi] * (self.rewards[lo:hi] + gamma * V[self.indices[lo:hi]])
+        return np.add.reduceat(per_tr, bounds[:-1] - lo)
+
+    def set_rows(self, states, indices, probs, rewards) -> None:
+        """
+        Overwrite the rows (s,0..A-1) of `states` in place. Inputs are (n,A,k)
+        (or flattened) and every row must keep its current length k.
+        """
+        states = np.asarray(states, dtype=np.int64)
+        A = self.num_actions
+        rows = (states[:, None] * A + np.arange(A)).reshape(-1)
+        indices = np.asarray(indices, dtype=np.int64).reshape(rows.size, -1)
+        if np.any(self.indptr[rows + 1] - self.indptr[rows] != indices.shape[1]):
+            raise ValueError("set_rows cannot change the length of a row.")
+        pos = self.indptr[rows][:, None] + np.arange(indices.shape[1])
+        self.indices[pos] = indices
+        self.probs[pos] = np.reshape(probs, pos.shape)
+        self.rewards[pos] = np.reshape(rewards, pos.shape)
+        self._pred = None
+
+    # -------- backups --------
+    def expected_reward(self, rewards=None) -> np.ndarray:
+        """
+        r(s,a) = Σ_s' P(s,a,s') R(s,a,s') as an (S,A) array. `rewards` may
+        replace self.rewards with a (nnz,) array or a (K, nnz) stack, giving (K,S,A).
+        """
+        S, A = self.num_states, self.num_actions
+        rewards = self.rewards if rewards is None else np.asarray(rewards, dtype=float)
+        r = _segment_sum((self.probs * rewards).T, self.indptr)
+        if rewards.ndim == 2:
+            return r.T.reshape(-1, S, A)
+        return r.reshape(S, A)
+
+    def __matmul__(self, V):
+        V = np.asarray(V, dtype=float)
+        out = _csr_matvec(self.indptr, self.indices, self.probs, V)
+        return out.reshape((self.num_states, self.num_actions) + V.shape[1:])
+
+    def policy_matrix(self, pi: np.ndarray) -> CSRMatrix:
+        """P_π(s,s') = Σ_a π(a|s) P(s,a,s') as an (S,S) CSRMatrix."""
+        S, A = self.num_states, self.num_actions
+        weights = np.repeat(np.asarray(pi, dtype=float).reshape(S * A), np.diff(self.indptr))
+        # rows (s,0..A-1) are contiguous, so the rows of P_π are every A-th boundary
+        return CSRMatrix(self.indptr[::A], self.indices, weights * self.probs, (S, S))
+
+def gather_segments(indptr: np.ndarray, data: np.ndarray, rows) -> np.ndarray:
+    """Concatenate data[indptr[r]:indptr[r+1]] for every r in rows, without a Python loop."""
+    rows = np.asarray(rows, dtype=np.int64)
+    starts, lens = indptr[rows], indptr[rows + 1] - indptr[rows]
+    total = int(lens.sum())
+    offs = np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(total)
+    return data[offs]
+
+def as_kernel(P, R=None) -> SparseKernel:
+    """Return P itself if it is a SparseKernel, otherwise convert dense (P, R)."""
+    if isinstance(P, SparseKernel):
+        return P
+    return SparseKernel.from_dense(P, R)
@@ -0,0 +1,56 @@
+# ch4_dynamic_programming/sweeps.py
+import numpy as np
+from ch2_rl_formulation.sweeps import SCHEDULES, VECTORIZED_SCHEDULES, run_sweeps
+from ch2_rl_formulation.sweeps import resolve_schedule as _resolve_schedule
+from .sparse import as_kernel, gather_segments
+
+# "gauss-seidel": in place, states in index order (the classic loop backend)
+# "jacobi":       every state reads the previous sweep's V
+# "sor":          in place with over-relaxation V(s) += ω (backup - V(s))
+# "reverse-bfs":  in place, states ordered by BFS distance from the terminals,
+#                 so value flows outward from the goal within a single sweep
+#                 (for max backups this needs a start below V*, e.g. goals at 0
+#                 and a large negative value elsewhere); the vectorized backend
+#                 runs it layer by layer, one contraction per BFS layer
+# SCHEDULES and run_sweeps are ch2's (ch2_rl_formulation/sweeps.py); only
+# the state ordering and the layered vectorized sweep depend on SparseKernel.
+
+def resolve_schedule(backend: str, schedule) -> str:
+    """Default schedule per backend; reject combinations a backend cannot run."""
+    return _resolve_schedule(backend, schedule, vectorized=VECTORIZED_SCHEDULES + ("reverse-bfs",))
+
+def reverse_bfs_layers(env) -> list:
+    """
+    States grouped by BFS distance to the nearest absorbing state, nearest
+    first; states that cannot reach one form the last group.
+    """
+    K = as_kernel(env.P, env.R)
+    pred_indptr, pred = K.predecessors()
+    dist = np.full(K.num_states, -1, dtype=np.int64)
+    frontier = np.flatnonzero(K.absorbing_states())
+    dist[frontier] = 0
+    layers = []
+    while frontier.size:
+        layers.append(frontier)
+        nb = gather_segments(pred_indptr, pred, frontier)
+        frontier = np.unique(nb[dist[nb] < 0])
+        dist[frontier] = len(layers)
+    unreachable = np.flatnonzero(dist < 0)
+    return layers + [unreachable] if unreachable.size else layers
+
+def reverse_bfs_order(env) -> np.ndarray:
+    """States sorted by BFS distance to the nearest absorbing state (unreachable ones last)."""
+    return np.concatenate(reverse_bfs_layers(env))
+
+def layered_backup(layers, backup_layer):
+    """
+    backup_all for the vectorized "reverse-bfs" schedule: each layer is
+    backed up in one contraction, backup_layer(i, V) -> values of layers[i],
+    and written in place before the next layer reads V.
+    """
+    def backup_all(V):
+        V = V.copy()
+        for i, states in enumerate(layers):
+            V[states] = backup_layer(i, V)
+        return V
+    return backup_all
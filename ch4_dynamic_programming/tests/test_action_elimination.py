@@ -0,0 +1,49 @@
+# ch4_dynamic_programming/tests/test_action_elimination.py
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.value_iteration import value_iteration
+from ch4_dynamic_programming.action_elimination import ActiveActions
+from ch4_dynamic_programming.utils import q_from_v
+
+def _random_mdp(S=40, A=25, gamma=0.9, seed=0):
+    rng = np.random.default_rng(seed)
+    P = rng.random((S, A, S)) ** 8
+    P /= P.sum(axis=2, keepdims=True)
+    R = rng.normal(size=(S, A, S))
+    return SimpleNamespace(P=P, R=R, gamma=gamma, S=list(range(S)), A=list(range(A)))
+
+@pytest.mark.parametrize("make_env", [
+    lambda: _random_mdp(),
+    lambda: GridWorld((15, 15), walls=[(7, j) for j in range(2, 12)], slip=0.2, gamma=0.95),
+])
+def test_same_solution_with_fewer_backups(make_env):
+    env = make_env()
+    V_ref, pi_ref, ref = value_iteration(env, backend="vectorized", theta=1e-9, return_info=True)
+    V, pi, trace = value_iteration(env, backend="vectorized", theta=1e-9, return_info=True,
+                                   eliminate_actions=True)
+    assert np.allclose(V, V_ref, atol=1e-8)
+    assert np.array_equal(pi.argmax(axis=1), pi_ref.argmax(axis=1))
+    assert trace["backups"] == trace["active_actions"].sum() < ref["backups"]
+    assert np.all(np.diff(trace["active_actions"]) <= 0)  # eliminations are permanent
+
+def test_eliminated_actions_are_suboptimal():
+    env = _random_mdp(S=20, A=10, seed=3)
+    V_star, _ = value_iteration(env, backend="vectorized", theta=1e-12)
+    Q_star = q_from_v(env.P, env.R, env.gamma, V_star)
+    active = ActiveActions(env.P, env.R, env.gamma)
+    V = np.zeros(20)
+    for _ in range(30):
+        Q = active.q(V)
+        v_new = Q.max(axis=1)
+        active.eliminate(Q, np.max(np.abs(v_new - V)))
+        V = v_new
+    assert active.count < 20 * 10
+    assert np.all(Q_star[~active.active] < V_star[np.nonzero(~active.active)[0]])
+
+def test_requires_vectorized_backend_and_discount():
+    with pytest.raises(ValueError):
+        value_iteration(GridWorld((3, 3), gamma=0.9), eliminate_actions=True)
+    with pytest.raises(ValueError):
+        value_iteration(GridWorld4x4(gamma=1.0), backend="vectorized", eliminate_actions=True)
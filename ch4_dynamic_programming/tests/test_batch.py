@@ -0,0 +1,37 @@
+# ch4_dynamic_programming/tests/test_batch.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.batch import policy_evaluation_batch, value_iteration_batch
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.policy_evaluation import policy_evaluation
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_policy_stack_and_gammas(sparse):
+    env = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=0.9, sparse=sparse)
+    S, A = len(env.S), len(env.A)
+    rng = np.random.default_rng(0)
+    pis = rng.dirichlet(np.ones(A), size=(6, S))
+    gammas = np.linspace(0.5, 0.95, 6)
+    V = policy_evaluation_batch(env, pis, gammas=gammas, theta=1e-10)
+    assert V.shape == (6, S)
+    for k in range(6):
+        env.gamma = gammas[k]
+        assert np.allclose(V[k], policy_evaluation(env, pis[k], theta=1e-10), atol=1e-6)
+
+def test_value_iteration_over_rewards_and_goals():
+    env = GridWorld((5, 6), terminals=[(0, 5)], gamma=0.95)
+    base = env.P.rewards
+    V, pi = value_iteration_batch(env, rewards=np.stack([base, 2.0 * base]))
+    V1, _ = value_iteration(env, backend="vectorized")
+    assert np.allclose(V[0], V1, atol=1e-6) and np.allclose(V[1], 2.0 * V1, atol=1e-6)
+    assert pi.shape == (2, env.num_states, len(env.A))
+
+    goals = [(4, 0), (2, 3)]
+    masks = np.zeros((2, env.num_states), dtype=bool)
+    for k, g in enumerate(goals):
+        masks[k, env.s2i[g]] = True
+    V, _ = value_iteration_batch(env, terminals=masks)
+    for k, g in enumerate(goals):
+        ref = GridWorld((5, 6), terminals=[(0, 5), g], gamma=0.95)
+        assert np.allclose(V[k], value_iteration(ref, backend="vectorized")[0], atol=1e-6)
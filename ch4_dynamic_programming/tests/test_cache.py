@@ -0,0 +1,83 @@
+# ch4_dynamic_programming/tests/test_cache.py
+import functools
+import numpy as np
+import pytest
+from ch4_dynamic_programming.cache import SolveCache, fingerprint
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+def test_exact_hit_and_warm_start():
+    cache = SolveCache(maxsize=4)
+    env = GridWorld((12, 12), step_reward=-1.0, slip=0.2, gamma=0.95)
+    V1, pi1 = cache.solve(env, backend="vectorized")
+    V2, pi2 = cache.solve(env, backend="vectorized")
+    assert cache.hits == 1 and cache.misses == 1
+    assert np.array_equal(V1, V2) and np.array_equal(pi1, pi2)
+
+    near = GridWorld((12, 12), step_reward=-1.05, slip=0.2, gamma=0.95)
+    V3, _ = cache.solve(near, backend="vectorized")
+    assert cache.warm_starts == 1
+    V_ref, _, cold = value_iteration(near, backend="vectorized", return_info=True)
+    _, _, warm = value_iteration(near, backend="vectorized", return_info=True, V0=V1)
+    assert np.allclose(V3, V_ref, atol=1e-6)
+    assert warm["sweeps"] < cold["sweeps"]
+
+def test_lru_eviction_and_key():
+    cache = SolveCache(maxsize=2)
+    envs = [GridWorld4x4(step_reward=r) for r in (-1.0, -2.0, -3.0)]
+    assert fingerprint(envs[0], 1e-8) != fingerprint(envs[0], 1e-6)
+    assert fingerprint(envs[0], 1e-8) == fingerprint(GridWorld4x4(step_reward=-1.0), 1e-8)
+    for env in envs:
+        cache.solve(env, solver="policy_iteration")
+    assert len(cache) == 2
+    cache.solve(envs[0], solver="policy_iteration")  # evicted, so not a hit
+    assert cache.hits == 0
+
+def test_key_covers_solve_options():
+    env = GridWorld4x4()
+    base = fingerprint(env, 1e-8)
+    assert base == fingerprint(env, 1e-8, "value_iteration", max_iter=10000, backend="loop")
+    assert base != fingerprint(env, 1e-8, "policy_iteration")
+    assert base != fingerprint(env, 1e-8, max_iter=3)
+    assert base != fingerprint(env, 1e-8, backend="vectorized", eliminate_actions=True)
+    cache = SolveCache()
+    cache.solve(env, max_iter=1)
+    V, _ = cache.solve(env)  # a truncated solve must not be served for a full one
+    assert cache.hits == 0 and np.allclose(V, value_iteration(env)[0])
+    with pytest.raises(ValueError):
+        cache.solve(env, return_info=True)
+
+def test_near_miss_scores_few_candidates(monkeypatch):
+    from ch4_dynamic_programming import cache as cache_mod
+    calls, q_from_v = [], cache_mod.q_from_v
+    def counting_q(*args):
+        calls.append(1)
+        return q_from_v(*args)
+    monkeypatch.setattr(cache_mod, "q_from_v", counting_q)
+    cache = SolveCache(maxsize=16, candidates=2)
+    for r in (-1.0, -2.0, -3.0, -4.0):
+        cache.solve(GridWorld4x4(step_reward=r))
+    cache.solve(GridWorld((5, 5)))  # other shape: no candidate
+    assert cache.misses == 2
+    calls.clear()
+    cache.solve(GridWorld4x4(step_reward=-5.0))
+    assert len(calls) == 2 and cache.warm_starts == 4
+
+def test_gamma_change_warm_starts_and_caller_v0_is_kept(monkeypatch):
+    from ch4_dynamic_programming import cache as cache_mod
+    cache = SolveCache()
+    env = GridWorld((10, 10), slip=0.1, gamma=0.95)
+    V1, _ = cache.solve(env, backend="vectorized")
+    seen = []
+    @functools.wraps(value_iteration)  # keeps the signature the cache key reads
+    def recording_vi(env, **kwargs):
+        seen.append(kwargs.get("V0"))
+        return value_iteration(env, **kwargs)
+    monkeypatch.setitem(cache_mod.SOLVERS, "value_iteration", recording_vi)
+    V2, _ = cache.solve(GridWorld((10, 10), slip=0.1, gamma=0.9), backend="vectorized")
+    assert cache.warm_starts == 1 and np.array_equal(seen[-1], V1)
+    assert np.allclose(V2, value_iteration(GridWorld((10, 10), slip=0.1, gamma=0.9),
+                                           backend="vectorized")[0], atol=1e-6)
+    V0 = np.full(env.num_states, -3.0)
+    cache.solve(GridWorld((10, 10), slip=0.1, gamma=0.8), backend="vectorized", V0=V0)
+    assert seen[-1] is V0 and cache.warm_starts == 1
@@ -0,0 +1,32 @@
+# ch4_dynamic_programming/tests/test_exact_evaluation.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld4x4
+from ch4_dynamic_programming.policy_evaluation import policy_evaluation
+from ch4_dynamic_programming.policy_iteration import policy_iteration
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+@pytest.mark.parametrize("gamma", [1.0, 0.9])
+@pytest.mark.parametrize("solver", ["dense", "bicgstab"])
+@pytest.mark.parametrize("sparse", [False, True])
+def test_exact_evaluation_matches_iterative(gamma, solver, sparse):
+    env = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=gamma, sparse=sparse)
+    S, A = len(env.S), len(env.A)
+    pi = np.full((S, A), 1.0 / A, dtype=float)
+    V_it = policy_evaluation(env, pi, theta=1e-10, max_iter=100000, backend="vectorized")
+    V_ex, info = policy_evaluation(env, pi, theta=1e-10, method="exact", solver=solver,
+                                   return_info=True)
+    assert np.allclose(V_it, V_ex, atol=1e-6)
+    assert info["iterations"] >= 1 and info["wall_time"] >= 0.0
+
+@pytest.mark.parametrize("evaluation", ["exact", "modified"])
+def test_policy_iteration_modes_reach_optimum(evaluation):
+    env = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=1.0)
+    V_vi, pi_vi = value_iteration(env, backend="vectorized")
+    V, pi, info = policy_iteration(env, evaluation=evaluation, backend="vectorized",
+                                   return_info=True)
+    assert np.allclose(V, V_vi, atol=1e-6)
+    if evaluation == "exact":
+        assert info["linear_solves"] == info["improvements"] and info["sweeps"] == 0
+    else:
+        assert info["sweeps"] <= 5 * info["improvements"]
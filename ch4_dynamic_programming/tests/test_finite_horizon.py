@@ -0,0 +1,42 @@
+# ch4_dynamic_programming/tests/test_finite_horizon.py
+import numpy as np
+from ch4_dynamic_programming.finite_horizon import backward_induction
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.utils import q_from_v
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+def test_undiscounted_horizon_caps_the_distance():
+    env = GridWorld4x4(gamma=1.0)
+    V_inf, _ = value_iteration(env)
+    for H in (0, 1, 3, 10):
+        V0, policy = backward_induction(env, H)
+        assert np.array_equal(V0, np.maximum(V_inf, -H))
+        assert policy.shape == (H, 16)
+
+def test_matches_full_table_recursion():
+    env = GridWorld((5, 6), slip=0.2, gamma=0.9, terminals={(0, 5): 0.0, (4, 0): 2.0})
+    H = 7
+    V0, policy = backward_induction(env, H, terminal_values=np.linspace(0, 1, 30))
+    V = np.linspace(0, 1, 30)
+    for t in range(H - 1, -1, -1):
+        Q = q_from_v(env.P, env.R, env.gamma, V)
+        assert np.array_equal(policy[t], Q.argmax(axis=1))
+        V = Q.max(axis=1)
+    assert np.allclose(V0, V)
+
+def test_long_horizon_approaches_infinite_horizon():
+    env = GridWorld((8, 8), slip=0.1, gamma=0.9)
+    V_inf, _ = value_iteration(env, backend="vectorized", theta=1e-12)
+    V0, _ = backward_induction(env, 400, callback=lambda t, a, V: None)
+    assert np.allclose(V0, V_inf, atol=1e-9)
+
+def test_streaming_to_file_and_callback(tmp_path):
+    env = GridWorld((6, 6), slip=0.1, gamma=0.95)
+    V_mem, pol_mem = backward_induction(env, 20)
+    V_file, pol_file = backward_induction(env, 20, policy_file=tmp_path / "pi.npy")
+    assert np.array_equal(np.load(tmp_path / "pi.npy", mmap_mode="r"), pol_mem)
+    seen = []
+    V_cb, none = backward_induction(env, 20, callback=lambda t, a, V: seen.append((t, a.copy())))
+    assert none is None and [t for t, _ in seen] == list(range(19, -1, -1))
+    assert np.array_equal(np.stack([a for _, a in seen[::-1]]), pol_mem)
+    assert np.array_equal(V_mem, V_file) and np.array_equal(V_mem, V_cb)
@@ -0,0 +1,29 @@
+# ch4_dynamic_programming/tests/test_gridworld_generator.py
+import numpy as np
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+def test_generator_reproduces_4x4():
+    gen = GridWorld((4, 4), terminals=[(0, 3)], sparse=False)
+    ref = GridWorld4x4(step_reward=-1.0, goal=(0, 3))
+    assert np.array_equal(gen.P, ref.P)
+    assert np.array_equal(gen.P * gen.R, ref.P * ref.R)
+
+def test_walls_terminals_and_slip():
+    walls = [(1, j) for j in range(4)]  # row 1 blocked except the last column
+    env = GridWorld((3, 5), terminals={(0, 0): 0.0, (2, 0): 5.0}, walls=walls,
+                    slip=0.2, gamma=0.9)
+    K = env.P
+    assert K.nnz == env.num_states * len(env.A) * 3
+    rows = K.probs.reshape(-1, 3).sum(axis=1)
+    assert np.allclose(rows, 1.0)
+    # moving down from (0, 1) bumps into the wall: intended outcome stays put
+    idx, p, _ = K.row(env.s2i[(0, 1)], 2)
+    assert idx[0] == env.s2i[(0, 1)] and np.isclose(p[0], 0.8)
+    # entering the rewarding terminal pays the bonus on top of the step cost
+    idx, _, r = K.row(env.s2i[(2, 1)], 1)
+    assert idx[0] == env.s2i[(2, 0)] and np.isclose(r[0], 4.0)
+
+    V, _ = value_iteration(env, backend="vectorized")
+    assert V[env.s2i[(0, 0)]] == 0.0 and V[env.s2i[(2, 0)]] == 0.0
+    assert V[env.s2i[(2, 1)]] > V[env.s2i[(0, 4)]]
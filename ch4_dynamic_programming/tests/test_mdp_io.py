@@ -0,0 +1,44 @@
+# ch4_dynamic_programming/tests/test_mdp_io.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.mdp_io import save_mdp, load_mdp
+from ch4_dynamic_programming.value_iteration import value_iteration
+from ch2_rl_formulation.gridworld import GridWorld4x4 as Ch2GridWorld
+from ch2_rl_formulation.value_iteration import value_iteration as ch2_value_iteration
+
+def test_roundtrip_is_memory_mapped(tmp_path):
+    env = GridWorld((12, 9), walls=[(3, 3)], slip=0.2, gamma=0.9)
+    save_mdp(tmp_path / "grid", env, source="GridWorld")
+    m = load_mdp(tmp_path / "grid")
+    assert m.meta["source"] == "GridWorld" and m.gamma == 0.9
+    assert not m.kernel.probs.flags.writeable  # read-only mapping, not a copy
+    for name in ("indptr", "indices", "probs", "rewards"):
+        assert np.array_equal(getattr(m.kernel, name), getattr(env.kernel, name))
+    V, pi = value_iteration(m, backend="vectorized")
+    V_ref, pi_ref = value_iteration(env, backend="vectorized")
+    assert np.allclose(V, V_ref) and np.array_equal(pi, pi_ref)
+    assert load_mdp(tmp_path / "grid", mmap=False).kernel.probs.flags.writeable
+
+def test_dense_view_matches_dense_model(tmp_path):
+    env = GridWorld4x4(gamma=1.0)
+    save_mdp(tmp_path / "g4", env)
+    P, R = load_mdp(tmp_path / "g4").dense_view()
+    assert P.shape == env.P.shape
+    assert np.array_equal(P[5, 2], env.P[5, 2]) and P[5, 0, 6] == env.P[5, 0, 6]
+    assert R[5, 0, 6] == env.R[5, 0, 6]
+
+def test_ch2_adapter(tmp_path):
+    env = Ch2GridWorld()
+    save_mdp(tmp_path / "ch2", env, gamma=1.0)
+    adapter = load_mdp(tmp_path / "ch2").ch2_env()
+    assert adapter.P[2][0] == env.P[2][0] and adapter.P[3][1] == env.P[3][1]
+    for backend in ("loop", "vectorized"):
+        V, _ = ch2_value_iteration(adapter, gamma=1.0, backend=backend)
+        V_ref, _ = ch2_value_iteration(env, gamma=1.0, backend=backend)
+        assert np.allclose(V, V_ref)
+
+def test_rejects_foreign_directories(tmp_path):
+    (tmp_path / "meta.json").write_text('{"format": "other"}')
+    with pytest.raises(ValueError):
+        load_mdp(tmp_path)
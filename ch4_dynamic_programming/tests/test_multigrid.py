@@ -0,0 +1,59 @@
+# ch4_dynamic_programming/tests/test_multigrid.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld
+from ch4_dynamic_programming.multigrid import coarsen, prolong, lower_bound, multigrid_value_iteration
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+def test_coarsen_scales_costs_and_keeps_passages():
+    walls = np.zeros((9, 8), dtype=bool)
+    walls[4:6, :] = True
+    walls[4, 7] = False  # one-cell gap
+    env = GridWorld((9, 8), terminals={(8, 0): 5.0}, walls=walls, step_reward=-1.0,
+                    slip=0.1, gamma=0.9)
+    c = coarsen(env, 2)
+    assert (c.n_rows, c.n_cols) == (5, 4)
+    assert c.step_reward == -2.0 and np.isclose(c.gamma, 0.81) and c.slip == 0.1
+    assert c.terminals == {(4, 0): 5.0}
+    assert c.walls[2, :3].all() and not c.walls[2, 3]
+
+def test_prolong_is_blockwise_constant():
+    env = GridWorld((4, 6))
+    c = coarsen(env, 2)
+    Vc = np.arange(c.num_states, dtype=float)
+    V = prolong(Vc, c, env, 2).reshape(4, 6)
+    assert V[3, 0] == V[2, 1] == Vc[c.s2i[(1, 0)]]
+    assert V[env.goal] == 0.0
+
+@pytest.mark.parametrize("gamma,slip", [(1.0, 0.0), (0.99, 0.1)])
+def test_matches_value_iteration(gamma, slip):
+    env = GridWorld((40, 36), walls=[(20, j) for j in range(30)], gamma=gamma, slip=slip)
+    V_ref, pi_ref = value_iteration(env, backend="vectorized", theta=1e-10)
+    V, pi, info = multigrid_value_iteration(env, theta=1e-10, backend="vectorized",
+                                            return_info=True)
+    assert np.allclose(V, V_ref, atol=1e-7)
+    assert [l["shape"] for l in info["levels"]] == [(10, 9), (20, 18), (40, 36)]
+    assert info["sweeps"] == info["levels"][-1]["sweeps"]
+
+def test_warm_start_cuts_gauss_seidel_sweeps():
+    env = GridWorld((16, 16), gamma=1.0)
+    _, _, plain = value_iteration(env, return_info=True)
+    V, _, info = multigrid_value_iteration(env, return_info=True)
+    assert np.allclose(V, value_iteration(env)[0])
+    assert info["sweeps"] < plain["sweeps"]
+
+def test_lower_bound_is_below_optimal_values():
+    env = GridWorld((20, 20), walls=[(10, j) for j in range(15)], gamma=1.0, slip=0.1)
+    V_ref, _ = value_iteration(env, backend="vectorized", theta=1e-10)
+    c = coarsen(env, 2)
+    V0 = prolong(value_iteration(c, backend="vectorized")[0], c, env, 2)
+    assert np.any(V0 > V_ref)
+    assert np.all(lower_bound(env, V0) <= V_ref + 1e-9)
+
+@pytest.mark.parametrize("gamma,slip", [(1.0, 0.0), (0.99, 0.1)])
+def test_cuts_vectorized_sweeps_on_large_grid(gamma, slip):
+    env = GridWorld((128, 128), gamma=gamma, slip=slip)
+    V_ref, _, plain = value_iteration(env, backend="vectorized", return_info=True)
+    V, _, info = multigrid_value_iteration(env, backend="vectorized", return_info=True)
+    assert np.allclose(V, V_ref, atol=1e-6)
+    assert 4 * info["sweeps"] < plain["sweeps"] and info["work"] < plain["sweeps"]
@@ -0,0 +1,38 @@
+# ch4_dynamic_programming/tests/test_parallel.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.parallel import parallel_value_iteration, partition, scaling_benchmark
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+def test_partition_covers_all_states():
+    b = partition(10, 3)
+    assert b[0] == 0 and b[-1] == 10 and np.all(np.diff(b) > 0)
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_matches_serial_value_iteration(workers):
+    env = GridWorld((12, 9), walls=[(4, 4), (5, 4)], gamma=0.9, slip=0.1)
+    V_ser, pi_ser = value_iteration(env, theta=1e-10)
+    V, pi, info = parallel_value_iteration(env, workers=workers, theta=1e-10, return_info=True)
+    assert np.allclose(V, V_ser, atol=1e-8)
+    assert np.array_equal(pi.argmax(axis=1), pi_ser.argmax(axis=1))
+    assert info["workers"] == workers and info["residuals"][-1] < 1e-10
+
+def test_dense_env_and_more_workers_than_states():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=1.0)
+    V_ser, _ = value_iteration(env)
+    V, _, info = parallel_value_iteration(env, workers=32, return_info=True)
+    assert info["workers"] == 16
+    assert np.allclose(V, V_ser, atol=1e-8)
+
+def test_rejects_bad_arguments():
+    env = GridWorld((4, 4))
+    with pytest.raises(ValueError):
+        parallel_value_iteration(env, max_iter=0)
+    with pytest.raises(ValueError):
+        parallel_value_iteration(env, workers=0)
+
+def test_scaling_benchmark_rows():
+    rows = scaling_benchmark(GridWorld((6, 6)), workers=(1, 2))
+    assert [r["workers"] for r in rows] == [1, 2]
+    assert rows[0]["speedup"] == 1.0 and rows[0]["sweeps"] == rows[1]["sweeps"]
@@ -0,0 +1,23 @@
+# ch4_dynamic_programming/tests/test_prioritized_sweeping.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.prioritized_sweeping import prioritized_value_iteration
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+def test_matches_value_iteration_on_dense_4x4():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=1.0)
+    V_vi, _ = value_iteration(env)
+    V_ps, _, info = prioritized_value_iteration(env)
+    assert np.allclose(V_vi, V_ps, atol=1e-8)
+    assert info["backups"] > 0
+
+@pytest.mark.parametrize("gamma,slip", [(1.0, 0.0), (0.95, 0.1)])
+def test_fewer_backups_than_full_sweeps(gamma, slip):
+    env = GridWorld((25, 25), gamma=gamma, slip=slip)
+    V_vi, _, vi_info = value_iteration(env, backend="vectorized", return_info=True)
+    V_ps, _, info = prioritized_value_iteration(env)
+    assert np.allclose(V_vi, V_ps, atol=1e-6)
+    assert info["sweep_equivalents"] < vi_info["sweeps"]
+    if slip == 0.0:
+        assert info["backups"] <= env.num_states  # Dijkstra-like: once per state
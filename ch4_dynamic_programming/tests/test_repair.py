@@ -0,0 +1,51 @@
+# ch4_dynamic_programming/tests/test_repair.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld
+from ch4_dynamic_programming.repair import repair
+from ch4_dynamic_programming.utils import q_from_v
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+def _solve(env):
+    return value_iteration(env, backend="vectorized", theta=1e-11, max_iter=100_000)
+
+def test_edits_match_a_fresh_build():
+    env = GridWorld((6, 5), slip=0.2, sparse=False)
+    env.set_wall((2, 2))
+    env.set_terminal((5, 0), 4.0)
+    fresh = GridWorld((6, 5), terminals={(0, 4): 0.0, (5, 0): 4.0}, walls=[(2, 2)],
+                      slip=0.2, sparse=False)
+    assert np.array_equal(env.kernel.indices, fresh.kernel.indices)
+    assert np.array_equal(env.kernel.rewards, fresh.kernel.rewards)
+    assert np.array_equal(env.P, fresh.P) and np.array_equal(env.R, fresh.R)
+    env.set_wall((2, 2), wall=False)
+    env.set_terminal((5, 0), None)
+    assert np.array_equal(env.kernel.indices, GridWorld((6, 5), slip=0.2).kernel.indices)
+    with pytest.raises(ValueError):
+        env.set_wall((0, 4))
+
+@pytest.mark.parametrize("make_env,edit", [
+    (lambda: GridWorld((20, 20)), lambda e: e.set_wall((0, 17))),
+    (lambda: GridWorld((20, 20), walls=[(8, j) for j in range(19)]), lambda e: e.set_wall((8, 18), False)),
+    (lambda: GridWorld((20, 20), terminals={(0, 19): 0.0, (19, 0): 3.0}),
+     lambda e: e.set_terminal((19, 0), None)),
+    (lambda: GridWorld((15, 15), gamma=0.95, slip=0.1), lambda e: e.set_wall((3, 12))),
+    (lambda: GridWorld((15, 15), gamma=0.95, slip=0.1), lambda e: e.set_terminal((14, 0), 5.0)),
+])
+def test_repair_matches_resolve(make_env, edit):
+    env = make_env()
+    V, pi = _solve(env)
+    info = repair(env, V, pi, edit(env), theta=1e-11)
+    V_ref, _ = _solve(env)
+    assert np.allclose(V, V_ref, atol=1e-8)
+    Q = q_from_v(env.P, env.R, env.gamma, V_ref)
+    assert np.allclose(Q[np.arange(env.num_states), pi.argmax(axis=1)], Q.max(axis=1), atol=1e-8)
+    assert 0 < info["touched"] <= env.num_states
+
+def test_touched_does_not_grow_with_grid_size():
+    counts = []
+    for n in (20, 80):
+        env = GridWorld((n, n))
+        V, pi = _solve(env)
+        counts.append(repair(env, V, pi, env.set_wall((n - 3, 2)))["touched"])
+    assert counts[0] == counts[1] < 20
@@ -0,0 +1,54 @@
+# ch4_dynamic_programming/tests/test_schedules.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld
+from ch4_dynamic_programming.policy_evaluation import policy_evaluation
+from ch4_dynamic_programming.policy_iteration import policy_iteration
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+@pytest.mark.parametrize("backend,schedule,omega", [
+    ("loop", "gauss-seidel", 1.0), ("loop", "jacobi", 1.0), ("loop", "sor", 0.9),
+    ("loop", "reverse-bfs", 1.0), ("vectorized", "jacobi", 1.0), ("vectorized", "sor", 0.9),
+    ("vectorized", "reverse-bfs", 1.0),
+])
+def test_every_schedule_reaches_same_fixed_point(backend, schedule, omega):
+    env = GridWorld((6, 6), slip=0.1, gamma=0.9)
+    V_ref, _ = value_iteration(env, backend="vectorized", theta=1e-10)
+    V, _, trace = value_iteration(env, backend=backend, schedule=schedule, omega=omega,
+                                  theta=1e-10, return_info=True)
+    assert np.allclose(V, V_ref, atol=1e-7)
+    assert trace["sweeps"] == len(trace["residuals"]) == len(trace["sweep_times"])
+    assert trace["residuals"][-1] < 1e-10
+    assert trace["backups"] == trace["sweeps"] * env.num_states * len(env.A)
+
+def test_reverse_bfs_propagates_in_one_sweep():
+    env = GridWorld((10, 10), gamma=1.0)
+    # pessimistic start: with V0 = 0 the max backup would prefer unvisited states
+    V0 = np.where([env.is_terminal(s) for s in range(env.num_states)], 0.0, -1e3)
+    _, _, gs = value_iteration(env, return_info=True, V0=V0)
+    _, _, rb = value_iteration(env, schedule="reverse-bfs", return_info=True, V0=V0)
+    assert rb["sweeps"] == 2 < gs["sweeps"]  # one sweep to propagate, one to confirm
+
+def test_evaluation_traces_and_bad_combinations():
+    env = GridWorld((5, 5), gamma=0.9)
+    S, A = env.num_states, len(env.A)
+    pi = np.full((S, A), 1.0 / A)
+    V_gs = policy_evaluation(env, pi, theta=1e-10)
+    V_sor, info = policy_evaluation(env, pi, theta=1e-10, schedule="sor", omega=1.3,
+                                    return_info=True)
+    assert np.allclose(V_gs, V_sor, atol=1e-7) and info["backups"] == info["sweeps"] * S * A
+    V_rb = policy_evaluation(env, pi, theta=1e-10, backend="vectorized", schedule="reverse-bfs")
+    assert np.allclose(V_gs, V_rb, atol=1e-7)
+    _, _, info = policy_iteration(env, schedule="jacobi", return_info=True)
+    assert info["sweeps"] == len(info["residuals"]) and info["backups"] > 0
+    with pytest.raises(ValueError):
+        value_iteration(env, backend="vectorized", schedule="gauss-seidel")
+
+def test_sweep_driver_is_shared_with_ch2():
+    from ch2_rl_formulation import evaluation as ch2_evaluation, sweeps as ch2_sweeps
+    from ch4_dynamic_programming import sweeps, utils
+    assert sweeps.run_sweeps is ch2_sweeps.run_sweeps and sweeps.SCHEDULES is ch2_sweeps.SCHEDULES
+    assert utils.check_backend is ch2_evaluation.check_backend
+    assert sweeps.resolve_schedule("vectorized", "reverse-bfs") == "reverse-bfs"
+    with pytest.raises(ValueError):
+        ch2_sweeps.resolve_schedule("vectorized", "reverse-bfs")
@@ -0,0 +1,45 @@
+# ch4_dynamic_programming/tests/test_shortest_path.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld, GridWorld4x4
+from ch4_dynamic_programming.shortest_path import shortest_path_values, is_deterministic
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+WALL = [(6, j) for j in range(9)]
+
+@pytest.mark.parametrize("env,method", [
+    (GridWorld4x4(gamma=1.0), "bfs"),
+    (GridWorld4x4(gamma=0.9, sparse=True), "bfs"),
+    (GridWorld((12, 10), walls=WALL, gamma=1.0), "bfs"),
+    (GridWorld((12, 10), walls=WALL, gamma=0.95), "bfs"),
+    (GridWorld((12, 10), terminals={(0, 9): 0.0, (11, 0): 8.0}, walls=WALL, gamma=1.0), "dijkstra"),
+])
+def test_matches_value_iteration(env, method):
+    V, pi, info = shortest_path_values(env, return_info=True)
+    V_vi, pi_vi = value_iteration(env, backend="vectorized", theta=1e-12, max_iter=100_000)
+    assert info["method"] == method
+    assert np.allclose(V, V_vi, atol=1e-9)
+    assert np.array_equal(pi.argmax(axis=1), pi_vi.argmax(axis=1))
+
+def test_unreachable_states():
+    walls = [(4, j) for j in range(8)]  # seals off the bottom half
+    V, _ = shortest_path_values(GridWorld((8, 8), walls=walls, gamma=0.9))
+    assert np.allclose(V.reshape(8, 8)[5:], -1.0 / (1.0 - 0.9))
+    with pytest.raises(ValueError):
+        shortest_path_values(GridWorld((8, 8), walls=walls, gamma=1.0))
+
+def test_walled_in_pocket_is_unreachable():
+    # (0,0) is walled in: every move bumps back into it and pays -1
+    env = GridWorld((3, 3), walls=[(0, 1), (1, 0)], terminals=[(2, 2)], gamma=0.9)
+    V, pi = shortest_path_values(env)
+    V_vi, _ = value_iteration(env, backend="vectorized", theta=1e-12, max_iter=100_000)
+    assert np.isclose(V[env.s2i[(0, 0)]], -10.0)
+    assert np.allclose(V, V_vi, atol=1e-9)
+    with pytest.raises(ValueError):
+        shortest_path_values(GridWorld((3, 3), walls=[(0, 1), (1, 0)], terminals=[(2, 2)]))
+
+def test_rejects_stochastic_kernels():
+    env = GridWorld((5, 5), slip=0.1)
+    assert not is_deterministic(env.kernel)
+    with pytest.raises(ValueError):
+        shortest_path_values(env)
@@ -0,0 +1,42 @@
+# ch4_dynamic_programming/tests/test_sparse_kernel.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld4x4
+from ch4_dynamic_programming.sparse import SparseKernel
+from ch4_dynamic_programming.policy_evaluation import policy_evaluation
+from ch4_dynamic_programming.policy_iteration import policy_iteration
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+def test_dense_sparse_roundtrip():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0, 3))
+    K = SparseKernel.from_dense(env.P, env.R)
+    assert K.nnz == len(env.S) * len(env.A)  # one successor per (s,a)
+    P, R = K.to_dense()
+    assert np.array_equal(P, env.P)
+    assert np.array_equal(P * R, env.P * env.R)
+    # the natively built kernel is the same model
+    Ks = GridWorld4x4(step_reward=-1.0, goal=(0, 3), sparse=True).P
+    assert np.array_equal(Ks.to_dense()[0], env.P)
+
+@pytest.mark.parametrize("backend", ["loop", "vectorized"])
+def test_solvers_accept_sparse_kernel(backend):
+    dense = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=0.9)
+    sparse = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=0.9, sparse=True)
+    V_d, pi_d = value_iteration(dense)
+    V_s, pi_s = value_iteration(sparse, backend=backend)
+    assert np.allclose(V_d, V_s, atol=1e-8)
+    assert np.array_equal(pi_d, pi_s)
+
+    V_p, _ = policy_iteration(sparse, backend=backend)
+    assert np.allclose(V_d, V_p, atol=1e-6)
+
+    S, A = len(dense.S), len(dense.A)
+    pi = np.full((S, A), 1.0 / A)
+    assert np.allclose(policy_evaluation(dense, pi),
+                       policy_evaluation(sparse, pi, backend=backend), atol=1e-6)
+
+def test_sparse_step_matches_dense():
+    dense, sparse = GridWorld4x4(), GridWorld4x4(sparse=True)
+    for s in dense.S:
+        for a in dense.A:
+            assert dense.step(s, a) == sparse.step(s, a)
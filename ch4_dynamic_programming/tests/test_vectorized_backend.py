@@ -0,0 +1,34 @@
+# ch4_dynamic_programming/tests/test_vectorized_backend.py
+import numpy as np
+import pytest
+from ch4_dynamic_programming.gridworld import GridWorld4x4
+from ch4_dynamic_programming.policy_evaluation import policy_evaluation
+from ch4_dynamic_programming.policy_iteration import policy_iteration
+from ch4_dynamic_programming.value_iteration import value_iteration
+
+@pytest.mark.parametrize("gamma", [1.0, 0.9])
+def test_vectorized_value_iteration_matches_loop(gamma):
+    env = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=gamma)
+    V_loop, pi_loop = value_iteration(env)
+    V_vec, pi_vec, info = value_iteration(env, backend="vectorized", return_info=True)
+    assert np.allclose(V_loop, V_vec, atol=1e-8)
+    assert np.array_equal(pi_loop, pi_vec)
+    assert info["sweeps"] == len(info["sweep_times"]) > 0
+
+def test_vectorized_policy_evaluation_and_iteration_match_loop():
+    env = GridWorld4x4(step_reward=-1.0, goal=(0, 3), gamma=1.0)
+    S, A = len(env.S), len(env.A)
+    pi = np.full((S, A), 1.0 / A, dtype=float)
+    V_loop = policy_evaluation(env, pi, theta=1e-10, max_iter=100000)
+    V_vec = policy_evaluation(env, pi, theta=1e-10, max_iter=100000, backend="vectorized")
+    assert np.allclose(V_loop, V_vec, atol=1e-6)
+
+    V_pi, _ = policy_iteration(env)
+    V_pv, _, info = policy_iteration(env, backend="vectorized", return_info=True)
+    assert np.allclose(V_pi, V_pv, atol=1e-6)
+    assert info["improvements"] >= 1
+
+def test_unknown_backend_raises():
+    env = GridWorld4x4()
+    with pytest.raises(ValueError):
+        value_iteration(env, backend="cuda")
@@ -1,5 +1,10 @@
 ﻿# ch4_dynamic_programming/utils.py
 import numpy as np
+# "loop": in-place Gauss-Seidel sweeps, one (s,a) pair at a time.
+# "vectorized": synchronous (Jacobi) sweeps, one NumPy contraction per sweep.
+# BACKENDS and check_backend are shared with ch2 (ch2_rl_formulation/evaluation.py).
+from ch2_rl_formulation.evaluation import BACKENDS, check_backend
+from .sparse import SparseKernel, CSRMatrix
 
 def greedy_from_q(Q: np.ndarray) -> np.ndarray:
     """Return deterministic greedy policy π(s) as one-hot over actions."""
@@ -10,5 +15,32 @@ def greedy_from_q(Q: np.ndarray) -> np.ndarray:
 
 def q_from_v(P: np.ndarray, R: np.ndarray, gamma: float, V: np.ndarray) -> np.ndarray:
     """Compute Q(s,a) = Σ_s' P(s,a,s') [ R(s,a,s') + γ V(s') ]."""
+    if isinstance(P, SparseKernel):
+        return P.expected_reward() + gamma * (P @ V)
     # (S,A,S) * (S,) via broadcasting
     return (P * (R + gamma * V[None, None, :])).sum(axis=2)
+
+def expected_reward(P: np.ndarray, R: np.ndarray) -> np.ndarray:
+    """Compute r(s,a) = Σ_s' P(s,a,s') R(s,a,s') once, for reuse across sweeps."""
+    if isinstance(P, SparseKernel):
+        return P.expected_reward()
+    return (P * R).sum(axis=2)
+
+def policy_matrix(P, pi: np.ndarray):
+    """P_π(s,s') = Σ_a π(a|s) P(s,a,s'); dense (S,S) or CSRMatrix for a sparse kernel."""
+    if isinstance(P, SparseKernel):
+        return P.policy_matrix(pi)
+    return np.einsum("sa,sat->st", pi, P)
+
+def take_rows(M, rows):
+    """Rows of a dense array, a SparseKernel (per state) or a CSRMatrix; column indices are kept."""
+    if isinstance(M, (SparseKernel, CSRMatrix)):
+        return M.take_rows(rows)
+    return M[rows]
+
+def backup_sa(P, R, s: int, a: int, gamma: float, V: np.ndarray) -> float:
+    """One-pair backup Σ_s' P(s,a,s') [ R(s,a,s') + γ V(s') ] for the loop backend."""
+    if isinstance(P, SparseKernel):
+        idx, p, r = P.row(s, a)
+        return float((p * (r + gamma * V[idx])).sum())
+    return (P[s, a] * (R[s, a] + gamma * V)).sum()
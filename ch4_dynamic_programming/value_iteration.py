@@ -1,31 +1,83 @@
 ﻿# ch4_dynamic_programming/value_iteration.py
 import numpy as np
-from .utils import greedy_from_q
+from .utils import greedy_from_q, check_backend, expected_reward, backup_sa, take_rows
+from .sweeps import resolve_schedule, reverse_bfs_order, reverse_bfs_layers, layered_backup, run_sweeps
+from .action_elimination import ActiveActions
 
-def value_iteration(env, theta: float = 1e-8, max_iter: int = 10000):
+def value_iteration(env, theta: float = 1e-8, max_iter: int = 10000,
+                    backend: str = "loop", return_info: bool = False, V0=None,
+                    schedule=None, omega: float = 1.0, eliminate_actions: bool = False):
     """
     Value iteration with max backup. Returns optimal V and greedy π.
+
+    Args:
+        backend: "loop" (state-by-state sweeps) or "vectorized"
+                 (synchronous sweeps, Q = r + γ P·V as one contraction)
+        return_info: if True, also return the convergence trace
+                     {"sweeps", "residuals", "sweep_times", "backups"}
+        V0: optional (S,) starting values (warm start); zeros by default
+        schedule: one of sweeps.SCHEDULES; defaults to "gauss-seidel" for the
+                  loop backend and "jacobi" for the vectorized one
+        omega: relaxation factor for schedule="sor"
+        eliminate_actions: drop provably suboptimal actions as the residual
+                 shrinks and back up only the survivors (vectorized backend,
+                 gamma < 1; see action_elimination.ActiveActions). The trace
+                 then also has "active_actions" per sweep and "backups"
+                 counts only the (s,a) pairs actually backed up
     """
+    check_backend(backend)
+    schedule = resolve_schedule(backend, schedule)
     S, A = len(env.S), len(env.A)
     gamma = env.gamma
-    V = np.zeros(S, dtype=float)
+    V = np.zeros(S, dtype=float) if V0 is None else np.array(V0, dtype=float)
+
+    if eliminate_actions:
+        if backend != "vectorized":
+            raise ValueError("eliminate_actions requires backend='vectorized'.")
+        if schedule == "reverse-bfs":
+            raise ValueError("eliminate_actions does not support schedule='reverse-bfs'.")
+        active = ActiveActions(env.P, env.R, gamma)
+        counts = []
+
+        def backup_all(V):
+            counts.append(active.count)
+            Q = active.q(V)
+            v_new = Q.max(axis=1)
+            active.eliminate(Q, np.max(np.abs(v_new - V)))
+            return v_new
 
-    for _ in range(max_iter):
-        delta = 0.0
+        V, trace = run_sweeps(V, schedule, theta, max_iter, S * A, omega=omega,
+                              backup_all=backup_all)
+        trace["active_actions"] = np.array(counts)
+        trace["backups"] = int(trace["active_actions"].sum())
+        pi = greedy_from_q(active.q(V))
+    elif backend == "vectorized":
+        r_sa = expected_reward(env.P, env.R)
+        if schedule == "reverse-bfs":
+            layers = reverse_bfs_layers(env)
+            blocks = [(r_sa[l], take_rows(env.P, l)) for l in layers]
+            backup_all = layered_backup(
+                layers, lambda i, V: (blocks[i][0] + gamma * (blocks[i][1] @ V)).max(axis=1))
+        else:
+            backup_all = lambda V: (r_sa + gamma * (env.P @ V)).max(axis=1)
+        V, trace = run_sweeps(V, schedule, theta, max_iter, S * A, omega=omega,
+                              backup_all=backup_all)
+        pi = greedy_from_q(r_sa + gamma * (env.P @ V))
+    else:
+        def backup_state(s, V):
+            return max(backup_sa(env.P, env.R, s, a, gamma, V) for a in range(A))
+
+        order = reverse_bfs_order(env) if schedule == "reverse-bfs" else range(S)
+        V, trace = run_sweeps(V, schedule, theta, max_iter, S * A, omega=omega,
+                              backup_state=backup_state, order=order)
+
+        # derive greedy policy
+        Q = np.zeros((S, A), dtype=float)
         for s in range(S):
-            q = np.zeros(A, dtype=float)
             for a in range(A):
-                q[a] = (env.P[s, a] * (env.R[s, a] + gamma * V)).sum()
-            v_new = np.max(q)
-            delta = max(delta, abs(v_new - V[s]))
-            V[s] = v_new
-        if delta < theta:
-            break
-
-    # derive greedy policy
-    Q = np.zeros((S, A), dtype=float)
-    for s in range(S):
-        for a in range(A):
-            Q[s, a] = (env.P[s, a] * (env.R[s, a] + gamma * V)).sum()
-    pi = greedy_from_q(Q)
+                Q[s, a] = backup_sa(env.P, env.R, s, a, gamma, V)
+        pi = greedy_from_q(Q)
+
+    if return_info:
+        return V, pi, trace
     return V, pi